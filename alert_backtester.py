@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Replays historical fills through one or more alert profiles.
+
+Fills are streamed in time order into per-account `TradeStatsAccumulator`s
+(one per trading session), and after every closed trade each profile's
+`ConditionEvaluator` runs against the same incremental alert context, so
+comparing several profiles costs a single pass over the data.
+
+For every firing the report shows when it happened and the realized P/L that
+followed, both for the rest of the session and for the next N trades.
+
+    python alert_backtester.py --profile default --profile demo-aggressive
+    python alert_backtester.py -p default --files ~/logs/output-2025-06-*.log
+"""
+
+import argparse
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from alert_config_manager import AlertConfigManager, ConditionEvaluator
+from concern_level import ConcernLevel
+from trade_stats_accumulator import TradeStatsAccumulator
+
+
+@dataclass(frozen=True, slots=True)
+class AlertFiring:
+    profile: str
+    account: str
+    session: datetime.date
+    condition_id: str
+    level: ConcernLevel
+    fired_at: datetime.datetime
+    trade_number: int  # completed trades in the session when the condition fired
+    pnl_at_fire: float
+    pnl_after: float  # realized P/L from the firing to the end of the session
+    pnl_next_trades: float  # realized P/L over the next `next_trades` trades
+
+
+@dataclass
+class _Session:
+    account: str
+    day: datetime.date
+    stats: TradeStatsAccumulator
+    cumulative_pnl: List[float] = field(default_factory=list)
+    active: Dict[str, set] = field(default_factory=lambda: defaultdict(set))
+    pending: list = field(default_factory=list)
+
+
+class AlertBacktester:
+    """
+    Args:
+        config: App `Config` (used for contract values).
+        profiles: Profile name -> loaded alert config (as returned by `AlertConfigManager.load_config`).
+        next_trades: How many following trades `pnl_next_trades` covers.
+        onset_only: Record a condition only when it starts firing, not on every trade while it stays true.
+    """
+
+    def __init__(
+        self,
+        config,
+        profiles: Dict[str, Dict],
+        next_trades: int = 5,
+        onset_only: bool = True,
+    ):
+        self.config = config
+        self.evaluators = {
+            name: ConditionEvaluator(profile) for name, profile in profiles.items()
+        }
+        self.next_trades = next_trades
+        self.onset_only = onset_only
+
+    def run(self, fills: Iterable) -> List[AlertFiring]:
+        firings: List[AlertFiring] = []
+        sessions: Dict[str, _Session] = {}
+
+        for fill in sorted(fills, key=lambda f: (f.fill_time, f.order_id)):
+            account = fill.account_name
+            day = fill.fill_time.date()
+            session = sessions.get(account)
+            if session is None or (session.day != day and session.stats.position_size == 0):
+                if session is not None:
+                    firings.extend(self._finish(session))
+                session = _Session(account, day, TradeStatsAccumulator(self.config))
+                sessions[account] = session
+
+            if session.stats.add_fill(fill) is not None:
+                self._evaluate(session)
+
+        for session in sessions.values():
+            firings.extend(self._finish(session))
+        firings.sort(key=lambda firing: (firing.fired_at, firing.profile))
+        return firings
+
+    def _evaluate(self, session: _Session) -> None:
+        stats = session.stats
+        session.cumulative_pnl.append(stats.total_profit_or_loss)
+        context = stats.alert_context()
+        for name, evaluator in self.evaluators.items():
+            fired_ids = set()
+            for match in evaluator.evaluate(context):
+                condition_id = match.get("id")
+                fired_ids.add(condition_id)
+                if self.onset_only and condition_id in session.active[name]:
+                    continue
+                session.pending.append(
+                    (name, condition_id, match.get("level", ConcernLevel.DEFAULT), stats.last_exit_time, stats.completed_trades)
+                )
+            session.active[name] = fired_ids
+
+    def _finish(self, session: _Session) -> List[AlertFiring]:
+        cumulative = session.cumulative_pnl
+        if not cumulative:
+            return []
+        final_pnl = cumulative[-1]
+        results = []
+        for name, condition_id, level, fired_at, trade_number in session.pending:
+            pnl_at_fire = cumulative[trade_number - 1]
+            next_index = min(trade_number - 1 + self.next_trades, len(cumulative) - 1)
+            results.append(
+                AlertFiring(
+                    name,
+                    session.account,
+                    session.day,
+                    condition_id,
+                    level,
+                    fired_at,
+                    trade_number,
+                    pnl_at_fire,
+                    final_pnl - pnl_at_fire,
+                    cumulative[next_index] - pnl_at_fire,
+                )
+            )
+        return results
+
+
+def summarize(firings: Iterable[AlertFiring]) -> List[Dict]:
+    """Aggregates firings per (profile, condition) for side-by-side comparison."""
+    groups = defaultdict(list)
+    for firing in firings:
+        groups[firing.profile, firing.condition_id].append(firing)
+
+    rows = []
+    for (profile, condition_id), items in sorted(groups.items()):
+        count = len(items)
+        rows.append(
+            {
+                "profile": profile,
+                "condition_id": condition_id,
+                "fires": count,
+                "sessions": len({(f.account, f.session) for f in items}),
+                "avg_trade_number": sum(f.trade_number for f in items) / count,
+                "avg_pnl_after": sum(f.pnl_after for f in items) / count,
+                "avg_pnl_next_trades": sum(f.pnl_next_trades for f in items) / count,
+                "pct_followed_by_loss": sum(f.pnl_after < 0 for f in items) / count * 100,
+            }
+        )
+    return rows
+
+
+def print_report(firings: List[AlertFiring], next_trades: int, show_firings: bool = False) -> None:
+    if show_firings:
+        print("\n--- Firings ---")
+        for f in firings:
+            print(
+                f"{f.fired_at.strftime('%Y-%m-%d %H:%M')}  {f.profile:<20} {f.account:<15} "
+                f"{f.condition_id:<28} #{f.trade_number:<3} at {int(f.pnl_at_fire):+,} "
+                f"then {int(f.pnl_after):+,} (next {next_trades}: {int(f.pnl_next_trades):+,})"
+            )
+
+    rows = summarize(firings)
+    print("\n--- Alert Profile Backtest ---")
+    if not rows:
+        print("No conditions fired.")
+        return
+    header = (
+        f"{'Profile':<20} | {'Condition':<28} | {'Fires':>5} | {'Sessions':>8} | "
+        f"{'Avg Trade#':>10} | {'Avg P/L After':>13} | {f'Avg Next {next_trades}':>11} | {'% Loss After':>12}"
+    )
+    separator = "-" * len(header)
+    print(separator)
+    print(header)
+    print(separator)
+    for row in rows:
+        print(
+            f"{row['profile']:<20} | {row['condition_id']:<28} | {row['fires']:>5} | {row['sessions']:>8} | "
+            f"{row['avg_trade_number']:>10.1f} | {int(row['avg_pnl_after']):>+13,} | "
+            f"{int(row['avg_pnl_next_trades']):>+11,} | {row['pct_followed_by_loss']:>11.0f}%"
+        )
+    print(separator)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import file_utils
+    from config import Config
+    from constants import CONST
+    from trade_stats_processor import TradeStatsProcessor
+
+    parser = argparse.ArgumentParser(description="Replay historical fills through alert profiles.")
+    parser.add_argument(
+        "--profile", "-p", action="append", dest="profiles",
+        help="Profile to replay (repeat to compare several); defaults to the active profile.",
+    )
+    parser.add_argument(
+        "--files", nargs="+",
+        help="Log files to replay; defaults to every log in the configured directory.",
+    )
+    parser.add_argument("--next-trades", type=int, default=5, help="Trades covered by the 'next N' P/L column.")
+    parser.add_argument("--every-trade", action="store_true", help="Record conditions on every trade they hold, not just onsets.")
+    parser.add_argument("--show-firings", action="store_true", help="Print each firing, not just the summary.")
+    args = parser.parse_args(argv)
+
+    config = Config()
+    manager = AlertConfigManager()
+    profile_names = args.profiles or [manager.get_active_profile_name()]
+    profiles = {name: manager.load_config(name) for name in profile_names}
+
+    file_paths = args.files or file_utils.get_all_matching_files(
+        config.directory_path, CONST.LOG_FILENAME_PATTERN
+    )
+    fills = TradeStatsProcessor(config).get_fills(file_paths)
+    print(f"Replaying {len(fills):,} fills from {len(file_paths)} file(s) through {', '.join(profile_names)}")
+
+    backtester = AlertBacktester(config, profiles, args.next_trades, not args.every_trade)
+    firings = backtester.run(fills)
+    print_report(firings, args.next_trades, args.show_firings)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
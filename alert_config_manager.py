@@ -2,34 +2,90 @@ import json
 import logging
 import os
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
-
-import jsonschema
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from alert_template import compile_template
 from concern_level import ConcernLevel
 
 LOGGER = logging.getLogger(__name__)
 SAFE_GLOBALS = {"abs": abs, "max": max, "min": min, "round": round}
+DEFAULT_RELOAD_INTERVAL_SECS = 2.0
+
+FileStamp = Optional[Tuple[int, int]]  # (mtime_ns, size), None when missing
+
+
+def _file_stamp(path: Path) -> FileStamp:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# schema path -> (stamp, schema, validator) of its latest version; shared by every manager in the process
+_SCHEMA_VALIDATORS: Dict[Path, Tuple[FileStamp, Dict[str, Any], Any]] = {}
+
+
+def load_schema_validator(schema_path: Path) -> Tuple[Dict[str, Any], Any]:
+    """
+    Loads a JSON schema and compiles its validator once per file version; an
+    edited schema replaces its path's entry, so the cache never grows past
+    one entry per schema file.
+
+    `jsonschema.validate()` re-checks the schema and builds a new validator on
+    every call; reusing one validator makes per-profile validation a plain
+    `iter_errors` walk.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist.
+    """
+    stamp = _file_stamp(schema_path)
+    cached = _SCHEMA_VALIDATORS.get(schema_path)
+    if cached is None or cached[0] != stamp:
+        import jsonschema  # ~100ms to import, so only on first validation
+
+        with open(schema_path, "r", encoding="utf-8") as schema_file:
+            schema = json.load(schema_file)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        cached = _SCHEMA_VALIDATORS[schema_path] = (stamp, schema, validator_class(schema))
+    return cached[1], cached[2]
 
 
 class SessionAlertOverrides:
+    """
+    In-memory per-condition patches for the current session (UI sliders/toggles).
+
+    `version` is bumped on every change so consumers can cache the merged and
+    compiled condition set and rebuild it only when an override changes.
+    """
+
     def __init__(self) -> None:
         self.overrides: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
 
     def set_override(self, condition_id: str, patch: Dict[str, Any]) -> None:
         existing = self.overrides.get(condition_id, {})
         existing.update(patch)
         self.overrides[condition_id] = existing
+        self.version += 1
 
     def remove_override(self, condition_id: str) -> None:
-        self.overrides.pop(condition_id, None)
+        if self.overrides.pop(condition_id, None) is not None:
+            self.version += 1
 
     def clear(self) -> None:
-        self.overrides.clear()
+        if self.overrides:
+            self.overrides.clear()
+            self.version += 1
 
     def apply(self, conditions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Conditions with their overrides merged in; only overridden conditions are copied."""
+        if not self.overrides:
+            return list(conditions)
         patched: List[Dict[str, Any]] = []
         for cond in conditions:
             override = self.overrides.get(cond.get("id", ""))
@@ -38,7 +94,7 @@ class SessionAlertOverrides:
                 merged.update(override)
                 patched.append(merged)
             else:
-                patched.append(dict(cond))
+                patched.append(cond)
         return patched
 
 
@@ -47,6 +103,7 @@ class AlertConfigManager:
         self,
         config_dir: str = "alert_configs",
         default_profile: str = "default",
+        reload_interval_secs: float = DEFAULT_RELOAD_INTERVAL_SECS,
     ):
         base_dir = Path(__file__).resolve().parent
         config_path = Path(config_dir)
@@ -64,16 +121,34 @@ class AlertConfigManager:
         self.current_profile_name: Optional[str] = None
         self.current_config: Optional[Dict[str, Any]] = None
         self.config_cache: Dict[str, Dict[str, Any]] = {}
-        self.schema = self._load_schema()
+        # bumped whenever current_config is replaced, so consumers can cache compiled state
+        self.config_version = 0
+        # (active_config_version, merged config) behind get_active_config
+        self._active_config: Tuple[Optional[Tuple[int, int]], Optional[Dict[str, Any]]] = (None, None)
+        self.reload_interval_secs = reload_interval_secs
+        self._profile_stamps: Dict[str, Tuple[Path, FileStamp]] = {}
+        self._profile_pinned = False  # explicitly requested, ignore active_config.json changes
+        self._last_change_check = time.monotonic()
+        self._schema_state: Optional[Tuple[Dict[str, Any], Any]] = None  # loaded on first use
+        self._active_profile_stamp = _file_stamp(self.active_profile_file)
         self.active_profile_override = self._read_active_profile()
 
-    def _load_schema(self) -> Dict[str, Any]:
-        try:
-            with open(self.schema_path, "r", encoding="utf-8") as schema_file:
-                return json.load(schema_file)
-        except FileNotFoundError:
-            LOGGER.warning("Alert config schema not found at %s", self.schema_path)
-            return {}
+    def _load_schema(self) -> Tuple[Dict[str, Any], Any]:
+        if self._schema_state is None:
+            try:
+                self._schema_state = load_schema_validator(self.schema_path)
+            except FileNotFoundError:
+                LOGGER.warning("Alert config schema not found at %s", self.schema_path)
+                self._schema_state = ({}, None)
+        return self._schema_state
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        return self._load_schema()[0]
+
+    @property
+    def validator(self):
+        return self._load_schema()[1]
 
     def _read_active_profile(self) -> Optional[str]:
         if not self.active_profile_file.exists():
@@ -87,14 +162,53 @@ class AlertConfigManager:
             return None
 
     def _validate(self, payload: Dict[str, Any]) -> bool:
-        if not self.schema:
+        validator = self.validator
+        if validator is None:
             return True
-        try:
-            jsonschema.validate(instance=payload, schema=self.schema)
+        from jsonschema.exceptions import best_match
+
+        error = best_match(validator.iter_errors(payload))
+        if error is None:
             return True
-        except jsonschema.ValidationError as exc:
-            LOGGER.warning("Alert config validation failed: %s", exc)
-            return False
+        LOGGER.warning("Alert config validation failed: %s", error)
+        return False
+
+    def schema_errors(self, payload: Dict[str, Any]) -> List[str]:
+        """Every schema violation in `payload`, as "path: message" lines."""
+        validator = self.validator
+        if validator is None:
+            return []
+        errors = sorted(
+            validator.iter_errors(payload),
+            key=lambda error: [str(part) for part in error.absolute_path],
+        )
+        return [
+            f"{'/'.join(str(part) for part in error.absolute_path) or '<root>'}: {error.message}"
+            for error in errors
+        ]
+
+    def _condition_errors(self, payload: Dict[str, Any]) -> List[str]:
+        conditions = payload.get("conditions") if isinstance(payload, dict) else None
+        if not isinstance(conditions, list):
+            return []
+        errors = []
+        for index, condition in enumerate(conditions):
+            if not isinstance(condition, dict):
+                continue
+            try:
+                when_expr = self._normalize_condition(condition)["when"]
+                compile(when_expr, "<alert condition>", "eval")
+            except (ValueError, SyntaxError) as exc:
+                errors.append(f"conditions/{index} ({condition.get('id')}): {exc}")
+        for index, entry in enumerate(payload.get("color_rules") or []):
+            if not isinstance(entry, dict):
+                continue
+            for rule_index, rule in enumerate(entry.get("rules") or []):
+                try:
+                    compile(rule.get("when", ""), "<color rule>", "eval")
+                except (AttributeError, SyntaxError) as exc:
+                    errors.append(f"color_rules/{index}/rules/{rule_index} ({entry.get('metric')}): {exc}")
+        return errors
 
     def _format_value(self, value: Any) -> str:
         if isinstance(value, str):
@@ -172,43 +286,113 @@ class AlertConfigManager:
 
         return None
 
+    def _read_profile(self, profile_name: str) -> Tuple[Dict[str, Any], Path]:
+        path = self._find_profile_path(profile_name)
+        if not path:
+            raise FileNotFoundError(f"Alert profile '{profile_name}' not found")
+        stamp = _file_stamp(path)
+        with open(path, "rb") as config_file:
+            raw = config_file.read()
+        config = json.loads(raw)
+        if not self._validate(config):
+            raise ValueError(f"Alert profile '{profile_name}' failed schema validation")
+        config["conditions"] = [
+            self._normalize_condition(cond) for cond in config.get("conditions", [])
+        ]
+        self._profile_stamps[profile_name] = (path, stamp)
+        return config, path
+
     def load_config(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
         env_override = os.environ.get("ALERT_CONFIG_NAME")
         resolved_name = (
             profile_name
             or env_override
-            or self._read_active_profile()
+            or self.active_profile_override
             or self.default_profile
         )
         if resolved_name in self.config_cache:
             config = self.config_cache[resolved_name]
         else:
-            path = self._find_profile_path(resolved_name)
-            if not path:
-                raise FileNotFoundError(f"Alert profile '{resolved_name}' not found")
-            with open(path, "r", encoding="utf-8") as config_file:
-                config = json.load(config_file)
-            if not self._validate(config):
-                raise ValueError(
-                    f"Alert profile '{resolved_name}' failed schema validation"
-                )
-            config["conditions"] = [
-                self._normalize_condition(cond) for cond in config.get("conditions", [])
-            ]
+            config, _ = self._read_profile(resolved_name)
             self.config_cache[resolved_name] = config
 
-        self.current_profile_name = resolved_name
-        self.current_config = dict(config)
+        self._profile_pinned = bool(profile_name or env_override)
+        self._set_current(resolved_name, config)
         return self.get_active_config()
 
+    def _set_current(self, profile_name: str, config: Dict[str, Any]) -> None:
+        self.config_version += 1
+        self.current_profile_name = profile_name
+        self.current_config = dict(config)
+
+    def check_for_changes(self, force: bool = False) -> bool:
+        """
+        Picks up edits to cached profiles and to `active_config.json`.
+
+        Files are stat'ed at most once per `reload_interval_secs`; only profiles
+        whose (mtime, size) changed are re-read and re-validated. A profile that
+        no longer loads or validates is logged and the previous version is kept.
+
+        Returns:
+            True if the current config was replaced (and `config_version` bumped).
+        """
+        now = time.monotonic()
+        if not force and now - self._last_change_check < self.reload_interval_secs:
+            return False
+        self._last_change_check = now
+        version = self.config_version
+
+        active_stamp = _file_stamp(self.active_profile_file)
+        if active_stamp != self._active_profile_stamp:
+            self._active_profile_stamp = active_stamp
+            self.active_profile_override = self._read_active_profile()
+
+        for name, (path, stamp) in list(self._profile_stamps.items()):
+            if _file_stamp(path) == stamp:
+                continue
+            try:
+                config, _ = self._read_profile(name)
+            except (OSError, ValueError) as exc:
+                LOGGER.warning("Keeping previous alert profile '%s': %s", name, exc)
+                self._profile_stamps[name] = (path, _file_stamp(path))
+                continue
+            LOGGER.info("Reloaded alert profile '%s' from %s", name, path)
+            self.config_cache[name] = config
+            if name == self.current_profile_name:
+                self._set_current(name, config)
+
+        if not self._profile_pinned and self.current_profile_name is not None:
+            wanted = self.active_profile_override or self.default_profile
+            if wanted != self.current_profile_name:
+                try:
+                    self.load_config()
+                except (OSError, ValueError) as exc:
+                    LOGGER.warning("Keeping alert profile '%s': %s", self.current_profile_name, exc)
+
+        return self.config_version != version
+
+    @property
+    def active_config_version(self) -> Tuple[int, int]:
+        """Changes whenever `get_active_config` would return something different."""
+        return self.config_version, self.session_overrides.version
+
     def get_active_config(self) -> Dict[str, Any]:
+        """
+        The current profile with session overrides merged in.
+
+        The merged dict is cached per `active_config_version`, so repeated calls
+        between changes return the same object; treat it as read-only.
+        """
         if not self.current_config:
             return self.load_config()
-        config_copy = dict(self.current_config)
-        config_copy["conditions"] = self.session_overrides.apply(
-            self.current_config.get("conditions", [])
-        )
-        return config_copy
+        version, active_config = self._active_config
+        if active_config is None or version != self.active_config_version:
+            active_config = dict(self.current_config)
+            active_config["conditions"] = self.session_overrides.apply(
+                self.current_config.get("conditions", [])
+            )
+            self._active_config = (self.active_config_version, active_config)
+        return active_config
 
     def list_profiles(self) -> List[Dict[str, str]]:
         results: List[Dict[str, str]] = []
@@ -245,17 +429,48 @@ class AlertConfigManager:
     def get_profile_path(self, profile_name: str) -> Optional[Path]:
         return self._find_profile_path(profile_name)
 
-    def validate_profile(self, profile_name: str) -> Dict[str, Any]:
-        """Load & validate profile without mutating manager state."""
+    def _check_profile(self, profile_name: str) -> Tuple[Dict[str, Any], List[str]]:
         path = self._find_profile_path(profile_name)
         if not path:
             raise FileNotFoundError(f"Alert profile '{profile_name}' not found")
         with open(path, "r", encoding="utf-8") as config_file:
             payload = json.load(config_file)
-        if not self._validate(payload):
-            raise ValueError(f"Alert profile '{profile_name}' failed schema validation")
+        return payload, self.schema_errors(payload) + self._condition_errors(payload)
+
+    def validate_profile(self, profile_name: str) -> Dict[str, Any]:
+        """Load & validate profile without mutating manager state."""
+        payload, errors = self._check_profile(profile_name)
+        if errors:
+            raise ValueError(
+                f"Alert profile '{profile_name}' failed schema validation:\n  "
+                + "\n  ".join(errors)
+            )
         return payload
 
+    def validate_profiles(self, profile_names: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        Validates many profiles, one after another, with the shared compiled validator.
+
+        Validation is CPU-bound Python, so threads would only contend for the
+        GIL and a process pool would pay to recompile the validator per worker;
+        compiling the schema once is what makes bulk validation cheap.
+
+        Args:
+            profile_names: Names or paths; defaults to every discoverable profile.
+
+        Returns:
+            Profile name -> every error found (empty list when valid), in input order.
+        """
+        if profile_names is None:
+            profile_names = [entry["name"] for entry in self.list_profiles()]
+        results: Dict[str, List[str]] = {}
+        for profile_name in profile_names:
+            try:
+                results[profile_name] = self._check_profile(profile_name)[1]
+            except (OSError, ValueError) as exc:
+                results[profile_name] = [str(exc)]
+        return results
+
     def set_active_profile(self, profile_name: str) -> None:
         if not self._find_profile_path(profile_name):
             raise FileNotFoundError(f"Alert profile '{profile_name}' not found")
@@ -271,11 +486,10 @@ class AlertConfigManager:
 
     def get_active_profile_name(self) -> str:
         env_override = os.environ.get("ALERT_CONFIG_NAME")
-        active_override = self._read_active_profile()
         return (
             self.current_profile_name
             or env_override
-            or active_override
+            or self.active_profile_override
             or self.default_profile
         )
 
@@ -308,13 +522,42 @@ class AlertConfigManager:
 
 
 class ConditionEvaluator:
+    """
+    Evaluates a profile's conditions against an alert context.
+
+    `when` expressions are compiled once here, so a long-lived evaluator (see
+    `TradeStatsProcessor._get_condition_evaluator`) only pays for `eval` of
+    ready code objects on each refresh. Expressions that do not compile are
+    logged once and never match. Message templates are parsed here too, so
+    formatting a match later is a cache hit in `compile_template`.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         self.conditions = config.get("conditions", [])
         self.color_rules = config.get("color_rules", [])
+        self._compiled = []
+        for condition in self.conditions:
+            if not condition.get("enabled", True):
+                continue
+            expression = condition.get("when", "")
+            if not expression:
+                continue
+            code = self._compile_expr(expression)
+            if code is not None:
+                self._compiled.append((condition, expression, code))
+                compile_template(condition.get("message"))
+                compile_template(condition.get("extra_message"))
 
-    def _eval_expr(self, expression: str, context: Dict[str, Any]) -> bool:
+    def _compile_expr(self, expression: str):
         try:
-            return bool(eval(expression, SAFE_GLOBALS, context))
+            return compile(expression, "<alert condition>", "eval")
+        except SyntaxError as exc:
+            LOGGER.warning("Failed to compile expression '%s': %s", expression, exc)
+            return None
+
+    def _eval_expr(self, expression: str, context: Dict[str, Any], code=None) -> bool:
+        try:
+            return bool(eval(code or expression, SAFE_GLOBALS, context))
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning("Failed to evaluate expression '%s': %s", expression, exc)
             return False
@@ -331,16 +574,11 @@ class ConditionEvaluator:
     def evaluate(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
         seen_groups: set[str] = set()
-        for condition in self.conditions:
-            if not condition.get("enabled", True):
-                continue
+        for condition, expression, code in self._compiled:
             group = condition.get("group", "")
             if group in seen_groups:
                 continue
-            expression = condition.get("when", "")
-            if not expression:
-                continue
-            if self._eval_expr(expression, context):
+            if self._eval_expr(expression, context, code):
                 seen_groups.add(group)
                 level = self._normalize_level(condition.get("level", "DEFAULT"))
                 results.append(
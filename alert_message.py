@@ -1,3 +1,14 @@
-from collections import namedtuple
+from dataclasses import dataclass
 
-AlertMessage = namedtuple("AlertMessage", ["message", "account", "duration_secs", "min_interval_secs", "level", "extra_msg"])
+from concern_level import ConcernLevel
+
+
+@dataclass(frozen=True, slots=True)
+class AlertMessage:
+    message: str
+    account: str
+    duration_secs: int
+    min_interval_secs: int
+    level: ConcernLevel
+    extra_msg: str
+    condition_id: str = ""  # throttle key; alerts without one are throttled by message text
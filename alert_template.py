@@ -0,0 +1,118 @@
+import logging
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# only scalar context values are substituted; anything else renders as "{name}"
+TEMPLATE_VALUE_TYPES = (int, float, str)
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+_MISSING = object()
+
+
+class _PlaceholderMap(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+class AlertTemplate:
+    """
+    An alert `message` / `extra_message` parsed once into literal text and fields.
+
+    Rendering mirrors `str.format_map` over the scalar part of the alert
+    context: a field that is missing (or not an int/float/str) renders as
+    "{name}", and any formatting error logs a warning and returns the raw
+    template. The placeholder for each field is formatted here, at compile
+    time, so a template whose placeholder cannot take its format spec (e.g.
+    "{pnl:+,}") is known up front to fall back to the raw text when that field
+    is missing.
+
+    Templates using attribute/index access or nested specs ("{a.b}", "{a[0]}",
+    "{x:{width}}") are rare and keep the generic `format_map` path.
+    """
+
+    __slots__ = ("template", "fields", "_parts", "_generic")
+
+    def __init__(self, template: str):
+        self.template = template
+        self._generic = False
+        # (literal, name, converter, format_spec, formatted placeholder or None)
+        parts = []
+        fields = []
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as exc:
+            LOGGER.warning("Failed to parse template '%s': %s", template, exc)
+            parsed = [(template, None, None, None)]
+
+        for literal, name, format_spec, conversion in parsed:
+            if name is None:
+                parts.append((literal, None, None, None, None))
+                continue
+            if not name.isidentifier() or "{" in (format_spec or ""):
+                self._generic = True
+                break
+            converter = _CONVERSIONS.get(conversion) if conversion else None
+            if conversion and converter is None:
+                self._generic = True
+                break
+            placeholder = "{" + name + "}"
+            try:
+                missing_text = format(
+                    converter(placeholder) if converter else placeholder, format_spec
+                )
+            except (ValueError, TypeError):
+                missing_text = None
+            fields.append(name)
+            parts.append((literal, name, converter, format_spec, missing_text))
+
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._parts = tuple(parts)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        if self._generic:
+            return self._render_generic(context)
+        pieces = []
+        try:
+            for literal, name, converter, format_spec, missing_text in self._parts:
+                pieces.append(literal)
+                if name is None:
+                    continue
+                value = context.get(name, _MISSING)
+                if value is _MISSING or not isinstance(value, TEMPLATE_VALUE_TYPES):
+                    if missing_text is None:
+                        return self.template
+                    pieces.append(missing_text)
+                    continue
+                if converter is not None:
+                    value = converter(value)
+                pieces.append(format(value, format_spec) if format_spec else str(value))
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Failed to format template '%s': %s", self.template, exc)
+            return self.template
+        return "".join(pieces)
+
+    def _render_generic(self, context: Dict[str, Any]) -> str:
+        safe_map = _PlaceholderMap(
+            (key, value)
+            for key, value in context.items()
+            if isinstance(value, TEMPLATE_VALUE_TYPES)
+        )
+        try:
+            return self.template.format_map(safe_map)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Failed to format template '%s': %s", self.template, exc)
+            return self.template
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: Optional[str]) -> AlertTemplate:
+    """Parsed template for `template`, shared by every profile that uses the same text."""
+    return AlertTemplate(template or "")
+
+
+def format_template(template: Optional[str], context: Dict[str, Any]) -> str:
+    if not template:
+        return template
+    return compile_template(template).render(context)
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+class AlertThrottle:
+    """
+    Last-shown index for alerts keyed by (account, condition id).
+
+    Each entry only remembers when its key may be shown again, so an entry is
+    dead as soon as that time passes (TTL = the key's own interval) and is
+    dropped lazily. The index is also capped at `max_entries`; when full,
+    expired entries are swept first and then the least recently shown keys go.
+    Memory is therefore bounded no matter how many distinct messages a long
+    session produces.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_allowed: "OrderedDict[Tuple[str, Hashable], float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._next_allowed)
+
+    def allow(self, account: str, key: Hashable, interval_secs: float, now: Optional[float] = None) -> bool:
+        """
+        Returns True (and starts the interval) if `key` may be shown for `account`.
+
+        An interval of 0 or less never throttles and records nothing.
+        """
+        if interval_secs <= 0:
+            return True
+        now = self._clock() if now is None else now
+        with self._lock:
+            if self._is_throttled((account, key), now):
+                return False
+            self._record((account, key), interval_secs, now)
+        return True
+
+    def is_throttled(self, account: str, key: Hashable, now: Optional[float] = None) -> bool:
+        """True if `key` was shown for `account` less than its interval ago; records nothing."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            return self._is_throttled((account, key), now)
+
+    def record(self, account: str, key: Hashable, interval_secs: float, now: Optional[float] = None) -> None:
+        """Starts the interval of `key` for `account`, e.g. once the alert was actually shown."""
+        if interval_secs <= 0:
+            return
+        now = self._clock() if now is None else now
+        with self._lock:
+            self._record((account, key), interval_secs, now)
+
+    def _is_throttled(self, entry_key: Tuple[str, Hashable], now: float) -> bool:
+        next_allowed = self._next_allowed.get(entry_key)
+        return next_allowed is not None and now < next_allowed
+
+    def _record(self, entry_key: Tuple[str, Hashable], interval_secs: float, now: float) -> None:
+        self._next_allowed[entry_key] = now + interval_secs
+        self._next_allowed.move_to_end(entry_key)
+        if len(self._next_allowed) > self.max_entries:
+            self._evict(now)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drops expired entries; returns how many were removed."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            return self._evict_expired(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._next_allowed.clear()
+
+    def to_state(self, wall_now: Optional[float] = None) -> Dict[Tuple[str, Hashable], float]:
+        """Unexpired entries as wall-clock (time.time) deadlines, which survive a restart."""
+        now = self._clock()
+        offset = (time.time() if wall_now is None else wall_now) - now
+        with self._lock:
+            return {
+                key: next_allowed + offset
+                for key, next_allowed in self._next_allowed.items()
+                if next_allowed > now
+            }
+
+    def restore_state(self, state: Dict[Tuple[str, Hashable], float], wall_now: Optional[float] = None) -> None:
+        """Replaces the entries with a `to_state()` result, dropping those already expired."""
+        now = self._clock()
+        offset = (time.time() if wall_now is None else wall_now) - now
+        with self._lock:
+            self._next_allowed.clear()
+            for key, deadline in sorted(state.items(), key=lambda item: item[1]):
+                if deadline - offset > now:
+                    self._next_allowed[key] = deadline - offset
+            while len(self._next_allowed) > self.max_entries:
+                self._next_allowed.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        self._evict_expired(now)
+        while len(self._next_allowed) > self.max_entries:
+            self._next_allowed.popitem(last=False)
+
+    def _evict_expired(self, now: float) -> int:
+        expired = [key for key, next_allowed in self._next_allowed.items() if next_allowed <= now]
+        for key in expired:
+            del self._next_allowed[key]
+        return len(expired)
@@ -1,3 +1,7 @@
+import time
+
+STARTUP_T0 = time.perf_counter()  # before the heavy imports, so they count toward startup
+
 import sys
 import datetime
 import my_utils
@@ -7,8 +11,9 @@ from concern_level import ConcernLevel
 from metrics_names import MetricNames
 from trade_stats_processor import TradeStatsProcessor
 from hammerspoon_alert_manager import HammerspoonAlertManager
+from state_snapshot import DEFAULT_SNAPSHOT_PATH, restore_snapshot, save_snapshot
+from refresh_scheduler import RefreshScheduler
 from constants import CONST
-from trade_group_display import TradeGroupDisplay
 
 from collections import Counter
 from datetime import datetime
@@ -30,10 +35,12 @@ from log_file_selector import LogFileSelector
 class TradingStatsApp(QApplication):
     def __init__(self, config: Config):
         super().__init__(sys.argv)
+        splash = self.show_splash()
+        first_paint_ms = (time.perf_counter() - STARTUP_T0) * 1000
 
         self.config = config
         self.processor = TradeStatsProcessor(config)
-        self.alert_manager = HammerspoonAlertManager()
+        self.alert_manager = HammerspoonAlertManager(hs_path=config.hs_path)
         self.window = QWidget()
         self.dropdown = QComboBox()
         self.selectedFiles = list()
@@ -43,25 +50,93 @@ class TradingStatsApp(QApplication):
         self.profile_status_label = None
 
         self.dialog = LogFileSelector(
-            config.directory_path, CONST.LOG_FILENAME_PATTERN, self.window
+            config.directory_path,
+            CONST.LOG_FILENAME_PATTERN,
+            self.window,
+            config.log_list_max_age_days,
         )
 
-        self.duration_timer = QTimer()
-        self.duration_timer.timeout.connect(self.update_minutes)
-        self.duration_timer.start(config.open_duration_refresh_ms)
+        # one single-shot timer for log polling and the open-duration tick, re-armed after each wake-up
+        self.refresh_scheduler = RefreshScheduler(
+            fast_ms=config.active_refresh_ms,
+            idle_ms=config.auto_refresh_ms,
+            max_idle_ms=config.max_idle_refresh_ms,
+            active_secs=config.active_refresh_secs,
+            duration_ms=config.open_duration_refresh_ms,
+        )
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
 
         self.account_tradecount_on_recent_alert = {}
-        self.reload_all_data_from_source()
+        self.warm_start_or_reload()
         self.create_stats_window()
 
+        self.snapshot_timer = QTimer()
+        self.snapshot_timer.timeout.connect(self.save_state)
+        self.snapshot_timer.start(CONST.SNAPSHOT_INTERVAL_MS)
+        self.aboutToQuit.connect(self.save_state)
+        splash.close()
+
+        first_stats_ms = (time.perf_counter() - STARTUP_T0) * 1000
+        self.report_startup(first_paint_ms, first_stats_ms)
         print("Trading Stats App Initialized.")
 
+    def show_splash(self) -> QLabel:
+        """First paint before the profile load and the initial log parse."""
+        splash = QLabel("Loading trading stats...")
+        splash.setWindowFlags(
+            Qt.WindowType.SplashScreen | Qt.WindowType.WindowStaysOnTopHint
+        )
+        splash_font = QFont("Courier New")
+        splash_font.setPointSize(27)
+        splash.setFont(splash_font)
+        splash.setStyleSheet("background-color: gray; color: black; padding: 20px;")
+        splash.show()
+        self.processEvents()
+        return splash
+
+    def report_startup(self, first_paint_ms: float, first_stats_ms: float):
+        print(
+            f"Startup: first paint {first_paint_ms:.0f} ms, first stats {first_stats_ms:.0f} ms"
+        )
+        if first_paint_ms > CONST.STARTUP_FIRST_PAINT_BUDGET_MS:
+            print(f"Warning: first paint over {CONST.STARTUP_FIRST_PAINT_BUDGET_MS} ms budget")
+        if first_stats_ms > CONST.STARTUP_FIRST_STATS_BUDGET_MS:
+            print(f"Warning: first stats over {CONST.STARTUP_FIRST_STATS_BUDGET_MS} ms budget")
+
     def reload_all_data_from_source(self):
         filepaths = self.dialog.get_selected_files()
-        self.processor.load_account_names(filepaths)
-        fill_data = self.processor.get_fills(filepaths)
-        self.existing_fill_count = len(fill_data)
-        self.processor.compute_trade_stats(fill_data)
+        self.processor.reset_state()  # force a full re-parse of only what is selected now
+        self.processor.refresh_fills(filepaths)
+        self.existing_fill_count = len(self.processor.fill_store)
+        self.processor.compute_trade_stats(self.processor.fill_store)
+
+    def warm_start_or_reload(self):
+        """Resumes from the last snapshot (tailing only what was appended since), else parses everything."""
+        filepaths = self.dialog.get_selected_files()
+        if not restore_snapshot(
+            DEFAULT_SNAPSHOT_PATH, self.processor, filepaths, self.alert_manager.throttle
+        ):
+            self.reload_all_data_from_source()
+            return
+        print("Restored stats snapshot; resuming from saved log offsets.")
+        if self.processor.refresh_fills(filepaths):
+            self.processor.update_trade_stats()
+        self.existing_fill_count = len(self.processor.fill_store)
+
+    def save_state(self):
+        try:
+            save_snapshot(DEFAULT_SNAPSHOT_PATH, self.processor, self.alert_manager.throttle)
+        except Exception as exc:
+            print(f"Could not save stats snapshot: {exc}")
+        self.processor.log_tailer.save_indexes()  # time index for range reads by the analysis scripts
+
+    def schedule_refresh(self, fills_changed: bool):
+        """Records a refresh with the scheduler and re-arms the timer for the new cadence."""
+        self.refresh_scheduler.record_refresh(
+            fills_changed, self.processor.has_open_position()
+        )
+        self.refresh_timer.start(self.refresh_scheduler.next_delay_ms())
 
     def call_last_trade(self):
         self.last_trade_count = self.processor.get_total_trades_across_all()
@@ -117,18 +192,27 @@ class TradingStatsApp(QApplication):
         refresh_all_button = QPushButton("Refresh All")
         call_last_trade_button = QPushButton("Call For Last Trade")
         show_trades_button = QPushButton("Show Trades")
+        latency_button = QPushButton("Latency")
 
         def refresh_data():
             selected_key = self.dropdown.currentText()
-            fill_data = self.processor.get_fills(self.dialog.get_selected_files())
-            current_fill_count = len(fill_data)
-            if current_fill_count != self.existing_fill_count:
-                self.processor.compute_trade_stats(fill_data)
+            fills_changed = self.processor.refresh_fills(self.dialog.get_selected_files())
+            current_fill_count = len(self.processor.fill_store)
+            profile_reloaded = self.processor.reload_alert_profile()
+            if profile_reloaded:
+                self.processor.compute_trade_stats(self.processor.fill_store)
+            elif fills_changed:
+                self.processor.update_trade_stats()
+            windows_aged = not (fills_changed or profile_reloaded) and self.processor.age_rolling_windows()
+            if fills_changed or profile_reloaded or windows_aged:
                 dropdown_changed(selected_key)  # re-render with the updated data.
                 self.existing_fill_count = current_fill_count
+            if profile_reloaded:
+                self.update_profile_status_label()
             refresh_button.setText(
                 f"Refresh Fills [{datetime.now().strftime(CONST.DATE_TIME_FORMAT)}]"
             )
+            self.schedule_refresh(fills_changed)
 
         def close_app():
             self.quit()
@@ -155,6 +239,7 @@ class TradingStatsApp(QApplication):
                         select_logfile_button,
                         call_last_trade_button,
                         show_trades_button,
+                        latency_button,
                     )
                 ):
                     item.widget().deleteLater()
@@ -247,17 +332,25 @@ class TradingStatsApp(QApplication):
                     )
 
                     if new_tradecount != old_tradecount:
+                        latency = self.processor.latency
+                        # log times of the fills behind these alerts; dispatch is timed by the first alert shown
+                        fill_log_times = latency.take_awaiting_dispatch(account_name)
+                        dispatch_log_times = fill_log_times
                         concernLevel = ConcernLevel.DEFAULT
                         for alert in selected_alerts:
                             if config.alert_enabled:
-                                self.alert_manager.display_alert(
+                                shown = self.alert_manager.display_alert(
                                     alert.message,
                                     alert.account,
                                     alert.duration_secs,
                                     alert.min_interval_secs,
                                     alert.level,
                                     alert.extra_msg,
+                                    alert.condition_id,
+                                    on_shown=latency.on_done("dispatch", dispatch_log_times),
                                 )
+                                if shown:
+                                    dispatch_log_times = []
                             concernLevel = max(concernLevel, alert.level)
 
                         if (
@@ -271,6 +364,7 @@ class TradingStatsApp(QApplication):
                                     "duration": config.get_alert_duration(concernLevel),
                                 },  # sync duration of both block and alert
                                 config.get_min_interval_secs(concernLevel),
+                                on_done=latency.on_done("block", fill_log_times),
                             )
                         self.account_tradecount_on_recent_alert[account_name] = (
                             new_tradecount
@@ -306,6 +400,7 @@ class TradingStatsApp(QApplication):
                     dropdown_changed(CONST.SELECT_ACCOUNT)
             self.dropdown.currentTextChanged.connect(dropdown_changed)
             self.update_profile_status_label()
+            self.schedule_refresh(True)
 
         refresh_all_button.clicked.connect(refresh_all)
 
@@ -323,16 +418,28 @@ class TradingStatsApp(QApplication):
         def open_trades_window():
             account_name = self.dropdown.currentText()
             if account_name in self.processor.account_trade_groups.keys():
+                from trade_group_display import TradeGroupDisplay
+
                 selected_trade_groups = self.processor.account_trade_groups[
                     account_name
                 ]
                 trade_group_dialog = TradeGroupDisplay(
-                    selected_trade_groups, self.window
+                    selected_trade_groups,
+                    self.window,
+                    self.processor.account_equity_curves.get(account_name),
                 )
                 trade_group_dialog.show()
 
         show_trades_button.clicked.connect(open_trades_window)
 
+        def open_latency_window():
+            from latency_display import LatencyDisplay
+
+            latency_dialog = LatencyDisplay(self.processor.latency, self.window)
+            latency_dialog.show()
+
+        latency_button.clicked.connect(open_latency_window)
+
         button_style = """
             QPushButton {
                 background-color: gray;
@@ -352,8 +459,10 @@ class TradingStatsApp(QApplication):
         refresh_all_button.setStyleSheet(button_style)
         close_button.setStyleSheet(button_style)
         show_trades_button.setStyleSheet(button_style)
+        latency_button.setStyleSheet(button_style)
 
-        button_row_index_start = 44  # fixed so we don't have to window adjust when refreshing and some accounts have no fills (and therefore no stats)
+        # past the most stats rows an account can show (stats start at row 2), so we don't have to window adjust when refreshing and some accounts have no fills (and therefore no stats)
+        button_row_index_start = 2 + self.processor.stats_row_count()
         layout.addWidget(
             extra_metrics_checkbox,
             button_row_index_start,
@@ -401,7 +510,15 @@ class TradingStatsApp(QApplication):
             button_row_index_start + 3,
             0,
             1,
-            2,
+            1,
+            alignment=Qt.AlignmentFlag.AlignCenter,
+        )
+        layout.addWidget(
+            latency_button,
+            button_row_index_start + 3,
+            1,
+            1,
+            1,
             alignment=Qt.AlignmentFlag.AlignCenter,
         )
         layout.addWidget(
@@ -416,9 +533,15 @@ class TradingStatsApp(QApplication):
         self.window.adjustSize()
         self.window.show()
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(refresh_data)
-        self.timer.start(config.auto_refresh_ms)
+        def on_refresh_timer():
+            if self.refresh_scheduler.refresh_due():
+                refresh_data()  # re-arms the timer
+            if self.refresh_scheduler.duration_due():
+                self.update_minutes()
+            self.refresh_timer.start(self.refresh_scheduler.next_delay_ms())
+
+        self.refresh_timer.timeout.connect(on_refresh_timer)
+        self.schedule_refresh(False)
 
     def update_profile_status_label(self):
         if not self.profile_status_label:
@@ -0,0 +1,261 @@
+"""
+Column-wise (numpy) alternative to feeding fills one by one to
+`TradeStatsAccumulator.add_fill`, for multi-month historical analysis.
+
+Works directly on the `FillStore` columns (zero-copy views of its arrays):
+
+1. fills are ordered by order id and grouped by (account, contract family),
+2. trades end where the running sum of signed dollar quantity returns to 0,
+3. per-trade P/L, size, points and times come from `reduceat` over each
+   trade's slice, and the session aggregates from array reductions.
+
+Only the streak tracker and the tail of the rolling windows are replayed per
+trade (and the stop slippage per stop fill), so the result is the accumulator
+state `add_fill` would reach (floats may differ in the last bits from
+summation order). Requires numpy: `pip install numpy`.
+"""
+
+from datetime import timedelta
+from typing import Iterable, Optional
+
+import numpy as np
+
+from fill_store import FillStore
+from trade_group import TradeGroup
+from trade_stats_accumulator import OpenTrade, TradeStatsAccumulator
+
+
+def _datetimes(seconds: np.ndarray) -> list:
+    """Epoch seconds -> naive datetimes (the FillStore time encoding)."""
+    return seconds.astype("datetime64[s]").tolist()
+
+
+def accumulate_batch(
+    config,
+    store: FillStore,
+    rows: Optional[Iterable[int]] = None,
+    collect_followtrade_stats: bool = False,
+) -> TradeStatsAccumulator:
+    """Accumulator state for `store` rows (default: all), as `add_fill` in order id order would build it."""
+    stats = TradeStatsAccumulator(config, collect_followtrade_stats)
+    rows = np.arange(len(store)) if rows is None else np.fromiter(rows, dtype=np.intp)
+    if rows.size == 0:
+        return stats
+
+    order_ids = np.frombuffer(store.order_id, dtype=np.int64)[rows]
+    order = np.argsort(order_ids, kind="stable")
+    rows = rows[order]
+    stats.last_order_id = int(order_ids[order[-1]])
+
+    specs = [stats.contracts.spec(symbol) for symbol in store.symbols]
+    family_names = sorted({spec.family for spec in specs})
+    family_ids = {family: index for index, family in enumerate(family_names)}
+    symbol = np.frombuffer(store.symbol_idx, dtype=np.uint16)[rows]
+    account = np.frombuffer(store.account_idx, dtype=np.uint16)[rows].astype(np.int64)
+    family = np.array([family_ids[spec.family] for spec in specs], dtype=np.int64)[symbol]
+    multiplier = np.array([spec.multiplier for spec in specs], dtype=np.float64)[symbol]
+    is_buy = np.frombuffer(store.side, dtype=np.int8)[rows] > 0
+    quantity = np.frombuffer(store.quantity, dtype=np.float64)[rows]
+    price = np.frombuffer(store.fill_price, dtype=np.float64)[rows]
+    second = np.frombuffer(store.fill_second, dtype=np.int64)[rows]
+    stop_price = np.frombuffer(store.stop_price, dtype=np.float64)[rows]
+
+    stats.total_buys = int(is_buy.sum())
+    stats.total_sells = int(rows.size - stats.total_buys)
+    whole_contracts = np.trunc(quantity).astype(np.int64)
+    stats.total_buy_contracts = int(whole_contracts[is_buy].sum())
+    stats.total_sell_contracts = int(whole_contracts[~is_buy].sum())
+    _replay_stop_slippage(stats, stop_price, is_buy, quantity, price, second, multiplier)
+
+    # fills grouped by (account, family), session order kept within each group
+    key = account * len(family_names) + family
+    by_key = np.lexsort((np.arange(rows.size), key))
+    key, account, family = key[by_key], account[by_key], family[by_key]
+    is_buy, quantity, price, second, multiplier = (
+        is_buy[by_key], quantity[by_key], price[by_key], second[by_key], multiplier[by_key]
+    )
+    sign = np.where(is_buy, 1.0, -1.0)
+
+    # dollar-normalized position; whole contracts x integer multipliers, so flat is exactly 0
+    running = np.cumsum(sign * quantity * multiplier)
+    new_key = np.ones(rows.size, dtype=bool)
+    new_key[1:] = key[1:] != key[:-1]
+    key_starts = np.flatnonzero(new_key)
+    key_offsets = np.concatenate(([0.0], running[key_starts[1:] - 1]))
+    running -= np.repeat(key_offsets, np.diff(np.append(key_starts, rows.size)))
+
+    after_flat = np.ones(rows.size, dtype=bool)
+    after_flat[1:] = running[:-1] == 0
+    starts = np.flatnonzero(new_key | after_flat)
+    ends = np.append(starts[1:], rows.size) - 1
+    lengths = ends - starts + 1
+    closed = running[ends] == 0
+
+    entry_long = is_buy[starts]
+    unit = multiplier[starts]
+    same_unit = multiplier == np.repeat(unit, lengths)
+    value = quantity * price
+    buy_value = np.add.reduceat(np.where(is_buy & same_unit, value, 0.0), starts)
+    sell_value = np.add.reduceat(np.where(~is_buy & same_unit, value, 0.0), starts)
+    other_pnl = np.add.reduceat(np.where(same_unit, 0.0, -sign * value * multiplier), starts)
+    entry_fills = np.add.reduceat((is_buy == np.repeat(entry_long, lengths)).astype(np.int64), starts)
+    max_position = np.maximum(np.maximum.reduceat(running, starts), 0.0)
+    min_position = np.minimum(np.minimum.reduceat(running, starts), 0.0)
+    entry_second = second[starts]
+    exit_second = np.maximum.reduceat(second, starts)
+    start_pos = by_key[starts]  # session positions
+    end_pos = by_key[ends]
+
+    # --- closed trades, in the order they closed ---
+    done = np.flatnonzero(closed)
+    done = done[np.argsort(end_pos[done], kind="stable")]
+    pnl = (sell_value[done] - buy_value[done]) * unit[done] + other_pnl[done]
+    size = np.maximum(np.abs(max_position[done]), np.abs(min_position[done])) / unit[done]
+    points = pnl / (size * unit[done])
+    long = entry_long[done]
+    win = pnl > 0
+    scaled = entry_fills[done] > 1
+    duration_secs = (exit_second[done] - entry_second[done]).astype(np.float64)
+    entry_times = _datetimes(entry_second[done])
+    exit_times = _datetimes(exit_second[done])
+
+    if done.size:
+        _set_session_totals(stats, pnl, size, points, long, win, scaled, duration_secs, exit_times)
+
+    for index in range(done.size):
+        trade_group = TradeGroup(
+            bool(long[index]),
+            entry_times[index],
+            exit_times[index],
+            float(size[index]),
+            float(points[index]),
+            float(pnl[index]),
+        )
+        stats.trade_groups.append(trade_group)
+        stats.streak_tracker.process(
+            trade_group.trade_amount > 0,
+            trade_group.entry_is_long,
+            trade_group.entry_time,
+            trade_group.exit_time,
+            trade_group.max_trade_size,
+            trade_group.trade_point,
+        )
+    _replay_rolling_tail(stats, exit_second[done])
+
+    # --- time between trades: a trade opened while every earlier one had closed ---
+    open_order = np.argsort(start_pos, kind="stable")
+    close_positions = end_pos[done]  # already ascending
+    closes_before = np.searchsorted(close_positions, start_pos[open_order])
+    opens_before = np.arange(open_order.size)
+    between = (closes_before > 0) & (opens_before == closes_before)
+    if between.any():
+        gaps = (
+            entry_second[open_order][between] - exit_second[done][closes_before[between] - 1]
+        ).astype(np.float64)
+        stats.between_trades_secs = _sum(gaps)
+        stats.between_trades_count = int(gaps.size)
+        stats.between_trades_max = max(timedelta(0), timedelta(seconds=float(gaps.max())))
+    stats.first_entry_time = _datetimes(entry_second.min(keepdims=True))[0]
+
+    # --- trades still open at the end, so add_fill can carry on from here ---
+    for index in open_order:
+        if closed[index]:
+            continue
+        trade = OpenTrade(bool(entry_long[index]), _datetimes(entry_second[index : index + 1])[0], float(unit[index]))
+        trade.max_time = _datetimes(exit_second[index : index + 1])[0]
+        trade.fill_count = int(lengths[index])
+        trade.entry_fill_count = int(entry_fills[index])
+        span = slice(starts[index], ends[index] + 1)
+        trade.buy_qty = float(quantity[span][is_buy[span]].sum())
+        trade.sell_qty = float(quantity[span][~is_buy[span]].sum())
+        trade.buy_value = float(buy_value[index])
+        trade.sell_value = float(sell_value[index])
+        trade.other_pnl = float(other_pnl[index])
+        trade.position = float(running[ends[index]])
+        trade.max_position = float(max_position[index])
+        trade.min_position = float(min_position[index])
+        stats.open_trades[(store.account_names[account[starts[index]]], family_names[family[starts[index]]])] = trade
+    return stats
+
+
+def _set_session_totals(stats, pnl, size, points, long, win, scaled, duration_secs, exit_times):
+    running_pnl = np.cumsum(pnl)
+    stats.completed_trades = int(pnl.size)
+    stats.total_profit_or_loss = float(running_pnl[-1])
+    stats.total_winning_trades = int(win.sum())
+    stats.total_wins_long = int((win & long).sum())
+    stats.total_long_trades = int(long.sum())
+    stats.total_short_trades = int(pnl.size - stats.total_long_trades)
+    stats.last_exit_time = exit_times[-1]
+
+    # first time the realized P/L hit its low / high (add_fill only moves on strict improvement)
+    low, high = int(np.argmin(running_pnl)), int(np.argmax(running_pnl))
+    if running_pnl[low] < 0:
+        stats.max_realized_drawdown = float(running_pnl[low])
+        stats.max_realized_drawdown_time = exit_times[low]
+    if running_pnl[high] > 0:
+        stats.max_realized_profit = float(running_pnl[high])
+        stats.max_realized_profit_time = exit_times[high]
+
+    loss = ~win
+    for is_long in (True, False):
+        side = long == is_long
+        stats.gains[is_long] = _sum(pnl[win & side])
+        stats.losses[is_long] = _sum(pnl[loss & side])
+
+    if loss.any():
+        stats.loss_count = int(loss.sum())
+        stats.loss_max_size = max(0, float(size[loss].max()))
+        stats.loss_max_value = float(pnl[loss].min())
+        stats.loss_max_points = float(points[loss].min())
+        stats.loss_points_sum = _sum(points[loss])
+        stats.loss_duration_secs = _sum(duration_secs[loss])
+        stats.loss_duration_max = max(timedelta(0), timedelta(seconds=float(duration_secs[loss].max())))
+        stats.loss_scaled_count = int(scaled[loss].sum())
+    if win.any():
+        stats.gain_count = int(win.sum())
+        stats.win_max_size = max(0, float(size[win].max()))
+        stats.win_max_value = float(pnl[win].max())
+        stats.win_max_points = float(points[win].max())
+        stats.win_points_sum = _sum(points[win])
+        stats.win_duration_secs = _sum(duration_secs[win])
+        stats.win_duration_max = max(timedelta(0), timedelta(seconds=float(duration_secs[win].max())))
+        stats.win_scaled_count = int(scaled[win].sum())
+
+
+def _replay_stop_slippage(stats, stop_price, is_buy, quantity, price, second, multiplier):
+    """Feeds the stop fills (a small share of all fills), in order id order, to the slippage stats."""
+    stops = np.flatnonzero(~np.isnan(stop_price))
+    fill_times = _datetimes(second[stops])
+    for index, fill_time in zip(stops.tolist(), fill_times):
+        stats.slippage.add(
+            bool(is_buy[index]),
+            float(stop_price[index]),
+            float(price[index]),
+            float(quantity[index]),
+            float(multiplier[index]),
+            fill_time,
+        )
+
+
+def _replay_rolling_tail(stats, exit_second: np.ndarray):
+    """
+    Feeds the rolling windows only the trades that can still be in them.
+
+    A trade has left every window once some later trade exits more than the
+    longest window after it; replay starts at the first trade for which that
+    is not the case.
+    """
+    if exit_second.size == 0:
+        return
+    span = max(window.minutes for window in stats.rolling_metrics.windows) * 60
+    later_max = np.maximum.accumulate(exit_second[::-1])[::-1]
+    later_max = np.append(later_max[1:], np.iinfo(np.int64).min)  # max exit after each trade
+    still_in = np.flatnonzero(exit_second > later_max - span)
+    for trade_group in stats.trade_groups[int(still_in[0]) :]:
+        stats.rolling_metrics.add(trade_group)
+
+
+def _sum(values: np.ndarray) -> float:
+    """Left-to-right sum, the order add_fill accumulates in."""
+    return float(np.cumsum(values)[-1]) if values.size else 0.0
@@ -0,0 +1,65 @@
+"""
+Streaming (TradeStatsAccumulator.add_fill per fill) vs column-wise
+(batch_stats.accumulate_batch) stats over a long multi-account history.
+
+    python benchmarks/bench_batch_stats.py [fills] [runs]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batch_stats import accumulate_batch  # noqa: E402
+from config import Config  # noqa: E402
+from fill_store import FillStore  # noqa: E402
+from trade_stats_accumulator import TradeStatsAccumulator  # noqa: E402
+
+
+def history(fills):
+    rng = random.Random(1)
+    store = FillStore()
+    start = datetime(2025, 1, 2, 6, 30)
+    order_id = 1
+    while order_id <= fills:
+        entry = start + timedelta(minutes=3 * order_id)
+        account = rng.choice(["SIM1", "SIM2"])
+        symbol = rng.choice(["ESU5", "ESU5", "MESU5"])
+        contracts = rng.choice([1, 1, 2, 3])
+        for _ in range(contracts):
+            store.add(account, order_id, "Filled BUY", symbol, 1.0, 6000 + rng.randint(-8, 8) * 0.25, entry)
+            order_id += 1
+        exit_price = 6000 + rng.randint(-8, 8) * 0.25
+        store.add(account, order_id, "Filled SELL", symbol, float(contracts), exit_price, entry + timedelta(minutes=1))
+        order_id += 1
+    return store
+
+
+def main():
+    fills = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    with contextlib.redirect_stdout(io.StringIO()):
+        config = Config()
+    store = history(fills)
+
+    def streaming():
+        stats = TradeStatsAccumulator(config)
+        for fill in sorted(store, key=lambda record: record.order_id):
+            stats.add_fill(fill)
+
+    def batch():
+        accumulate_batch(config, store)
+
+    print(f"fills: {len(store):,}  runs: {runs} (best)")
+    for label, func in (("streaming", streaming), ("batch", batch)):
+        best = min(timeit.repeat(func, number=1, repeat=runs))
+        print(f"{label:<10} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
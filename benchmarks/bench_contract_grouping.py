@@ -0,0 +1,69 @@
+"""
+Per-fill cost of trade grouping: TradeStatsAccumulator.add_fill over a
+single-symbol session and over one mixing ES and MES, plus the cached
+contract lookup against Config.get_contract_value.
+
+    python benchmarks/bench_contract_grouping.py [fills] [runs]
+"""
+
+import contextlib
+import io
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config  # noqa: E402
+from contract_registry import ContractRegistry  # noqa: E402
+from trade import Trade  # noqa: E402
+from trade_stats_accumulator import TradeStatsAccumulator  # noqa: E402
+
+
+def session(fills, mixed):
+    start = datetime(2025, 6, 12, 6, 30)
+    trades = []
+    for index in range(0, fills, 2):
+        entry = start + timedelta(seconds=10 * index)
+        exit_price = 6001.25 if index % 4 else 5999.00
+        if mixed and index % 4 == 0:
+            # 1 ES in, out as 10 MES
+            trades.append(Trade("SIM1", index + 1, "Filled BUY", "ESU5", 1.0, 6000.00, entry))
+            trades.append(Trade("SIM1", index + 2, "Filled SELL", "MESU5", 10.0, exit_price, entry))
+        else:
+            trades.append(Trade("SIM1", index + 1, "Filled BUY", "ESU5", 1.0, 6000.00, entry))
+            trades.append(Trade("SIM1", index + 2, "Filled SELL", "ESU5", 1.0, exit_price, entry))
+    return trades
+
+
+def main():
+    fills = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    with contextlib.redirect_stdout(io.StringIO()):
+        config = Config()
+
+    print(f"fills: {fills:,}  runs: {runs} (best ns/fill)")
+    for label, mixed in (("ES only", False), ("ES + MES", True)):
+        trades = session(fills, mixed)
+
+        def accumulate():
+            stats = TradeStatsAccumulator(config)
+            for trade in trades:
+                stats.add_fill(trade)
+
+        best = min(timeit.repeat(accumulate, number=1, repeat=runs))
+        print(f"add_fill {label:<13} {best / fills * 1e9:8.0f}")
+
+    registry = ContractRegistry(config)
+    lookups = 1_000_000
+    for label, func in (
+        ("get_contract_value", lambda: config.get_contract_value("MESU5")),
+        ("registry.multiplier", lambda: registry.multiplier("MESU5")),
+    ):
+        best = min(timeit.repeat(func, number=lookups, repeat=runs))
+        print(f"{label:<22} {best / lookups * 1e9:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
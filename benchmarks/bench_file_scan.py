@@ -0,0 +1,59 @@
+"""
+Log directory scan: the old listdir + re.match + getmtime-per-file scan against
+file_utils' scandir listing, cold and cached, over a directory of N logs.
+
+    python benchmarks/bench_file_scan.py [files] [runs]
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import file_utils  # noqa: E402
+from constants import CONST  # noqa: E402
+
+
+def listdir_scan(directory, pattern):
+    files = [f for f in os.listdir(directory) if re.match(pattern, f)]
+    files_with_paths = [os.path.join(directory, f) for f in files]
+    files_with_paths.sort(key=os.path.getmtime, reverse=True)
+    return files_with_paths
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as directory:
+        now = time.time()
+        for index in range(count):
+            path = os.path.join(directory, f"output{index}.log")
+            with open(path, "w") as handle:
+                handle.write("x\n")
+            os.utime(path, (now - index * 3600, now - index * 3600))
+        pattern = CONST.LOG_FILENAME_PATTERN
+
+        assert listdir_scan(directory, pattern) == file_utils.get_all_matching_files(directory, pattern)
+
+        def cold():
+            file_utils.clear_listing_cache()
+            file_utils.get_all_matching_files(directory, pattern)
+
+        timings = {
+            "listdir + getmtime": lambda: listdir_scan(directory, pattern),
+            "scandir (cold)": cold,
+            "scandir (cached)": lambda: file_utils.get_all_matching_files(directory, pattern),
+        }
+        print(f"files: {count:,}  runs: {runs}")
+        for label, func in timings.items():
+            best = min(timeit.repeat(func, number=1, repeat=runs))
+            print(f"{label:<20} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
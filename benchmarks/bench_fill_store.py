@@ -0,0 +1,71 @@
+"""
+Memory comparison: list of Trade namedtuples + dedup dict vs FillStore.
+
+    python benchmarks/bench_fill_store.py [fill_count]
+"""
+
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fill_store import FillStore  # noqa: E402
+from trade import Trade  # noqa: E402
+
+
+def _raw_fills(count):
+    # strings are rebuilt per fill, as they are when sliced out of regex matches
+    start = datetime(2025, 1, 2, 6, 30)
+    for i in range(count):
+        yield (
+            "".join(["SIM", "ACCOUNT", str(i % 3)]),
+            i,
+            "".join(["Filled ", "BUY" if i % 2 == 0 else "SELL"]),
+            "".join(["ES", "U5"]),
+            float(1 + i % 3),
+            6000.0 + (i % 40) * 0.25,
+            start + timedelta(minutes=i // 4),
+        )
+
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    holder = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+    return current
+
+
+def build_namedtuples(count):
+    unique_trades_dict = {}
+    for account, order_id, order_type, symbol, qty, price, fill_time in _raw_fills(count):
+        unique_trades_dict[account, order_id] = Trade(
+            account, order_id, order_type, symbol, qty, price, fill_time
+        )
+    return unique_trades_dict, list(unique_trades_dict.values())
+
+
+def build_store(count):
+    store = FillStore()
+    for fill in _raw_fills(count):
+        store.add(*fill)
+    return store
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    legacy = measure(build_namedtuples, count)
+    columnar = measure(build_store, count)
+    print(f"fills: {count:,}")
+    print(f"namedtuples + dict: {legacy / count:7.1f} bytes/fill")
+    print(f"FillStore:          {columnar / count:7.1f} bytes/fill")
+    print(f"reduction:          {legacy / columnar:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Time-of-day window (09:30-10:30) over N day logs: reading each log whole and
+filtering against seeking through the cached sparse time index.
+
+    python benchmarks/bench_log_index.py [days] [lines_per_day] [runs]
+"""
+
+import sys
+import tempfile
+import timeit
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import log_reader  # noqa: E402
+from log_index import parse_line_seconds, read_time_range, update_index  # noqa: E402
+
+WINDOW = (time(9, 30), time(10, 30))
+
+
+def write_day(path, day, lines):
+    start = datetime(2025, 1, 2) + timedelta(days=day)
+    step = 86_400 / lines
+    with open(path, "w", encoding="utf-8") as handle:
+        for index in range(lines):
+            when = start + timedelta(seconds=int(index * step))
+            handle.write(f"{when:%H:%M:%S} INFO ConnectionManager::ping() heartbeat {index}\n")
+
+
+def full_scan(path):
+    start, end = 9 * 3600 + 30 * 60, 10 * 3600 + 30 * 60
+    selected = []
+    with log_reader.open_log(path) as handle:
+        for line in handle:
+            seconds = parse_line_seconds(line)
+            if seconds is not None and start <= seconds < end:
+                selected.append(line)
+    return selected
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    with tempfile.TemporaryDirectory() as directory:
+        index_dir = Path(directory) / "index"
+        paths = [Path(directory) / f"output{day}.log" for day in range(days)]
+        for day, path in enumerate(paths):
+            write_day(path, day, lines)
+        for path in paths:
+            update_index(path, index_dir)  # what ingestion leaves behind
+            assert full_scan(path) == list(read_time_range(path, *WINDOW, index_dir))
+
+        timings = {
+            "full scan": lambda: [full_scan(path) for path in paths],
+            "indexed range read": lambda: [list(read_time_range(path, *WINDOW, index_dir)) for path in paths],
+        }
+        print(f"days: {days}  lines/day: {lines:,}  runs: {runs} (best)")
+        for label, func in timings.items():
+            best = min(timeit.repeat(func, number=1, repeat=runs))
+            print(f"{label:<20} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
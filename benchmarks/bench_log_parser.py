@@ -0,0 +1,64 @@
+"""
+Fill line parsing: the old `.*`-chained regex against the single-pass
+tokenizer, on ordinary log lines and on one pathological line.
+
+    python benchmarks/bench_log_parser.py [lines] [pathological_repeat]
+"""
+
+import re
+import sys
+import time
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from fixtures.log_writer import format_fill_line, format_noise_line  # noqa: E402
+from log_parser import parse_fill_line  # noqa: E402
+
+OLD_FILL_PATTERN = re.compile(
+    r"OrderDirectory::orderFilled\(\) order: ID: (\S+) (\S+) (\S+)\.CME.*(Filled BUY|Filled SELL).*Qty:(\d+\.\d+).*Last Fill Time:\s*(\d{2}/\d{2}/\d{4} \d{1,2}:\d{2} [AP]M).*fill price: (\d+\.\d+)"
+)
+
+
+def old_parse(line):
+    """The old search plus field extraction, as add_fill_line did it."""
+    match = OLD_FILL_PATTERN.search(line)
+    if not match:
+        return None
+    return (match.group(1), match.group(2), match.group(3), match.group(4), float(match.group(5)), match.group(6), float(match.group(7)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    start = datetime(2025, 1, 2, 6, 30)
+    lines = []
+    for index in range(count):
+        when = start + timedelta(seconds=index)
+        if index % 10 == 0:
+            lines.append(format_fill_line(index, "SIM1", "ESU5", "BUY", 1, 6000.25, when, "STP", 6000.0))
+        else:
+            lines.append(format_noise_line(when, f"heartbeat {index}"))
+
+    timings = {
+        "old regex": lambda: [old_parse(line) for line in lines],
+        "tokenizer": lambda: [parse_fill_line(line) for line in lines],
+    }
+    print(f"lines: {count:,} (10% fills)  runs: 3 (best)")
+    for label, func in timings.items():
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{label:<12} {best * 1000:8.1f} ms")
+
+    line = "OrderDirectory::orderFilled() order: ID: a b c.CME " + "Filled BUY Qty:1.0 Last Fill Time: 01/02/2025 9:31 AM " * repeat
+    print(f"\npathological line: {len(line):,} chars")
+    for label, parse in (("old regex", OLD_FILL_PATTERN.search), ("tokenizer", parse_fill_line)):
+        started = time.perf_counter()
+        parse(line)
+        print(f"{label:<12} {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
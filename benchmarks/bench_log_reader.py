@@ -0,0 +1,111 @@
+"""
+Full log ingestion: the old text-mode line loop (decode and parse every line)
+against `log_reader.scan_lines` (find the markers in binary chunks, decode
+only those lines), for fills and for account names, plus a corrupted log.
+The live path is timed the same way: `LogTailer.new_lines` decoding every
+line against dropping the lines without a marker before decoding.
+
+    python benchmarks/bench_log_reader.py [lines] [fill_every]
+"""
+
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from fill_store import FillStore  # noqa: E402
+from fixtures.log_writer import format_account_line, format_fill_line, format_noise_line, write_log  # noqa: E402
+from log_parser import ACCOUNT_MARKER_BYTES, FILL_MARKER_BYTES, parse_account_line  # noqa: E402
+from log_reader import scan_lines  # noqa: E402
+from log_tailer import LogTailer  # noqa: E402
+from trade_stats_processor import add_fill_line  # noqa: E402
+
+
+def text_fills(path):
+    fill_store = FillStore()
+    with open(path, "r") as handle:
+        for line in handle:
+            add_fill_line(fill_store, line)
+    return fill_store
+
+
+def scanned_fills(path):
+    fill_store = FillStore()
+    for line in scan_lines(path, (FILL_MARKER_BYTES,)):
+        add_fill_line(fill_store, line)
+    return fill_store
+
+
+def text_accounts(path):
+    with open(path, "r") as handle:
+        return {name for name in map(parse_account_line, handle) if name}
+
+
+def scanned_accounts(path):
+    return {name for name in map(parse_account_line, scan_lines(path, (ACCOUNT_MARKER_BYTES,))) if name}
+
+
+def tailed(path, markers=None):
+    fill_store, account_names = FillStore(), set()
+    for line in LogTailer().new_lines(str(path), markers):
+        if add_fill_line(fill_store, line) is None:
+            account_names.add(parse_account_line(line))
+    account_names.discard(None)
+    return fill_store, account_names
+
+
+def write_session(path, count, fill_every):
+    start = datetime(2025, 1, 2, 6, 30)
+    lines = []
+    for index in range(count):
+        when = start + timedelta(seconds=index // 10)
+        if index % fill_every == 0:
+            lines.append(format_fill_line(index, "SIM1", "ESU5", "BUY", 1, 6000.25, when))
+        elif index % 5_000 == 1:
+            lines.append(format_account_line(f"SIM{index % 7}", when))
+        else:
+            lines.append(format_noise_line(when, f"bid 6000.25 ask 6000.50 seq {index}"))
+    write_log(path, lines)  # the list is dropped here, so GC passes do not walk it while timing
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    fill_every = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output.log"
+        write_session(path, count, fill_every)
+        assert len(text_fills(path)) == len(scanned_fills(path))
+        assert text_accounts(path) == scanned_accounts(path)
+        every, marked = tailed(path), tailed(path, (FILL_MARKER_BYTES, ACCOUNT_MARKER_BYTES))
+        assert (len(every[0]), every[1]) == (len(marked[0]), marked[1])
+
+        timings = {
+            "fills, text lines": lambda: text_fills(path),
+            "fills, byte scan": lambda: scanned_fills(path),
+            "accounts, text lines": lambda: text_accounts(path),
+            "accounts, byte scan": lambda: scanned_accounts(path),
+            "tail, every line": lambda: tailed(path),
+            "tail, marked lines": lambda: tailed(path, (FILL_MARKER_BYTES, ACCOUNT_MARKER_BYTES)),
+        }
+        size_mb = path.stat().st_size / 1e6
+        print(f"lines: {count:,} ({size_mb:.0f} MB, 1 in {fill_every} a fill)  runs: 3 (best)")
+        for label, func in timings.items():
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{label:<22} {best * 1000:8.1f} ms  {size_mb / best:6.0f} MB/s")
+
+        with open(path, "ab") as handle:
+            handle.write(b"09:00:00 INFO ping caf\xe9 \xff\n")
+        print("\nlog with one invalid byte:")
+        for label, func in (("text lines", text_fills), ("byte scan", scanned_fills)):
+            try:
+                print(f"{label:<22} {len(func(path)):,} fills")
+            except UnicodeDecodeError as exc:
+                print(f"{label:<22} aborted: {exc.reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Validation time for N copies of the default preset: `jsonschema.validate()`
+per profile (old path) vs the cached compiled validator, sequential and
+through `AlertConfigManager.validate_profiles`.
+
+    python benchmarks/bench_profile_validation.py [count]
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jsonschema  # noqa: E402
+
+from alert_config_manager import AlertConfigManager  # noqa: E402
+
+REPO_CONFIGS = Path(__file__).resolve().parent.parent / "alert_configs"
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir)
+        shutil.copytree(REPO_CONFIGS / "schemas", config_dir / "schemas")
+        (config_dir / "presets").mkdir()
+        source = REPO_CONFIGS / "presets" / "default.json"
+        for index in range(count):
+            shutil.copy(source, config_dir / "presets" / f"profile_{index:04d}.json")
+
+        manager = AlertConfigManager(config_dir=str(config_dir))
+        names = [entry["name"] for entry in manager.list_profiles()]
+        payloads = []
+        for name in names:
+            with open(manager.get_profile_path(name), "r", encoding="utf-8") as handle:
+                payloads.append(json.load(handle))
+
+        start = time.perf_counter()
+        for payload in payloads:
+            jsonschema.validate(instance=payload, schema=manager.schema)
+        uncached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for payload in payloads:
+            manager.schema_errors(payload)
+        cached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = manager.validate_profiles(names)
+        bulk = time.perf_counter() - start
+        assert not any(results.values())
+
+    print(f"profiles: {len(names):,}")
+    for label, seconds in (
+        ("jsonschema.validate per profile", uncached),
+        ("cached validator", cached),
+        ("validate_profiles (read + validate)", bulk),
+    ):
+        print(f"{label:<38} {seconds * 1000:8.1f} ms  {seconds * 1000 / len(names):6.2f} ms/profile")
+
+
+if __name__ == "__main__":
+    main()
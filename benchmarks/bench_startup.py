@@ -0,0 +1,68 @@
+"""
+Headless cold start: fresh interpreter -> processor built -> first stats
+computed (what app.py does before showing the stats window), over a
+synthetic session log.
+
+    python benchmarks/bench_startup.py [fills] [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tests"))
+
+from fixtures.log_writer import format_account_line, format_fill_line, write_log  # noqa: E402
+
+CHILD = """
+import sys, time
+t0 = time.perf_counter()
+from config import Config
+from trade_stats_processor import TradeStatsProcessor
+t_import = time.perf_counter()
+processor = TradeStatsProcessor(Config())
+t_profile = time.perf_counter()
+paths = sys.argv[1:]
+processor.load_account_names(paths)
+processor.compute_trade_stats(processor.get_fills(paths))
+t_stats = time.perf_counter()
+print(f"{(t_import - t0) * 1000:.1f} {(t_profile - t_import) * 1000:.1f} {(t_stats - t_profile) * 1000:.1f} {(t_stats - t0) * 1000:.1f}")
+"""
+
+
+def write_session(path, fills):
+    start = datetime(2025, 6, 12, 6, 30)
+    lines = [format_account_line("SIM1", start)]
+    for index in range(0, fills, 2):
+        entry = start + timedelta(seconds=20 * index)
+        lines.append(format_fill_line(index + 1, "SIM1", "ESU5", "BUY", 1, 6000.00, entry))
+        lines.append(format_fill_line(index + 2, "SIM1", "ESU5", "SELL", 1, 6001.25, entry + timedelta(seconds=15)))
+    write_log(path, lines)
+
+
+def main():
+    fills = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = Path(temp_dir) / "output-2025-06-12.log"
+        write_session(log_path, fills)
+        samples = []
+        for _ in range(runs):
+            result = subprocess.run(
+                [sys.executable, "-c", CHILD, str(log_path)],
+                cwd=ROOT, capture_output=True, text=True, check=True,
+            )
+            samples.append([float(value) for value in result.stdout.split()[-4:]])
+
+    labels = ("imports", "profile load", "parse + stats", "total")
+    print(f"fills: {fills:,}  runs: {runs} (median ms)")
+    for index, label in enumerate(labels):
+        print(f"{label:<14} {statistics.median(sample[index] for sample in samples):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Memory comparison for 100k TradeGroups and AlertMessages: plain
+@dataclass / namedtuple vs the slotted, frozen value types.
+
+    python benchmarks/bench_value_types.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alert_message import AlertMessage  # noqa: E402
+from concern_level import ConcernLevel  # noqa: E402
+from trade_group import TradeGroup  # noqa: E402
+
+
+@dataclass
+class DictTradeGroup:
+    entry_is_long: bool
+    entry_time: datetime
+    exit_time: datetime
+    max_trade_size: float
+    trade_point: float
+    trade_amount: float
+
+
+TupleAlertMessage = namedtuple(
+    "TupleAlertMessage",
+    ["message", "account", "duration_secs", "min_interval_secs", "level", "extra_msg"],
+)
+
+
+def measure(factory, count):
+    # shared datetimes/floats so only the container overhead is compared
+    entry = datetime(2025, 6, 12, 9, 30)
+    exit_time = entry + timedelta(minutes=3)
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(entry, exit_time) for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = [
+        ("TradeGroup @dataclass", lambda e, x: DictTradeGroup(True, e, x, 2.0, 1.25, 125.0)),
+        ("TradeGroup slots+frozen", lambda e, x: TradeGroup(True, e, x, 2.0, 1.25, 125.0)),
+        ("AlertMessage namedtuple", lambda e, x: TupleAlertMessage("Size down.", "SIM", 60, 600, ConcernLevel.CAUTION, "")),
+        ("AlertMessage slots+frozen", lambda e, x: AlertMessage("Size down.", "SIM", 60, 600, ConcernLevel.CAUTION, "")),
+    ]
+    print(f"objects: {count:,}")
+    for label, factory in rows:
+        used = measure(factory, count)
+        print(f"{label:<27} {used / 1024 / 1024:7.2f} MiB  {used / count:6.1f} bytes/object")
+
+
+if __name__ == "__main__":
+    main()
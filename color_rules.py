@@ -0,0 +1,157 @@
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+from alert_config_manager import SAFE_GLOBALS
+from concern_level import ConcernLevel
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_COLOR = ConcernLevel.DEFAULT.get_color()
+
+# Built-in label colors, in the profile `color_rules` format. A profile that
+# lists a metric replaces that metric's rules; the others keep these. `color`
+# is a ConcernLevel name (mapped to its color) or any Qt color string.
+DEFAULT_COLOR_RULES: List[Dict[str, Any]] = [
+    {
+        "metric": "completed_trades",
+        "rules": [
+            {"when": "completed_trades >= 30", "color": "CRITICAL"},
+            {"when": "completed_trades >= 20 and total_profit_or_loss > 0", "color": "OK"},
+            {"when": "completed_trades >= 20", "color": "WARNING"},
+            {"when": "completed_trades >= 10", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "total_profit_or_loss",
+        "rules": [
+            {"when": "total_profit_or_loss < -2100", "color": "CRITICAL"},
+            {"when": "total_profit_or_loss < -1400", "color": "WARNING"},
+            {"when": "total_profit_or_loss < -700", "color": "CAUTION"},
+            {"when": "total_profit_or_loss >= 1000", "color": "OK"},
+        ],
+    },
+    {
+        "metric": "win_rate",
+        "rules": [
+            {"when": "win_rate <= 25 and profit_factor < 1.0 and completed_trades >= 10", "color": "WARNING"},
+            {"when": "win_rate <= 40 and profit_factor < 1.5 and completed_trades >= 5", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "profit_factor",
+        "rules": [
+            {"when": "profit_factor < 1.0 and completed_trades >= 10", "color": "WARNING"},
+            {"when": "profit_factor < 1.5 and completed_trades >= 5", "color": "CAUTION"},
+            {"when": "profit_factor >= 1.5", "color": "OK"},
+        ],
+    },
+    {
+        "metric": "streak",
+        "rules": [
+            {"when": "streak <= -7", "color": "CRITICAL"},
+            {"when": "streak <= -4", "color": "WARNING"},
+            {"when": "streak <= -2", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "loss_max_size",
+        "rules": [
+            {"when": "loss_max_size >= 10", "color": "WARNING"},
+            {"when": "loss_max_size >= 6", "color": "CAUTION"},
+            {"when": "loss_max_size >= 4 and profit_factor < 1.0 and completed_trades >= 3", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "loss_scaled_count",
+        "rules": [
+            {"when": "loss_scaled_count >= 5", "color": "WARNING"},
+            {"when": "loss_scaled_count >= 3", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "current_drawdown",
+        "rules": [
+            {"when": "current_drawdown < -3000", "color": "CRITICAL"},
+            {"when": "current_drawdown < -2000", "color": "WARNING"},
+            {"when": "current_drawdown < -1000", "color": "CAUTION"},
+        ],
+    },
+    {
+        "metric": "open_position_size",
+        "rules": [{"when": "open_position_size >= 3", "color": "CAUTION"}],
+    },
+    {
+        "metric": "total_points",
+        "rules": [
+            {"when": "total_points > 0", "color": "OK"},
+            {"when": "total_points <= 0", "color": "WARNING"},
+        ],
+    },
+    {
+        "metric": "win_scaled_count",
+        "rules": [{"when": "win_scaled_count >= 2", "color": "OK"}],
+    },
+    {
+        "metric": "between_trades_avg_secs",
+        "rules": [{"when": "between_trades_avg_secs < 60", "color": "WARNING"}],
+    },
+    {
+        "metric": "win_avg_secs",
+        "rules": [{"when": "win_avg_secs < loss_avg_secs", "color": "WARNING"}],
+    },
+    {
+        "metric": "win_max_secs",
+        "rules": [{"when": "win_max_secs < loss_max_secs", "color": "WARNING"}],
+    },
+]
+
+
+def resolve_color(color: str) -> str:
+    """ConcernLevel names ("WARNING") map to the level's color; anything else is used as is."""
+    level = ConcernLevel.__members__.get(color.upper()) if isinstance(color, str) else None
+    return level.get_color() if level is not None else color
+
+
+class ColorRules:
+    """
+    Label colors for the stats rows, compiled once per profile version.
+
+    Each metric's rules are tried in order against a context of numeric stats
+    and the first match's color wins (DEFAULT when none match). Expressions
+    are compiled here, so a refresh only evaluates ready code objects; ones
+    that do not compile are logged and never match.
+    """
+
+    def __init__(self, profile_rules: Iterable[Dict[str, Any]] = (), defaults: Iterable[Dict[str, Any]] = DEFAULT_COLOR_RULES):
+        rules_by_metric = {entry["metric"]: entry.get("rules", []) for entry in defaults}
+        for entry in profile_rules or ():
+            rules_by_metric[entry["metric"]] = entry.get("rules", [])
+
+        self._compiled: Dict[str, List[Tuple[str, Any, str]]] = {}
+        for metric, rules in rules_by_metric.items():
+            compiled = []
+            for rule in rules:
+                expression = rule.get("when", "")
+                try:
+                    code = compile(expression, "<color rule>", "eval")
+                except SyntaxError as exc:
+                    LOGGER.warning("Failed to compile color rule '%s': %s", expression, exc)
+                    continue
+                compiled.append((expression, code, resolve_color(rule.get("color", ""))))
+            self._compiled[metric] = compiled
+
+    @property
+    def metrics(self) -> List[str]:
+        return list(self._compiled)
+
+    def color(self, metric: str, context: Dict[str, Any]) -> str:
+        for expression, code, color in self._compiled.get(metric, ()):
+            try:
+                if eval(code, SAFE_GLOBALS, context):
+                    return color
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("Failed to evaluate color rule '%s': %s", expression, exc)
+        return DEFAULT_COLOR
+
+    def colors(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Color of every metric that has rules."""
+        return {metric: self.color(metric, context) for metric in self._compiled}
@@ -12,10 +12,15 @@ class Config:
         self.alert_min_interval_secs_default = int(self.config['alert']['min_interval_secs_default'])
         self.directory_path = self.config['general']['directory_path']
         self.auto_refresh_ms = int(self.config['general']['auto_refresh_ms'])
+        self.active_refresh_ms = self.config.getint('general', 'active_refresh_ms', fallback=500)
+        self.max_idle_refresh_ms = self.config.getint('general', 'max_idle_refresh_ms', fallback=60000)
+        self.active_refresh_secs = self.config.getint('general', 'active_refresh_secs', fallback=120)
+        self.log_list_max_age_days = self.config.getint('general', 'log_list_max_age_days', fallback=0)
         self.open_trade_duration_notice_mins = int(self.config['alert']['open_trade_duration_notice_mins'])
         self.open_duration_refresh_ms = int(self.config['alert']['open_duration_refresh_ms'])
         self.block_app_on_critical_alerts = self.get_bool('alert', 'block_app_on_critical_alerts')
         self.block_app_name = self.config['alert']['block_app_name']
+        self.hs_path = self.config.get('alert', 'hs_path', fallback='/usr/local/bin/hs')
         self.print_streak_followtrade_stats = self.get_bool('general', 'print_streak_followtrade_stats')
         self.interval_stats_print = self.get_bool('interval_stats', 'print')
         self.interval_stats_min = self.get_int('interval_stats', 'interval_mins')
@@ -67,8 +72,8 @@ class Config:
         return config
 
     def get_contract_value(self, symbol):
-        if symbol in self.symbol_map:
-            return self.symbol_map[symbol]
+        if symbol.lower() in self.symbol_map:  # configparser lowercases option names
+            return self.symbol_map[symbol.lower()]
         elif symbol.startswith('ES'):
             return 50
         elif symbol.startswith('MES'):
@@ -3,4 +3,10 @@ class CONST:
     DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
     LOG_FILENAME_PATTERN = r"output*"
     SELECT_ACCOUNT = "Select Account"
-    ALL_ACCOUNTS = "ALL Accounts"
\ No newline at end of file
+    ALL_ACCOUNTS = "ALL Accounts"
+    # cold start budgets, reported by app.py and enforced (imports) by tests/test_startup.py
+    STARTUP_FIRST_PAINT_BUDGET_MS = 500
+    STARTUP_FIRST_STATS_BUDGET_MS = 2000
+    STARTUP_IMPORT_BUDGET_MS = 250
+    # how often app.py persists the warm start snapshot (also written on quit)
+    SNAPSHOT_INTERVAL_MS = 60_000
@@ -0,0 +1,77 @@
+"""
+Futures contract specs (root, expiry, multiplier), parsed once per symbol.
+
+MotiveWave symbols are CME style: root + month code + 1-2 digit year, e.g.
+`ESU5` or `MESZ25`. Micro contracts belong to the same family as their mini
+(`MES` -> `ES`) so a position scaled across both can be tracked as one trade.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict
+
+SYMBOL_PATTERN = re.compile(r"^([A-Z0-9]+?)([FGHJKMNQUVXZ])(\d{1,2})$")
+MONTH_CODES = "FGHJKMNQUVXZ"
+# micro root -> the mini (or standard) root it tracks
+MICRO_ROOTS = {
+    "MES": "ES",
+    "MNQ": "NQ",
+    "MYM": "YM",
+    "M2K": "RTY",
+    "MGC": "GC",
+    "MCL": "CL",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ContractSpec:
+    symbol: str
+    root: str
+    family: str  # shared by a mini and its micro
+    expiry_month: int  # 1-12, 0 if the symbol has no month code
+    expiry_year: int  # as written in the symbol (1 or 2 digits), 0 if none
+    multiplier: float  # dollars per point per contract
+
+
+def parse_symbol(symbol: str):
+    """(root, expiry month, expiry year); a symbol without a month code is all root."""
+    match = SYMBOL_PATTERN.match(symbol)
+    if not match:
+        return symbol, 0, 0
+    root, month_code, year = match.groups()
+    return root, MONTH_CODES.index(month_code) + 1, int(year)
+
+
+class ContractRegistry:
+    """
+    Symbol -> ContractSpec cache in front of `Config.get_contract_value`.
+
+    The multiplier lookup (and its prefix fallbacks) runs once per distinct
+    symbol instead of once per closed trade.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._specs: Dict[str, ContractSpec] = {}
+
+    def __getstate__(self):
+        # specs are kept; the config is re-attached by the owner after unpickling
+        return {"config": None, "_specs": self._specs}
+
+    def spec(self, symbol: str) -> ContractSpec:
+        spec = self._specs.get(symbol)
+        if spec is None:
+            root, expiry_month, expiry_year = parse_symbol(symbol)
+            spec = ContractSpec(
+                symbol,
+                root,
+                MICRO_ROOTS.get(root, root),
+                expiry_month,
+                expiry_year,
+                self.config.get_contract_value(symbol),
+            )
+            self._specs[symbol] = spec
+        return spec
+
+    def multiplier(self, symbol: str) -> float:
+        return self.spec(symbol).multiplier
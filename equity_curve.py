@@ -0,0 +1,98 @@
+import datetime
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from fill_store import EPOCH
+from trade_group import TradeGroup
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class EquityCurve:
+    """
+    Cumulative realized P/L after each closed trade, with the running peak and
+    drawdown (cumulative - peak, always <= 0) precomputed alongside it.
+
+    Peak starts at 0 to match the "Peak P/L" stat, so losses from the first
+    trade onward already count as drawdown.
+    """
+
+    def __init__(self):
+        self.exit_secs = array("q")  # exit time, seconds since 1970-01-01 (naive)
+        self.cumulative = array("d")
+        self.peak = array("d")
+        self.drawdown = array("d")
+        self.max_drawdown = 0.0
+        self._downsample_cache: Dict[int, Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_trade_groups(cls, trade_groups: Iterable[TradeGroup]) -> "EquityCurve":
+        curve = cls()
+        for trade_group in trade_groups:
+            curve.append(trade_group.exit_time, trade_group.trade_amount)
+        return curve
+
+    def __len__(self) -> int:
+        return len(self.cumulative)
+
+    def append(self, exit_time: datetime.datetime, trade_amount: float) -> None:
+        total = (self.cumulative[-1] if self.cumulative else 0.0) + trade_amount
+        peak = max(self.peak[-1] if self.peak else 0.0, total)
+        drawdown = total - peak
+
+        self.exit_secs.append(int((exit_time - EPOCH).total_seconds()))
+        self.cumulative.append(total)
+        self.peak.append(peak)
+        self.drawdown.append(drawdown)
+        self.max_drawdown = min(self.max_drawdown, drawdown)
+        self._downsample_cache.clear()
+
+    def exit_time(self, index: int) -> datetime.datetime:
+        return EPOCH + datetime.timedelta(seconds=self.exit_secs[index])
+
+    def downsample(self, max_points: int) -> Tuple[int, ...]:
+        """
+        Indices of at most `max_points` (at least 4) points that keep the curve's shape.
+
+        The curve is split into max_points // 4 buckets and each bucket keeps its
+        first, last, lowest and highest point (M4), so peaks and drawdown troughs
+        survive any amount of reduction. Results are cached until the next append.
+        """
+        if max_points < 4:
+            raise ValueError(f"max_points must be at least 4, got {max_points}")
+        count = len(self.cumulative)
+        if count <= max_points:
+            return tuple(range(count))
+        cached = self._downsample_cache.get(max_points)
+        if cached is not None:
+            return cached
+
+        buckets = max_points // 4
+        values = self.cumulative
+        indices: List[int] = []
+        for bucket in range(buckets):
+            start = bucket * count // buckets
+            end = (bucket + 1) * count // buckets
+            if start >= end:
+                continue
+            segment = values[start:end]
+            low = start + segment.index(min(segment))
+            high = start + segment.index(max(segment))
+            indices.extend(sorted({start, low, high, end - 1}))
+
+        self._downsample_cache[max_points] = cached = tuple(indices)
+        return cached
+
+    def points(self, max_points: int) -> List[Tuple[datetime.datetime, float]]:
+        return [(self.exit_time(i), self.cumulative[i]) for i in self.downsample(max_points)]
+
+    def sparkline(self, width: int = 40) -> str:
+        values = [self.cumulative[i] for i in self.downsample(width)]
+        if not values:
+            return ""
+        low = min(values)
+        span = max(values) - low
+        if span == 0:
+            return SPARK_CHARS[0] * len(values)
+        scale = (len(SPARK_CHARS) - 1) / span
+        return "".join(SPARK_CHARS[int((value - low) * scale)] for value in values)
@@ -1,16 +1,91 @@
 import re
 import os
+import threading
+import time
+from functools import lru_cache
 
-def get_most_recent_file(directory, pattern):
-    files = [f for f in os.listdir(directory) if re.match(pattern, f)]
-    if not files:
-        return None
-    files_with_paths = [os.path.join(directory, f) for f in files]
-    most_recent = max(files_with_paths, key=os.path.getmtime)
-    return most_recent
-
-def get_all_matching_files(directory, pattern):
-    files = [f for f in os.listdir(directory) if re.match(pattern, f)]
-    files_with_paths = [os.path.join(directory, f) for f in files]
-    files_with_paths.sort(key=os.path.getmtime, reverse=True)
-    return files_with_paths
+# Logs that were written to within this long of a scan may still be growing,
+# so their mtimes are re-read on a cache hit; older logs are treated as final.
+LIVE_WINDOW_SECS = 24 * 60 * 60
+
+# directory -> (directory st_mtime_ns, scan time, [(name, path, file mtime)])
+_listing_cache = {}
+_listing_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _compile(pattern):
+    return re.compile(pattern)
+
+
+def _scan(directory):
+    listing = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    listing.append((entry.name, entry.path, entry.stat().st_mtime))
+            except OSError:
+                continue  # removed while scanning
+    return listing
+
+
+def _list_files(directory):
+    """
+    Every regular file in `directory` as (name, path, mtime).
+
+    One `os.scandir` pass reusing each `DirEntry.stat()` result. The listing is
+    cached until the directory's own mtime changes (a file was created,
+    renamed or deleted). Appending to a log does not change the directory, so
+    on a cache hit only the files still inside LIVE_WINDOW_SECS are re-stat'ed.
+    """
+    directory_mtime = os.stat(directory).st_mtime_ns
+    with _listing_lock:
+        cached = _listing_cache.get(directory)
+
+    if cached is None or cached[0] != directory_mtime:
+        listing = _scan(directory)
+        with _listing_lock:
+            _listing_cache[directory] = (directory_mtime, time.time(), listing)
+        return listing
+
+    _, scanned_at, listing = cached
+    live_after = scanned_at - LIVE_WINDOW_SECS
+    refreshed = []
+    for name, path, mtime in listing:
+        if mtime >= live_after:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+        refreshed.append((name, path, mtime))
+    return refreshed
+
+
+def clear_listing_cache():
+    with _listing_lock:
+        _listing_cache.clear()
+
+
+def get_most_recent_file(directory, pattern, since=None, until=None):
+    files = get_all_matching_files(directory, pattern, since, until)
+    return files[0] if files else None
+
+
+def get_all_matching_files(directory, pattern, since=None, until=None):
+    """
+    Paths in `directory` whose names match `pattern` (re.match), newest first.
+
+    `since`/`until` (datetimes, either optional) keep only the files last
+    modified in that range, so the selector doesn't have to list years of logs.
+    """
+    match = _compile(pattern).match
+    since_ts = since.timestamp() if since else float("-inf")
+    until_ts = until.timestamp() if until else float("inf")
+    files = [
+        (mtime, path)
+        for name, path, mtime in _list_files(directory)
+        if match(name) and since_ts <= mtime <= until_ts
+    ]
+    files.sort(reverse=True)
+    return [path for _, path in files]
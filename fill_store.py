@@ -0,0 +1,208 @@
+"""
+Columnar, array-backed storage for parsed fills.
+
+A `Trade` namedtuple per fill costs roughly 510 bytes once the tuple, its
+boxed floats/ints, the `datetime`, the per-line account/contract/order type
+strings and the `(account, order_id)` dict key are counted.  `FillStore` keeps
+one typed `array` per field instead and interns account names and contract
+symbols into small lookup tables, so a fill costs:
+
+    account index   uint16    2 bytes
+    symbol index    uint16    2 bytes
+    side            int8      1 byte
+    quantity        float64   8 bytes
+    fill price      float64   8 bytes
+    fill time       int64     8 bytes  (seconds since 1970-01-01, naive)
+    order id        int64     8 bytes
+    stop price      float64   8 bytes  (NaN unless a stop order)
+                             --------
+                             45 bytes  + ~100 bytes for the dedup index entry
+
+Measured with `benchmarks/bench_fill_store.py` at 200k fills this is about
+3.5x less memory than the namedtuple list plus `unique_trades_dict`, and it
+creates no per-fill objects for the garbage collector to track.
+
+Existing callers keep working through the namedtuple-compatible view:
+iterating a store (or `for_account`) yields `Trade` tuples built on demand.
+"""
+
+import math
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from trade import Trade
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+ONE_SECOND = timedelta(seconds=1)
+
+SIDE_BUY = 1
+SIDE_SELL = -1
+ORDER_TYPE_BY_SIDE = {SIDE_BUY: "Filled BUY", SIDE_SELL: "Filled SELL"}
+SIDE_BY_ORDER_TYPE = {value: key for key, value in ORDER_TYPE_BY_SIDE.items()}
+
+
+def to_epoch_seconds(value: datetime) -> int:
+    return (value - EPOCH) // ONE_SECOND
+
+
+def from_epoch_seconds(value: int) -> datetime:
+    return EPOCH + timedelta(seconds=value)
+
+
+class FillStore:
+    """Deduplicated fills keyed by (account, order_id), stored column-wise."""
+
+    def __init__(self):
+        self.account_names: List[str] = []
+        self.symbols: List[str] = []
+        self._account_ids: Dict[str, int] = {}
+        self._symbol_ids: Dict[str, int] = {}
+        # one order_id -> row dict per account index keeps keys as plain ints
+        self._rows_by_order: List[Dict[int, int]] = []
+
+        self.account_idx = array("H")
+        self.symbol_idx = array("H")
+        self.side = array("b")
+        self.quantity = array("d")
+        self.fill_price = array("d")
+        self.fill_second = array("q")
+        self.order_id = array("q")
+        self.stop_price = array("d")
+
+    def __len__(self) -> int:
+        return len(self.order_id)
+
+    def __iter__(self) -> Iterator[Trade]:
+        for row in range(len(self.order_id)):
+            yield self.trade(row)
+
+    def __getitem__(self, row: int) -> Trade:
+        if row < 0:
+            row += len(self.order_id)
+        if not 0 <= row < len(self.order_id):
+            raise IndexError("fill index out of range")
+        return self.trade(row)
+
+    def _intern_account(self, account_name: str) -> int:
+        account_id = self._account_ids.get(account_name)
+        if account_id is None:
+            account_id = len(self.account_names)
+            self.account_names.append(account_name)
+            self._account_ids[account_name] = account_id
+            self._rows_by_order.append({})
+        return account_id
+
+    def _intern_symbol(self, contract_symbol: str) -> int:
+        symbol_id = self._symbol_ids.get(contract_symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbols.append(contract_symbol)
+            self._symbol_ids[contract_symbol] = symbol_id
+        return symbol_id
+
+    def add(
+        self,
+        account_name: str,
+        order_id: int,
+        order_type: str,
+        contract_symbol: str,
+        quantity: float,
+        fill_price: float,
+        fill_time: datetime,
+        stop_price: Optional[float] = None,
+    ) -> int:
+        """
+        Adds a fill, replacing any earlier fill with the same account and order id.
+
+        Returns:
+            The row index of the fill.
+        """
+        return self.add_at_second(
+            account_name,
+            order_id,
+            order_type,
+            contract_symbol,
+            quantity,
+            fill_price,
+            to_epoch_seconds(fill_time),
+            stop_price,
+        )
+
+    def add_at_second(
+        self,
+        account_name: str,
+        order_id: int,
+        order_type: str,
+        contract_symbol: str,
+        quantity: float,
+        fill_price: float,
+        fill_second: int,
+        stop_price: Optional[float] = None,
+    ) -> int:
+        """`add` with the fill time already in epoch seconds (what the log parser produces)."""
+        account_id = self._intern_account(account_name)
+        symbol_id = self._intern_symbol(contract_symbol)
+        side = SIDE_BY_ORDER_TYPE[order_type]
+        if stop_price is None:
+            stop_price = math.nan
+
+        rows = self._rows_by_order[account_id]
+        row = rows.get(order_id)
+        if row is not None:
+            self.symbol_idx[row] = symbol_id
+            self.side[row] = side
+            self.quantity[row] = quantity
+            self.fill_price[row] = fill_price
+            self.fill_second[row] = fill_second
+            self.stop_price[row] = stop_price
+            return row
+
+        row = len(self.order_id)
+        rows[order_id] = row
+        self.account_idx.append(account_id)
+        self.symbol_idx.append(symbol_id)
+        self.side.append(side)
+        self.quantity.append(quantity)
+        self.fill_price.append(fill_price)
+        self.fill_second.append(fill_second)
+        self.order_id.append(order_id)
+        self.stop_price.append(stop_price)
+        return row
+
+    def trade(self, row: int) -> Trade:
+        stop_price = self.stop_price[row]
+        return Trade(
+            self.account_names[self.account_idx[row]],
+            self.order_id[row],
+            ORDER_TYPE_BY_SIDE[self.side[row]],
+            self.symbols[self.symbol_idx[row]],
+            self.quantity[row],
+            self.fill_price[row],
+            from_epoch_seconds(self.fill_second[row]),
+            None if math.isnan(stop_price) else stop_price,
+        )
+
+    def accounts_with_fills(self) -> List[str]:
+        return [
+            name
+            for account_id, name in enumerate(self.account_names)
+            if self._rows_by_order[account_id]
+        ]
+
+    def for_account(self, account_name: str) -> List[Trade]:
+        account_id = self._account_ids.get(account_name)
+        if account_id is None:
+            return []
+        return [self.trade(row) for row in self._rows_by_order[account_id].values()]
+
+    def rows_for_account(self, account_name: str) -> List[int]:
+        """Row indices of an account's fills, in the order `for_account` returns them."""
+        account_id = self._account_ids.get(account_name)
+        if account_id is None:
+            return []
+        return list(self._rows_by_order[account_id].values())
+
+    def clear(self) -> None:
+        self.__init__()
@@ -6,18 +6,28 @@ import urllib.parse
 import os
 
 from urllib.parse import quote
+from alert_throttle import AlertThrottle, DEFAULT_MAX_ENTRIES
 from concern_level import ConcernLevel
 
+DEFAULT_HS_PATH = "/usr/local/bin/hs"
+
 class HammerspoonAlertManager:
     """
     Manages Hammerspoon alerts with account-specific display limits.
     """
-    def __init__(self):
+    def __init__(self, max_throttle_entries: int = DEFAULT_MAX_ENTRIES, hs_path: str = DEFAULT_HS_PATH):
         self._lock = threading.Lock()
-        self._account_message_data = {}  # Store display data per account and message
+        self.hs_path = hs_path
+        self._throttle = AlertThrottle(max_throttle_entries)  # next display time per (account, condition id)
+        self._pending_lock = threading.Lock()
+        self._pending = set()  # (account, throttle key) of throttled alerts on their way to hs
         self._last_event_call = {}  # Store last call time per event name
 
-    def trigger_event(self, event_name: str, params: dict = None, min_interval_secs: int = 60):
+    @property
+    def throttle(self) -> AlertThrottle:
+        return self._throttle
+
+    def trigger_event(self, event_name: str, params: dict = None, min_interval_secs: int = 60, on_done=None):
         """
         Triggers a Hammerspoon event via its URL scheme, respecting the minimum interval.
 
@@ -25,10 +35,11 @@ class HammerspoonAlertManager:
             event_name: The name of the Hammerspoon event to trigger.
             params: A dictionary of parameters to pass with the event. These will be URL-encoded.
             min_interval_secs: Minimum interval in seconds since the last call for this event name.
+            on_done: Called (on the event thread) once the event has been sent.
         """
-        threading.Thread(target=self._trigger_event_thread, args=(event_name, params, min_interval_secs)).start()
+        threading.Thread(target=self._trigger_event_thread, args=(event_name, params, min_interval_secs, on_done)).start()
 
-    def _trigger_event_thread(self, event_name: str, params: dict, min_interval_secs: int):
+    def _trigger_event_thread(self, event_name: str, params: dict, min_interval_secs: int, on_done=None):
         with self._lock:
             now = datetime.datetime.now()
 
@@ -49,21 +60,24 @@ class HammerspoonAlertManager:
                 try:
                     subprocess.run([open_path, "-g", url], check=True)
                     self._last_event_call[event_name] = now
+                    if on_done:
+                        on_done()
                 except subprocess.CalledProcessError as e:
                     print(f"Error triggering Hammerspoon event '{event_name}': {e}")
             else:
                 print(f"Error: '{open_path}' not found.")
 
-    def _execute_hammerspoon_lua(self, lua_code: str):
-        """Executes Lua code in Hammerspoon using hammerspoon_bridge with -c."""
+    def _execute_hammerspoon_lua(self, lua_code: str) -> bool:
+        """Executes Lua code in Hammerspoon using hammerspoon_bridge with -c; returns True on success."""
         try:
             # print(f'lua {lua_code}')
-            hs_path = "/usr/local/bin/hs"
-            subprocess.run([hs_path,'-c', lua_code], check=True)
-        except subprocess.CalledProcessError as e:
+            subprocess.run([self.hs_path,'-c', lua_code], check=True)
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
             print(f"Error executing Hammerspoon Lua: {e}")
+            return False
 
-    def display_alert(self, message: str, account: str, duration_secs: float = 2.0, min_interval_secs: int = 0, concern_level: ConcernLevel = ConcernLevel.DEFAULT, extra_msg: str = ""):
+    def display_alert(self, message: str, account: str, duration_secs: float = 2.0, min_interval_secs: int = 0, concern_level: ConcernLevel = ConcernLevel.DEFAULT, extra_msg: str = "", throttle_key: str = "", on_shown=None) -> bool:
         """
         Displays a Hammerspoon alert with account-specific display limits.
 
@@ -71,41 +85,48 @@ class HammerspoonAlertManager:
             message: The message to display.
             account: The account associated with the message.
             duration_secs: The duration of the alert in seconds.
-            min_interval_secs: Minimum interval in seconds between displaying the same message per account.
+            min_interval_secs: Minimum interval in seconds between displaying the same alert per account.
             concern_level: The level of concern associated with the message (default: ConcernLevel.DEFAULT).
             extra_msg: An extra message to display but will not have an effect on interval between displaying same message per account.
-        """
-        threading.Thread(target=self._display_alert_thread, args=(message, account, duration_secs, min_interval_secs, concern_level, extra_msg)).start()
+            throttle_key: What counts as "the same alert" (e.g. the condition id); defaults to the message text.
+            on_shown: Called (on the alert thread) once hs has shown the alert.
 
-    def _display_alert_thread(self, message: str, account: str, duration_secs: float, min_interval_secs: int, concern_level: ConcernLevel, extra_msg: str):
+        Returns:
+            False if the alert was throttled (or the same alert is still being sent).
+        """
+        # throttled alerts are dropped here, before a thread or hs process is spawned;
+        # the interval only starts once hs has shown the alert, so a failed display is retried
+        entry_key = (account, throttle_key or message)
+        if min_interval_secs > 0:
+            with self._pending_lock:
+                if entry_key in self._pending or self._throttle.is_throttled(*entry_key):
+                    return False
+                self._pending.add(entry_key)
+        threading.Thread(target=self._display_alert_thread, args=(message, duration_secs, concern_level, extra_msg, on_shown, entry_key, min_interval_secs)).start()
+        return True
+
+    def _display_alert_thread(self, message: str, duration_secs: float, concern_level: ConcernLevel, extra_msg: str, on_shown=None, entry_key=None, min_interval_secs: int = 0):
+        shown = False
+        try:
+            shown = self._show_alert(message, duration_secs, concern_level, extra_msg)
+        finally:
+            if min_interval_secs > 0:
+                with self._pending_lock:
+                    if shown:
+                        self._throttle.record(*entry_key, min_interval_secs)
+                    self._pending.discard(entry_key)
+        if shown and on_shown:
+            on_shown()
+
+    def _show_alert(self, message: str, duration_secs: float, concern_level: ConcernLevel, extra_msg: str) -> bool:
         with self._lock:
-            now = datetime.datetime.now()
-
-            # Get or create account-specific message data
-            if account not in self._account_message_data:
-                self._account_message_data[account] = {}
-            if message not in self._account_message_data[account]:
-                self._account_message_data[account][message] = {
-                    "last_display_time": None,
-                }
-            message_info = self._account_message_data[account][message]
-
-            # Check min_interval limit
-            if message_info["last_display_time"] and min_interval_secs > 0:
-                time_since_last_display = (now - message_info["last_display_time"]).total_seconds()
-                if time_since_last_display < min_interval_secs:
-                    return
-
             # Display the alert via hammerspoon_bridge
             # alert_customization = "{ }"
             fill_color = self.get_fill_color(concern_level)
             alert_customization = "{ fillColor = " + fill_color + ", textColor = { white=0.1, alpha=1 }, radius = 20, textSize = 40, padding = 30}"
 
             lua_code = f'hs.alert.show("{message} {extra_msg}", {alert_customization}, hs.screen.primaryScreen(), {duration_secs})'
-            self._execute_hammerspoon_lua(lua_code)
-
-            # Update message data
-            message_info["last_display_time"] = now
+            return self._execute_hammerspoon_lua(lua_code)
 
     def get_fill_color(self, level: ConcernLevel):
         if level == ConcernLevel.CRITICAL:
@@ -0,0 +1,63 @@
+from latency_tracker import HISTOGRAM_EDGES_SECS, STAGES, LatencyTracker
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QVBoxLayout,
+)
+from PyQt6.QtGui import QFont
+
+
+def format_histogram(tracker: LatencyTracker, stage: str) -> str:
+    labels = [f"<={edge:g}s" for edge in HISTOGRAM_EDGES_SECS] + [f">{HISTOGRAM_EDGES_SECS[-1]:g}s"]
+    counts = tracker.histogram(stage)
+    return "  ".join(f"{label}:{count}" for label, count in zip(labels, counts) if count)
+
+
+class LatencyDisplay(QDialog):
+    """Fill-to-alert latency percentiles and histograms, with JSON export."""
+
+    def __init__(self, tracker: LatencyTracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.initUI()
+
+    def initUI(self):
+        self.setWindowTitle("Fill to Alert Latency")
+
+        self.summary_label = QLabel()
+        font = QFont("Courier New")
+        font.setPointSize(14)
+        self.summary_label.setFont(font)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.update_summary)
+        export_button = QPushButton("Export")
+        export_button.clicked.connect(self.export)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(refresh_button)
+        buttons.addWidget(export_button)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.summary_label)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+        self.update_summary()
+
+    def update_summary(self):
+        lines = [self.tracker.format_summary(), ""]
+        for stage in STAGES:
+            histogram = format_histogram(self.tracker, stage)
+            if histogram:
+                lines.append(f"{stage:<9} {histogram}")
+        self.summary_label.setText("\n".join(lines))
+        self.adjustSize()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Latency", "latency.json", "JSON Files (*.json)")
+        if path:
+            self.tracker.export(path)
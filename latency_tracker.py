@@ -0,0 +1,162 @@
+"""
+Fill-to-alert latency: how long after MotiveWave writes a fill line the app
+has parsed it, updated the stats, evaluated the alerts and shown the alert
+(or blocked the trading app).
+
+Every live fill is tagged with the wall-clock time of its log line (the
+HH:MM:SS prefix, so one second resolution) and its ingest time. The stages
+below are measured from the log line time:
+
+    ingest    line parsed into the fill store
+    stats     account stats updated with the fill
+    evaluate  alerts evaluated on those stats
+    dispatch  Hammerspoon alert shown (hs returned)
+    block     block-app event sent
+
+Samples are kept per stage in a bounded window; `summary` gives count and
+p50/p95/p99, `histogram` bucket counts, and `export` writes both as JSON.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+STAGES = ("ingest", "stats", "evaluate", "dispatch", "block")
+PERCENTILES = (50, 95, 99)
+MAX_SAMPLES = 5_000
+# lines older than this when read (catch-up after a restore or sleep) say nothing about latency
+MAX_TRACKED_AGE_SECS = 300
+HISTOGRAM_EDGES_SECS = (0.25, 0.5, 1, 2, 5, 10, 30, 60)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def log_line_timestamp(line_seconds: int, fill_time: datetime) -> float:
+    """
+    Epoch time of a log line from its time-of-day prefix (seconds since
+    midnight) and its fill's "Last Fill Time" for the date, allowing for a
+    fill that straddles midnight.
+    """
+    day = datetime(fill_time.year, fill_time.month, fill_time.day).timestamp()
+    fill_seconds = fill_time.hour * 3600 + fill_time.minute * 60
+    if line_seconds - fill_seconds > 12 * 3600:
+        day -= 86_400
+    elif fill_seconds - line_seconds > 12 * 3600:
+        day += 86_400
+    return day + line_seconds
+
+
+class LatencyTracker:
+    """Per-stage latency samples for live fills, from log line to alert."""
+
+    def __init__(self, max_samples: int = MAX_SAMPLES, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()  # dispatch callbacks arrive on alert threads
+        self.samples: Dict[str, Deque[float]] = {stage: deque(maxlen=max_samples) for stage in STAGES}
+        # log line times of fills not yet through evaluation / dispatch, per account
+        self._pending: Dict[str, List[float]] = defaultdict(list)
+        self._awaiting_dispatch: Dict[str, List[float]] = {}
+
+    def record_ingest(self, accounts: Sequence[str], log_ts: float, ingest_ts: Optional[float] = None) -> bool:
+        """Tags a freshly parsed fill; returns False (not tracked) if its line is stale."""
+        ingest_ts = self._clock() if ingest_ts is None else ingest_ts
+        age = ingest_ts - log_ts
+        if age > MAX_TRACKED_AGE_SECS:
+            return False
+        with self._lock:
+            self.samples["ingest"].append(max(0.0, age))
+            for account in accounts:
+                self._pending[account].append(log_ts)
+        return True
+
+    def has_pending(self, account: str) -> bool:
+        return bool(self._pending.get(account))
+
+    def record_stats(self, account: str, now: Optional[float] = None) -> None:
+        self._record("stats", self._pending.get(account, ()), now)
+
+    def record_evaluated(self, account: str, alerted: bool, now: Optional[float] = None) -> None:
+        """Closes the account's pending fills; they wait for dispatch only if an alert matched."""
+        with self._lock:
+            pending = self._pending.pop(account, [])
+        self._record("evaluate", pending, now)
+        if alerted and pending:
+            self._awaiting_dispatch[account] = pending
+        else:
+            self._awaiting_dispatch.pop(account, None)
+
+    def take_awaiting_dispatch(self, account: str) -> List[float]:
+        """Log times of the fills behind the account's current alerts (each taken once)."""
+        return self._awaiting_dispatch.pop(account, [])
+
+    def on_done(self, stage: str, log_times: Sequence[float]) -> Optional[Callable[[], None]]:
+        """A callback recording `stage` for `log_times` when called (None if there is nothing to record)."""
+        if not log_times:
+            return None
+        return lambda: self._record(stage, log_times)
+
+    def _record(self, stage: str, log_times, now: Optional[float] = None) -> None:
+        if not log_times:
+            return
+        now = self._clock() if now is None else now
+        with self._lock:
+            self.samples[stage].extend(max(0.0, now - log_ts) for log_ts in log_times)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per stage: sample count and p50/p95/p99 in seconds."""
+        result = {}
+        with self._lock:
+            snapshot = {stage: sorted(values) for stage, values in self.samples.items()}
+        for stage, values in snapshot.items():
+            row = {"count": len(values)}
+            for pct in PERCENTILES:
+                row[f"p{pct}"] = percentile(values, pct)
+            result[stage] = row
+        return result
+
+    def histogram(self, stage: str, edges: Sequence[float] = HISTOGRAM_EDGES_SECS) -> List[int]:
+        """Sample counts per bucket: <= edges[0], ..., <= edges[-1], and above."""
+        counts = [0] * (len(edges) + 1)
+        with self._lock:
+            values = list(self.samples[stage])
+        for value in values:
+            index = 0
+            while index < len(edges) and value > edges[index]:
+                index += 1
+            counts[index] += 1
+        return counts
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<9} {'count':>6} {'p50':>7} {'p95':>7} {'p99':>7}"]
+        for stage, row in self.summary().items():
+            lines.append(
+                f"{stage:<9} {row['count']:>6} {row['p50']:>6.2f}s {row['p95']:>6.2f}s {row['p99']:>6.2f}s"
+            )
+        return "\n".join(lines)
+
+    def export(self, path) -> Path:
+        """Writes the summary, histograms and raw samples (seconds) as JSON."""
+        path = Path(path)
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self.samples.items()}
+        payload = {
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "summary": self.summary(),
+            "histogram_edges_secs": list(HISTOGRAM_EDGES_SECS),
+            "histograms": {stage: self.histogram(stage) for stage in STAGES},
+            "samples": samples,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        return path
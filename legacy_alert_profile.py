@@ -0,0 +1,195 @@
+"""
+The hard-coded alert thresholds, as a built-in profile.
+
+Used when no JSON profile can be loaded. It goes through the same compiled
+`ConditionEvaluator` and lazy message templates as a JSON profile, and its
+`color_rules` are the built-in label colors. Conditions are listed in the
+order alerts were always reported (losing streak, drawdown, P/L, trade count,
+win rate, profit factor, loss size, scaled losses); within a group the first
+match wins.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from alert_config_manager import ConditionEvaluator
+from color_rules import DEFAULT_COLOR_RULES
+from streak import Streak
+
+
+def _condition(condition_id, group, when, level, message, extra_message=""):
+    return {
+        "id": f"legacy-{condition_id}",
+        "group": group,
+        "when": when,
+        "level": level,
+        "message": message,
+        "extra_message": extra_message,
+        "enabled": True,
+    }
+
+
+LEGACY_PROFILE: Dict[str, Any] = {
+    "schema_version": "1.0",
+    "id": "legacy",
+    "name": "Legacy Risk Controls",
+    "description": "Built-in thresholds used when no JSON profile loads",
+    "metadata": {"created_by": "trading-stats-tracker", "created_at": "2025-01-01T00:00:00Z", "source": "repo"},
+    "context_fields": {
+        "required": [
+            "completed_trades",
+            "total_profit_or_loss",
+            "profit_factor",
+            "win_rate",
+            "directional_bias_extramsg",
+            "streak_tracker",
+            "streak_extramsg",
+            "loss_max_size",
+            "loss_scaled_count",
+            "current_drawdown",
+        ]
+    },
+    "conditions": [
+        _condition(
+            "losing-streak-stop-now",
+            "losing_streak",
+            "streak_tracker.streak <= -7",
+            "CRITICAL",
+            "Stop Now. Protect the version of YOU that will trade well tomorrow.",
+        ),
+        _condition("losing-streak-stop", "losing_streak", "streak_tracker.streak <= -4", "WARNING", "Stop. Follow Reset plan."),
+        _condition(
+            "losing-streak-slow-down",
+            "losing_streak",
+            "streak_tracker.streak <= -2",
+            "CAUTION",
+            "Slow down. Consecutive losses. {streak_extramsg}",
+        ),
+        _condition(
+            "drawdown-max", "drawdown", "current_drawdown < -3000", "CRITICAL", "Stop Now. Maximum drawdown.", "{current_drawdown:+,}"
+        ),
+        _condition(
+            "drawdown-large", "drawdown", "current_drawdown < -2000", "WARNING", "Reset. Large drawdown.", "{current_drawdown:+,}"
+        ),
+        _condition(
+            "drawdown-notable", "drawdown", "current_drawdown < -1000", "CAUTION", "Slow down. Notable drawdown.", "{current_drawdown:+,}"
+        ),
+        _condition(
+            "pnl-stop",
+            "profit_loss",
+            "total_profit_or_loss < -2100",
+            "CRITICAL",
+            "Stop. Protect your capital.",
+            "{total_profit_or_loss:+,.0f}",
+        ),
+        _condition(
+            "pnl-pause",
+            "profit_loss",
+            "total_profit_or_loss < -1400",
+            "WARNING",
+            "Pause. Reset first, then recover.",
+            "{total_profit_or_loss:+,.0f}",
+        ),
+        _condition(
+            "pnl-slow-down",
+            "profit_loss",
+            "total_profit_or_loss < -700",
+            "CAUTION",
+            "Slow down. Manage loss by managing risk.",
+            "{total_profit_or_loss:+,.0f}",
+        ),
+        _condition(
+            "pnl-protect-gains", "profit_loss", "total_profit_or_loss >= 1000", "OK", "Wind down. Protect gains.", "{total_profit_or_loss:+,.0f}"
+        ),
+        _condition(
+            "trade-count-max", "trade_count", "completed_trades >= 30", "CRITICAL", "Stop. Maximum trades for the day reached.", "{completed_trades}"
+        ),
+        _condition(
+            "trade-count-goal-positive",
+            "trade_count",
+            "completed_trades >= 20 and total_profit_or_loss > 0",
+            "OK",
+            "Wind down. You've reached your trade count goal.",
+            "{completed_trades}",
+        ),
+        _condition(
+            "trade-count-goal",
+            "trade_count",
+            "completed_trades >= 20",
+            "WARNING",
+            "Wind down. You've reached your trade count goal.",
+            "{completed_trades}",
+        ),
+        _condition(
+            "trade-count-slow-down", "trade_count", "completed_trades >= 10", "CAUTION", "Slow down. Take quality trades only.", "{completed_trades}"
+        ),
+        _condition(
+            "win-rate-very-low",
+            "win_rate",
+            "win_rate <= 25 and profit_factor < 1.0 and completed_trades >= 10",
+            "WARNING",
+            "Reset. Win Rate very low.",
+            "{directional_bias_extramsg}",
+        ),
+        _condition(
+            "win-rate-low",
+            "win_rate",
+            "win_rate <= 40 and profit_factor < 1.5 and completed_trades >= 5",
+            "CAUTION",
+            "Slow down. Win Rate low.",
+            "{directional_bias_extramsg}",
+        ),
+        _condition(
+            "profit-factor-very-low",
+            "profit_factor",
+            "profit_factor < 1.0 and completed_trades >= 10",
+            "WARNING",
+            "Reset. Profit Factor very low.",
+            "{directional_bias_extramsg}",
+        ),
+        _condition(
+            "profit-factor-low",
+            "profit_factor",
+            "profit_factor < 1.5 and completed_trades >= 5",
+            "CAUTION",
+            "Slow down. Profit Factor low.",
+            "{directional_bias_extramsg}",
+        ),
+        _condition("loss-size-reset", "loss_max_size", "loss_max_size >= 10", "WARNING", "Reset. Size down."),
+        _condition("loss-size-large", "loss_max_size", "loss_max_size >= 6", "CAUTION", "Size down."),
+        _condition(
+            "loss-size-losing", "loss_max_size", "loss_max_size >= 4 and profit_factor < 1.0 and completed_trades >= 3", "CAUTION", "Size down."
+        ),
+        _condition("scaled-losses-reset", "loss_scaled_count", "loss_scaled_count >= 5", "WARNING", "Reset. Scale up winners only."),
+        _condition("scaled-losses", "loss_scaled_count", "loss_scaled_count >= 3", "CAUTION", "Scale up winners only."),
+    ],
+    "color_rules": DEFAULT_COLOR_RULES,
+}
+
+# what the old code assumed for fields missing from (or None in) a partial context
+LEGACY_CONTEXT_DEFAULTS: Dict[str, Any] = {
+    "completed_trades": 0,
+    "total_profit_or_loss": 0,
+    "profit_factor": 1,
+    "win_rate": 0,
+    "loss_scaled_count": 0,
+    "loss_max_size": 0,
+    "current_drawdown": 0,
+    "directional_bias_extramsg": "",
+    "streak_tracker": Streak(),
+    "streak_extramsg": "",
+}
+
+
+@lru_cache(maxsize=None)
+def legacy_evaluator() -> ConditionEvaluator:
+    """The built-in profile's evaluator, compiled on first use and shared by every processor."""
+    return ConditionEvaluator(LEGACY_PROFILE)
+
+
+def with_legacy_defaults(context: Dict[str, Any]) -> Dict[str, Any]:
+    """`context`, or a copy with the defaults filled in if any legacy field is missing."""
+    missing = [field for field in LEGACY_CONTEXT_DEFAULTS if context.get(field) is None]
+    if not missing:
+        return context
+    return {**context, **{field: LEGACY_CONTEXT_DEFAULTS[field] for field in missing}}
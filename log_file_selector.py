@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QPushButton,
     QListWidget, QListWidgetItem, QLabel
@@ -9,10 +10,11 @@ from PyQt6.QtGui import QFont
 import file_utils
 
 class LogFileSelector(QDialog):
-    def __init__(self, directory, pattern, parent=None):
+    def __init__(self, directory, pattern, parent=None, max_age_days=0):
         super().__init__(parent)
         self.directory = directory
         self.pattern = pattern
+        self.max_age_days = max_age_days  # 0 lists every matching file
         self.selected_files = []
         self.initUI()
 
@@ -60,7 +62,10 @@ class LogFileSelector(QDialog):
 
     def populate_list(self):
         self.list_widget.clear()
-        all_files = file_utils.get_all_matching_files(self.directory, self.pattern)
+        since = None
+        if self.max_age_days > 0:
+            since = datetime.now() - timedelta(days=self.max_age_days)
+        all_files = file_utils.get_all_matching_files(self.directory, self.pattern, since)
         for file in all_files:
             item = QListWidgetItem(file)
             self.list_widget.addItem(item)
@@ -0,0 +1,301 @@
+"""
+Sparse time index over a log file, for reading only a time-of-day window.
+
+MotiveWave writes lines in time order, each starting with "HH:MM:SS". The
+index keeps, every `stride` lines, the byte offset of a line and its time, so
+a range read bisects to the last entry before the window, seeks there and
+stops at the first line past the window instead of scanning the whole file.
+
+Times are seconds since midnight of the file's first line, growing by a day
+whenever the clock wraps, so they stay sorted in a log that runs past
+midnight.
+
+The index is built as `LogTailer` reads (one counter bump per line) and
+cached as JSON under `DEFAULT_INDEX_DIR`; a cached index is extended over
+what was appended since and rebuilt when the file no longer starts with the
+bytes it was built from. Compressed archives cannot seek and are scanned.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from bisect import bisect_left
+from datetime import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from log_reader import compression_of, open_log_binary
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_STRIDE = 1_000
+DEFAULT_INDEX_DIR = Path.home() / ".config" / "trading-stats-tracker" / "log_index"
+FINGERPRINT_BYTES = 4096
+DAY_SECS = 86_400
+
+
+def file_fingerprint(path, length: int) -> bytes:
+    with open(path, "rb") as handle:
+        return hashlib.sha1(handle.read(length)).digest()
+
+
+def parse_line_seconds(line: str) -> Optional[int]:
+    """Seconds since midnight from a log line's "HH:MM:SS" prefix, or None."""
+    if len(line) < 8 or line[2] != ":" or line[5] != ":":
+        return None
+    digits = line[0:2] + line[3:5] + line[6:8]
+    if not digits.isdigit():
+        return None
+    return int(line[0:2]) * 3600 + int(line[3:5]) * 60 + int(line[6:8])
+
+
+def parse_prefix_seconds(raw_line: bytes) -> Optional[int]:
+    """`parse_line_seconds` on the undecoded line (ASCII digits and colons only)."""
+    if len(raw_line) < 8 or raw_line[2] != 58 or raw_line[5] != 58:  # b":"
+        return None
+    digits = raw_line[0:2] + raw_line[3:5] + raw_line[6:8]
+    if not digits.isdigit():
+        return None
+    return int(raw_line[0:2]) * 3600 + int(raw_line[3:5]) * 60 + int(raw_line[6:8])
+
+
+def seconds_of(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def index_path(log_path, index_dir=DEFAULT_INDEX_DIR) -> Path:
+    """Cache file for `log_path`: its name plus a hash of its absolute path (logs share names across folders)."""
+    log_path = os.path.abspath(log_path)
+    digest = hashlib.sha1(log_path.encode("utf-8")).hexdigest()[:12]
+    return Path(index_dir) / f"{os.path.basename(log_path)}.{digest}.json"
+
+
+class LogIndex:
+    """(byte offset, time) of every `stride`-th timestamped line of one log."""
+
+    def __init__(self, stride: int = DEFAULT_STRIDE):
+        self.stride = stride
+        self.offsets: List[int] = []
+        self.times: List[int] = []
+        self.size = 0  # bytes indexed so far (always a line boundary)
+        self.lines = 0
+        self.fingerprint = b""
+        self.dirty = False
+        self._next_sample = 1
+        self._day = 0
+
+    def observe(self, offset: int, raw_line: bytes) -> None:
+        """
+        Called for each complete (undecoded) line, in order, with the byte
+        offset it starts at; only every `stride`-th line's time is parsed.
+        """
+        self.lines += 1
+        if self.lines >= self._next_sample:
+            self._sample(offset, raw_line, self.lines)
+
+    def observe_block(self, offset: int, block: bytes) -> None:
+        """
+        `observe` for each line of `block` (complete lines starting at byte
+        `offset`), without a Python step per line: the block is split in one
+        call and only the sampled lines' offsets are summed up.
+        """
+        lines = block.split(b"\n")
+        lines.pop()  # the block ends with a newline
+        first = self.lines + 1  # number of lines[0]
+        self.lines += len(lines)
+        done = position = 0
+        candidate = max(self._next_sample - first, 0)
+        while candidate < len(lines):
+            position += sum(map(len, lines[done:candidate])) + candidate - done
+            done = candidate
+            self._sample(offset + position, lines[candidate], first + candidate)
+            candidate = max(self._next_sample - first, candidate + 1)
+
+    def _sample(self, offset: int, raw_line: bytes, number: int) -> None:
+        seconds = parse_prefix_seconds(raw_line)
+        if seconds is None:
+            return  # continuation line; sample the next stamped one
+        seconds += self._day
+        if self.times and seconds < self.times[-1] - DAY_SECS // 2:
+            self._day += DAY_SECS  # past midnight
+            seconds += DAY_SECS
+        self.offsets.append(offset)
+        self.times.append(seconds)
+        self._next_sample = number + self.stride
+        self.dirty = True
+
+    @property
+    def days(self) -> int:
+        """Calendar days the indexed lines span (1 unless the log runs past midnight)."""
+        return self._day // DAY_SECS + 1
+
+    def seek(self, start: int) -> Tuple[int, int]:
+        """
+        Offset of the last sampled line before `start` (index time), where
+        reading misses nothing, and the index time of that line's midnight.
+        """
+        position = bisect_left(self.times, start)
+        if not position:
+            return 0, 0
+        return self.offsets[position - 1], self.times[position - 1] // DAY_SECS * DAY_SECS
+
+    def extend(self, path) -> None:
+        """Indexes whatever complete lines were appended to `path` since `size`."""
+        with open(path, "rb") as handle:
+            handle.seek(self.size)
+            offset = self.size
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    break
+                self.observe(offset, raw_line)
+                offset += len(raw_line)
+        if offset != self.size:
+            self.size = offset
+            self.dirty = True
+        self._refresh_fingerprint(path)
+
+    def _refresh_fingerprint(self, path) -> None:
+        fingerprint = file_fingerprint(path, min(self.size, FINGERPRINT_BYTES))
+        if fingerprint != self.fingerprint:
+            self.fingerprint = fingerprint
+            self.dirty = True
+
+    def matches(self, path) -> bool:
+        """True if `path` still starts with the bytes this index was built from."""
+        try:
+            return os.path.getsize(path) >= self.size and (
+                file_fingerprint(path, min(self.size, FINGERPRINT_BYTES)) == self.fingerprint
+            )
+        except OSError:
+            return False
+
+    def to_state(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "stride": self.stride,
+            "size": self.size,
+            "lines": self.lines,
+            "fingerprint": self.fingerprint.hex(),
+            "next_sample": self._next_sample,
+            "day": self._day,
+            "offsets": self.offsets,
+            "times": self.times,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "LogIndex":
+        index = cls(state["stride"])
+        index.size = state["size"]
+        index.lines = state["lines"]
+        index.fingerprint = bytes.fromhex(state["fingerprint"])
+        index._next_sample = state["next_sample"]
+        index._day = state["day"]
+        index.offsets = list(state["offsets"])
+        index.times = list(state["times"])
+        return index
+
+    def save(self, path) -> None:
+        """Writes the index atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_state(), handle, separators=(",", ":"))
+        os.replace(temp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, stride: int = DEFAULT_STRIDE) -> Optional["LogIndex"]:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable log index %s: %s", path, exc)
+            return None
+        if state.get("version") != INDEX_VERSION or state.get("stride") != stride:
+            return None
+        try:
+            return cls.from_state(state)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def update_index(log_path, index_dir=DEFAULT_INDEX_DIR, stride: int = DEFAULT_STRIDE) -> LogIndex:
+    """The cached index of a plain log, extended over appended lines (rebuilt if the file changed) and saved."""
+    cache_path = index_path(log_path, index_dir)
+    index = LogIndex.load(cache_path, stride)
+    if index is None or not index.matches(log_path):
+        index = LogIndex(stride)
+    index.extend(log_path)
+    if index.dirty:
+        try:
+            index.save(cache_path)
+        except OSError as exc:
+            LOGGER.warning("Could not save log index %s: %s", cache_path, exc)
+    return index
+
+
+def read_time_range(
+    log_path,
+    start: Optional[time] = None,
+    end: Optional[time] = None,
+    index_dir=DEFAULT_INDEX_DIR,
+    stride: int = DEFAULT_STRIDE,
+) -> Iterator[str]:
+    """
+    Lines of `log_path` stamped in [start, end) time of day (None: start / end
+    of the day), on every day the log covers.
+
+    Lines without a timestamp (continuations) count as the time of the line
+    before them. Plain logs are read through the cached index; compressed
+    archives are scanned in full.
+    """
+    start_secs = seconds_of(start) if start else 0
+    end_secs = seconds_of(end) if end else DAY_SECS
+    if compression_of(log_path) is not None:
+        yield from _filter_time_of_day(log_path, start_secs, end_secs)
+        return
+
+    index = update_index(log_path, index_dir, stride)
+    for day in range(index.days):
+        yield from _read_window(log_path, index, start_secs + day * DAY_SECS, end_secs + day * DAY_SECS)
+
+
+def _read_window(log_path, index: LogIndex, start: int, end: int) -> Iterator[str]:
+    offset, day = index.seek(start)
+    previous = current = None
+    with open(log_path, "rb") as handle:
+        handle.seek(offset)
+        for raw_line in handle:
+            if offset >= index.size:
+                break  # not indexed yet (a partial last line)
+            offset += len(raw_line)
+            line = raw_line.decode("utf-8", errors="replace")
+            seconds = parse_line_seconds(line)
+            if seconds is not None:
+                seconds += day
+                if previous is not None and seconds < previous - DAY_SECS // 2:
+                    day += DAY_SECS
+                    seconds += DAY_SECS
+                previous = current = seconds
+            if current is None or current < start:
+                continue
+            if current >= end:
+                return
+            yield line
+
+
+def _filter_time_of_day(log_path, start: int, end: int) -> Iterator[str]:
+    current = None
+    with open_log_binary(log_path) as handle:
+        for raw_line in handle:
+            line = raw_line.decode("utf-8", errors="replace")
+            seconds = parse_line_seconds(line)
+            if seconds is not None:
+                current = seconds
+            if current is not None and start <= current < end:
+                yield line
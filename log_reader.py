@@ -0,0 +1,98 @@
+"""
+Opens MotiveWave logs whether plain, gzip'd or zstd'd (archived `output*` logs).
+
+Compression is detected from the magic bytes, not the file name, and the
+content is stream-decompressed so callers keep iterating lines as before.
+zstd support needs the optional `zstandard` package.
+
+Logs are decoded as UTF-8 with invalid bytes replaced: a corrupted byte (a
+crash mid-write, a copy from another encoding) costs one garbled character,
+never the whole read. `scan_lines` goes further and decodes only the lines
+that contain a marker.
+"""
+
+import gzip
+import io
+from typing import Iterator, Optional, Sequence
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+CHUNK_BYTES = 1 << 20
+
+
+def compression_of(path) -> Optional[str]:
+    """"gzip", "zstd" or None for a plain file."""
+    with open(path, "rb") as handle:
+        magic = handle.read(len(ZSTD_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    if magic == ZSTD_MAGIC:
+        return "zstd"
+    return None
+
+
+def open_log_binary(path):
+    """Binary stream of the (decompressed) log content."""
+    compression = compression_of(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError(
+                f"{path} is zstd-compressed; install the 'zstandard' package to read it"
+            ) from exc
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        )
+    return open(path, "rb")
+
+
+def open_log(path):
+    """Text stream of the (decompressed) log, for line iteration like `open(path, "r")`."""
+    if compression_of(path) is None:
+        return open(path, "r", encoding="utf-8", errors="replace")
+    return io.TextIOWrapper(open_log_binary(path), encoding="utf-8", errors="replace")
+
+
+def scan_lines(path, markers: Sequence[bytes], chunk_bytes: int = CHUNK_BYTES) -> Iterator[str]:
+    """
+    The lines of the (decompressed) log containing any of `markers`, in order.
+
+    The log is read in binary chunks and searched with `bytes.find`; only the
+    lines around a hit are decoded, so the heartbeat and order-book lines
+    that make up most of a log are never split or decoded at all. A final
+    line without a newline is included, as `open_log` would.
+    """
+    with open_log_binary(path) as handle:
+        carry = b""
+        while True:
+            chunk = handle.read(chunk_bytes)
+            if not chunk:
+                break
+            buffer = carry + chunk
+            end = buffer.rfind(b"\n") + 1
+            if not end:
+                carry = buffer  # no complete line yet
+                continue
+            yield from marked_lines(buffer, end, markers)
+            carry = buffer[end:]
+        if carry:
+            yield from marked_lines(carry, len(carry), markers)
+
+
+def marked_lines(buffer: bytes, end: int, markers: Sequence[bytes]) -> Iterator[str]:
+    """Decoded lines of `buffer[:end]` containing a marker (`end` is a line boundary)."""
+    hits = [buffer.find(marker, 0, end) for marker in markers]
+    while True:
+        position = min((hit for hit in hits if hit >= 0), default=-1)
+        if position < 0:
+            return
+        line_start = buffer.rfind(b"\n", 0, position) + 1
+        line_end = buffer.find(b"\n", position, end) + 1 or end
+        yield buffer[line_start:line_end].decode("utf-8", errors="replace")
+        hits = [
+            hit if hit >= line_end or hit < 0 else buffer.find(marker, line_end, end)
+            for hit, marker in zip(hits, markers)
+        ]
@@ -0,0 +1,148 @@
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from log_index import DEFAULT_INDEX_DIR, FINGERPRINT_BYTES, LogIndex, index_path
+from log_index import file_fingerprint as _fingerprint
+from log_reader import CHUNK_BYTES, compression_of, marked_lines, open_log_binary, scan_lines
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FileCursor:
+    """
+    How far a log has been read, plus a hash of its first bytes to detect replacement.
+
+    For a compressed archive the offset is the size of the compressed file:
+    archives are read whole once and must not change afterwards.
+    """
+
+    offset: int = 0
+    fingerprint_len: int = 0
+    fingerprint: bytes = b""
+    compressed: bool = False
+
+    def matches(self, path: str) -> bool:
+        """True if `path` still starts with the bytes this cursor was read from."""
+        try:
+            size = os.path.getsize(path)
+            if size < self.offset or (self.compressed and size != self.offset):
+                return False  # truncated, rotated or re-archived
+            return _fingerprint(path, self.fingerprint_len) == self.fingerprint
+        except OSError:
+            return False
+
+
+class LogTailer:
+    """
+    Hands out only the complete lines appended to each log since the last call.
+
+    MotiveWave only ever appends to its logs, so a byte offset per file is
+    enough to resume. A trailing line without a newline is still being written
+    and is left for the next call.
+
+    Plain logs also get a sparse time index (`log_index.LogIndex`) as they
+    are read; `save_indexes` caches it for the analysis tools' range reads.
+    """
+
+    def __init__(self):
+        self.cursors: Dict[str, FileCursor] = {}
+        self.indexes: Dict[str, LogIndex] = {}
+
+    def is_resumable(self, file_paths: Iterable[str]) -> bool:
+        """
+        True if every tracked file is still selected and unchanged up to its offset.
+
+        When False, data derived from earlier reads is stale and the caller
+        should `reset()` and rebuild from scratch.
+        """
+        selected = set(file_paths)
+        return all(
+            path in selected and cursor.matches(path)
+            for path, cursor in self.cursors.items()
+        )
+
+    def reset(self) -> None:
+        self.cursors.clear()
+        self.indexes.clear()
+
+    def save_indexes(self, index_dir=DEFAULT_INDEX_DIR) -> None:
+        """Writes the time index of every log that was read further since the last save."""
+        for path, index in self.indexes.items():
+            if not index.dirty:
+                continue
+            try:
+                index.save(index_path(path, index_dir))
+            except OSError as exc:
+                LOGGER.warning("Could not save log index for %s: %s", path, exc)
+
+    def new_lines(self, path: str, markers: Optional[Sequence[bytes]] = None) -> Iterator[str]:
+        """
+        The complete lines appended to `path` since the last call, decoded.
+
+        With `markers`, the new bytes are read in chunks and only the lines
+        containing one of them are split out and decoded, as in
+        `log_reader.scan_lines`; the time index walks the undecoded chunk and
+        parses the HH:MM:SS prefix of the lines it samples.
+        """
+        cursor = self.cursors.get(path)
+        if cursor is None:
+            cursor = self.cursors[path] = FileCursor(compressed=compression_of(path) is not None)
+        if cursor.compressed:
+            yield from self._archive_lines(path, cursor, markers)
+            return
+
+        index = self.indexes.get(path)
+        if index is None:
+            index = self.indexes[path] = LogIndex()
+        with open(path, "rb") as handle:
+            handle.seek(cursor.offset)
+            if markers is None:
+                for raw_line in handle:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    index.observe(cursor.offset, raw_line)
+                    cursor.offset += len(raw_line)
+                    index.size = cursor.offset
+                    yield raw_line.decode("utf-8", errors="replace")
+            else:
+                yield from self._marked_lines(handle, cursor, index, markers)
+
+        if cursor.fingerprint_len < FINGERPRINT_BYTES:
+            cursor.fingerprint_len = min(cursor.offset, FINGERPRINT_BYTES)
+            cursor.fingerprint = _fingerprint(path, cursor.fingerprint_len)
+            index.fingerprint = cursor.fingerprint
+            index.dirty = True
+
+    @staticmethod
+    def _marked_lines(handle, cursor: FileCursor, index: LogIndex, markers: Sequence[bytes]) -> Iterator[str]:
+        carry = b""
+        while True:
+            chunk = handle.read(CHUNK_BYTES)
+            if not chunk:
+                return  # a trailing partial line stays unread
+            buffer = carry + chunk
+            end = buffer.rfind(b"\n") + 1
+            if not end:
+                carry = buffer
+                continue
+            index.observe_block(cursor.offset, buffer[:end])
+            yield from marked_lines(buffer, end, markers)
+            cursor.offset += end
+            index.size = cursor.offset
+            carry = buffer[end:]
+
+    def _archive_lines(self, path: str, cursor: FileCursor, markers: Optional[Sequence[bytes]]) -> Iterator[str]:
+        if cursor.offset:
+            return  # already read in full
+        if markers is not None:
+            yield from scan_lines(path, markers)
+        else:
+            with open_log_binary(path) as handle:
+                for raw_line in handle:
+                    yield raw_line.decode("utf-8", errors="replace")
+        cursor.offset = os.path.getsize(path)
+        cursor.fingerprint_len = min(cursor.offset, FINGERPRINT_BYTES)
+        cursor.fingerprint = _fingerprint(path, cursor.fingerprint_len)
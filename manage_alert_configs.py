@@ -47,20 +47,30 @@ def cmd_clone(args: argparse.Namespace) -> int:
 
 def cmd_validate(args: argparse.Namespace) -> int:
     manager = AlertConfigManager()
-    names: List[str]
     if args.profile:
-        names = [args.profile]
-    else:
-        names = [entry["name"] for entry in manager.list_profiles()]
-
-    failures = []
-    for name in names:
         try:
-            manager.validate_profile(name)
-            print(f"Validated {name}")
+            manager.validate_profile(args.profile)
+            print(f"Validated {args.profile}")
+            return 0
         except Exception as exc:
-            print(f"Validation failed for {name}: {exc}")
-            failures.append(name)
+            print(f"Validation failed for {args.profile}: {exc}")
+            return 1
+
+    names: List[str] = [entry["name"] for entry in manager.list_profiles()]
+    if args.include_backups:
+        names.extend(str(path) for path in sorted((manager.config_dir / "backups").glob("*.json")))
+
+    results = manager.validate_profiles(names)
+    failures = [name for name, errors in results.items() if errors]
+    for name, errors in results.items():
+        if not errors:
+            print(f"Validated {name}")
+            continue
+        print(f"Validation failed for {name}:")
+        for error in errors:
+            print(f"  {error}")
+    if failures:
+        print(f"{len(failures)} of {len(results)} profiles failed validation")
     return 1 if failures else 0
 
 
@@ -116,6 +126,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         "-p",
         help="Specific profile name to validate; defaults to all discovered profiles.",
     )
+    validate_parser.add_argument(
+        "--include-backups",
+        action="store_true",
+        help="Also validate every saved copy under backups/.",
+    )
 
     export_parser = subparsers.add_parser(
         "export-hardcoded", help="Export the default hard-coded preset."
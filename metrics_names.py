@@ -23,11 +23,14 @@ class MetricNames:
     MAX_POINTS = "Max Points"
     PEAK_TIME_PNL = "Peak Time P/L"
     PEAK_PL = "Peak P/L"
+    LAST_60_MINS = "Last 60m T/W/PL"
     MAX_TRADE_PL = "Max Trade P/L"
     BEST_WORST = "Best/Worst"
     SCALED_LOSSES = "Scaled Losses"
     MAX_LOSS_SIZE = "Max Loss Size"
     WIN_RATE_LONG_SHORT = "Win Rate (L/S)"
+    STOP_SLIPPAGE = "Stop Slippage"
+    STOP_SLIPPAGE_DETAIL = "Stops/Avg/Max Slip"
 
     @staticmethod
     def get_extra_metric_names():
@@ -35,8 +38,10 @@ class MetricNames:
             MetricNames.AVG_SIZE,
             MetricNames.BEST_WORST,
             MetricNames.PEAK_PL,
+            MetricNames.LAST_60_MINS,
             MetricNames.MAX_TRADE_PL,
             MetricNames.MAX_POINTS,
+            MetricNames.STOP_SLIPPAGE_DETAIL,
             MetricNames.SCALED_LOSSES,
             MetricNames.MAX_LOSS_SIZE,
             MetricNames.FIRST_ENTRY,
@@ -53,7 +53,7 @@ def format_timedelta(timedelta_obj):
 
     total_seconds = int(timedelta_obj.total_seconds())
     minutes = total_seconds // 60
-    seconds = (total_seconds % 60) // 60
+    seconds = total_seconds % 60
     return f"{minutes:02d}:{seconds:02d}"
 
 def calculate_mins(open_entry_time_str, reference_time):
@@ -0,0 +1,87 @@
+import time
+from typing import Callable, Optional
+
+
+class RefreshScheduler:
+    """
+    Decides when the app next polls the logs and ticks the open-trade duration.
+
+    One single-shot timer drives both: after each wake-up the app asks for
+    `next_delay_ms` and sleeps that long. Log polling runs at `fast_ms` while
+    a position is open or fills arrived within the last `active_secs`;
+    otherwise it starts at `idle_ms` and doubles after every refresh that
+    brings nothing new, up to `max_idle_ms`. Any new fill drops straight back
+    to the fast cadence. The duration tick (every `duration_ms`) only runs
+    while a position is open.
+    """
+
+    def __init__(
+        self,
+        fast_ms: int = 500,
+        idle_ms: int = 10_000,
+        max_idle_ms: int = 60_000,
+        active_secs: float = 120,
+        duration_ms: int = 60_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fast_ms = fast_ms
+        self.idle_ms = idle_ms
+        self.max_idle_ms = max(max_idle_ms, idle_ms)
+        self.active_secs = active_secs
+        self.duration_ms = duration_ms
+        self._clock = clock
+
+        now = clock()
+        self.position_open = False
+        self.last_fill_at: Optional[float] = None
+        self.backoff_ms = idle_ms
+        self.next_refresh_at = now
+        self.next_duration_at = now
+
+    def is_active(self, now: Optional[float] = None) -> bool:
+        """True while a position is open or fills arrived within `active_secs`."""
+        if self.position_open:
+            return True
+        if self.last_fill_at is None:
+            return False
+        now = self._clock() if now is None else now
+        return now - self.last_fill_at < self.active_secs
+
+    def refresh_due(self, now: Optional[float] = None) -> bool:
+        now = self._clock() if now is None else now
+        return now >= self.next_refresh_at
+
+    def duration_due(self, now: Optional[float] = None) -> bool:
+        """True (and starts the next duration interval) if the open-trade duration should tick."""
+        if not self.position_open:
+            return False
+        now = self._clock() if now is None else now
+        if now < self.next_duration_at:
+            return False
+        self.next_duration_at = now + self.duration_ms / 1000
+        return True
+
+    def record_refresh(self, fills_changed: bool, position_open: bool, now: Optional[float] = None) -> None:
+        """Updates the cadence after a refresh (scheduled or manual)."""
+        now = self._clock() if now is None else now
+        if position_open and not self.position_open:
+            self.next_duration_at = now  # show the duration right away
+        self.position_open = position_open
+        if fills_changed:
+            self.last_fill_at = now
+            self.backoff_ms = self.idle_ms
+
+        if self.is_active(now):
+            delay_ms = self.fast_ms
+        else:
+            delay_ms = self.backoff_ms
+            self.backoff_ms = min(self.backoff_ms * 2, self.max_idle_ms)
+        self.next_refresh_at = now + delay_ms / 1000
+
+    def next_delay_ms(self, now: Optional[float] = None) -> int:
+        """Milliseconds until the next refresh or duration tick, whichever comes first."""
+        now = self._clock() if now is None else now
+        wake_at = self.next_refresh_at
+        if self.position_open:
+            wake_at = min(wake_at, self.next_duration_at)
+        return max(0, round((wake_at - now) * 1000))
@@ -0,0 +1,130 @@
+import datetime
+from collections import deque
+from typing import Dict, Iterable
+
+from trade_group import TradeGroup
+
+DEFAULT_WINDOWS_MINS = (15, 60)
+
+
+class RollingWindow:
+    """
+    Closed trade groups whose exit falls inside a trailing time window.
+
+    Counts and P/L are kept as running sums and the window max size / worst trade
+    as monotonic deques, so each add is O(1) amortized regardless of window length.
+    """
+
+    __slots__ = (
+        "minutes",
+        "span",
+        "trade_count",
+        "win_count",
+        "profit_or_loss",
+        "_trades",
+        "_max_size",
+        "_min_amount",
+    )
+
+    def __init__(self, minutes: int):
+        self.minutes = minutes
+        self.span = datetime.timedelta(minutes=minutes)
+        self.trade_count = 0
+        self.win_count = 0
+        self.profit_or_loss = 0.0
+        self._trades = deque()  # (exit_time, trade_amount)
+        self._max_size = deque()  # (exit_time, max_trade_size), sizes decreasing
+        self._min_amount = deque()  # (exit_time, trade_amount), amounts increasing
+
+    def add(self, trade_group: TradeGroup) -> None:
+        exit_time = trade_group.exit_time
+        amount = trade_group.trade_amount
+
+        self._trades.append((exit_time, amount))
+        self.trade_count += 1
+        self.win_count += amount > 0
+        self.profit_or_loss += amount
+
+        size = trade_group.max_trade_size
+        while self._max_size and self._max_size[-1][1] <= size:
+            self._max_size.pop()
+        self._max_size.append((exit_time, size))
+
+        while self._min_amount and self._min_amount[-1][1] >= amount:
+            self._min_amount.pop()
+        self._min_amount.append((exit_time, amount))
+
+        self.evict(exit_time)
+
+    def evict(self, now: datetime.datetime) -> None:
+        """Drops trades that exited at or before `now - span`."""
+        cutoff = now - self.span
+        trades = self._trades
+        while trades and trades[0][0] <= cutoff:
+            _, amount = trades.popleft()
+            self.trade_count -= 1
+            self.win_count -= amount > 0
+            self.profit_or_loss -= amount
+        while self._max_size and self._max_size[0][0] <= cutoff:
+            self._max_size.popleft()
+        while self._min_amount and self._min_amount[0][0] <= cutoff:
+            self._min_amount.popleft()
+
+    @property
+    def win_rate(self) -> float:
+        return self.win_count / self.trade_count * 100 if self.trade_count else 0.0
+
+    @property
+    def max_trade_size(self) -> float:
+        return self._max_size[0][1] if self._max_size else 0
+
+    @property
+    def worst_trade(self) -> float:
+        return min(self._min_amount[0][1], 0) if self._min_amount else 0
+
+    @property
+    def velocity_per_hour(self) -> float:
+        return self.profit_or_loss * 60 / self.minutes
+
+
+class RollingTradeMetrics:
+    """
+    Trailing-window stats ("last 60 minutes") over closed trade groups.
+
+    Windows are anchored at the most recent trade exit rather than the wall clock,
+    so the same values come out of a replay and a historical log. Call
+    `evict(now)` before `context()` to age windows against another time, as the
+    live app does with the clock before publishing stats and alerts.
+    """
+
+    __slots__ = ("windows",)
+
+    def __init__(self, windows_mins: Iterable[int] = DEFAULT_WINDOWS_MINS):
+        self.windows = [RollingWindow(minutes) for minutes in windows_mins]
+
+    def add(self, trade_group: TradeGroup) -> None:
+        for window in self.windows:
+            window.add(trade_group)
+
+    def evict(self, now: datetime.datetime) -> None:
+        for window in self.windows:
+            window.evict(now)
+
+    def get_window(self, minutes: int) -> RollingWindow:
+        for window in self.windows:
+            if window.minutes == minutes:
+                return window
+        raise KeyError(f"No {minutes} minute window configured")
+
+    def context(self) -> Dict[str, float]:
+        """Alert context fields, e.g. `trades_last_15m`, `win_rate_last_60m`, `pnl_velocity_60m`."""
+        fields: Dict[str, float] = {}
+        for window in self.windows:
+            suffix = f"{window.minutes}m"
+            fields[f"trades_last_{suffix}"] = window.trade_count
+            fields[f"win_rate_last_{suffix}"] = window.win_rate
+            fields[f"pnl_last_{suffix}"] = window.profit_or_loss
+            fields[f"pnl_velocity_{suffix}"] = window.velocity_per_hour
+            fields[f"max_size_last_{suffix}"] = window.max_trade_size
+            fields[f"worst_trade_last_{suffix}"] = window.worst_trade
+        return fields
@@ -0,0 +1,87 @@
+import datetime
+from typing import Dict, List, Tuple
+
+INTERVAL_MINS = 5  # the slippage scripts' buckets
+
+
+def slippage_points(is_buy: bool, stop_price: float, fill_price: float) -> float:
+    """Points a stop filled beyond its stop price (positive: the unfavorable way)."""
+    return fill_price - stop_price if is_buy else stop_price - fill_price
+
+
+class StopSlippage:
+    """
+    Slippage of filled stop (STP) orders: fill price against the Aux (stop) price.
+
+    Session totals are running sums and each fill also lands in its
+    `INTERVAL_MINS` bucket, so adding a fill is O(1) and the alert fields cost
+    nothing to read. The "current" interval is the one of the latest stop fill,
+    anchored to the log like `RollingTradeMetrics`, not to the wall clock.
+    """
+
+    __slots__ = ("stop_fills", "points", "dollars", "max_points", "last_fill_time", "intervals")
+
+    def __init__(self):
+        self.stop_fills = 0
+        self.points = 0.0
+        self.dollars = 0.0
+        self.max_points = 0.0
+        self.last_fill_time = None
+        # interval start -> [points, stop fills]
+        self.intervals: Dict[datetime.datetime, List[float]] = {}
+
+    def add(
+        self,
+        is_buy: bool,
+        stop_price: float,
+        fill_price: float,
+        quantity: float,
+        multiplier: float,
+        fill_time: datetime.datetime,
+    ) -> float:
+        """Records one stop fill; returns its slippage in points."""
+        points = slippage_points(is_buy, stop_price, fill_price)
+        self.stop_fills += 1
+        self.points += points
+        self.dollars += points * quantity * multiplier
+        self.max_points = max(self.max_points, points)
+        if self.last_fill_time is None or fill_time > self.last_fill_time:
+            self.last_fill_time = fill_time
+
+        interval = self.interval_start(fill_time)
+        bucket = self.intervals.get(interval)
+        if bucket is None:
+            bucket = self.intervals[interval] = [0.0, 0]
+        bucket[0] += points
+        bucket[1] += 1
+        return points
+
+    @staticmethod
+    def interval_start(fill_time: datetime.datetime) -> datetime.datetime:
+        return fill_time.replace(minute=fill_time.minute // INTERVAL_MINS * INTERVAL_MINS, second=0, microsecond=0)
+
+    @property
+    def avg_points(self) -> float:
+        return self.points / self.stop_fills if self.stop_fills else 0.0
+
+    @property
+    def interval_points(self) -> float:
+        """Slippage in the interval of the latest stop fill."""
+        if self.last_fill_time is None:
+            return 0.0
+        return self.intervals[self.interval_start(self.last_fill_time)][0]
+
+    def by_interval(self) -> List[Tuple[datetime.datetime, float, int]]:
+        """(interval start, points, stop fills) per interval, in time order."""
+        return [(start, points, int(count)) for start, (points, count) in sorted(self.intervals.items())]
+
+    def context(self) -> Dict[str, float]:
+        """Alert context fields, e.g. `session_slippage_points`, `interval_slippage_points`."""
+        return {
+            "session_stop_fills": self.stop_fills,
+            "session_slippage_points": self.points,
+            "session_slippage_dollars": self.dollars,
+            "avg_slippage_points": self.avg_points,
+            "max_slippage_points": self.max_points,
+            "interval_slippage_points": self.interval_points,
+        }
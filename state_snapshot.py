@@ -0,0 +1,85 @@
+"""
+Warm start: persist the processor's incremental state and bring it back on launch.
+
+The snapshot holds everything a full parse of the selected logs would
+rebuild: the log offsets (with file fingerprints), the fill store, the
+per-account accumulators and the published stats, alerts, trade groups and
+equity curves, plus the alert throttle. On restore the tailer's fingerprints
+are checked against the files now selected, so a snapshot taken for other or
+rewritten logs is ignored and the app falls back to a full parse.
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from alert_throttle import AlertThrottle
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 5
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".config" / "trading-stats-tracker" / "snapshot.pickle"
+
+PROCESSOR_FIELDS = (
+    "log_tailer",
+    "fill_store",
+    "log_account_names",
+    "account_names_loaded",
+    "account_accumulators",
+    "accumulated_rows",
+    "account_trading_stats",
+    "account_trading_alerts",
+    "account_trade_groups",
+    "account_equity_curves",
+)
+
+
+def save_snapshot(path, processor, alert_throttle: Optional[AlertThrottle] = None) -> None:
+    """Writes the snapshot atomically (temp file + rename) so a crash never leaves half a file."""
+    path = Path(path)
+    state = {field: getattr(processor, field) for field in PROCESSOR_FIELDS}
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "processor": state,
+        "throttle": alert_throttle.to_state() if alert_throttle else {},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as file:
+        pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def restore_snapshot(path, processor, file_paths, alert_throttle: Optional[AlertThrottle] = None) -> bool:
+    """
+    Loads a snapshot into `processor` (and `alert_throttle`) if it matches `file_paths`.
+
+    Returns:
+        True if the state was restored; False (processor untouched) if there is
+        no usable snapshot for these files.
+    """
+    try:
+        with open(path, "rb") as file:
+            payload = pickle.load(file)
+    except FileNotFoundError:
+        return False
+    except Exception as exc:
+        LOGGER.warning("Ignoring unreadable snapshot %s: %s", path, exc)
+        return False
+
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        return False
+    state = payload["processor"]
+    tailer = state["log_tailer"]
+    if not tailer.cursors or not tailer.is_resumable(file_paths):
+        return False
+
+    for stats in state["account_accumulators"].values():
+        stats.attach_config(processor.config)
+    for field in PROCESSOR_FIELDS:
+        setattr(processor, field, state[field])
+    if alert_throttle is not None:
+        alert_throttle.restore_state(payload.get("throttle", {}))
+    return True
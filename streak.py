@@ -2,7 +2,26 @@ import datetime
 import my_utils
 
 class Streak:
-    def __init__(self):
+    __slots__ = (
+        "streak",
+        "best_streak",
+        "worst_streak",
+        "is_last_trade_win",
+        "long_losses",
+        "short_losses",
+        "streak_start_time",
+        "streak_last_trade_time",
+        "collect_followtrade_stats",
+        "losing_streak_stopper",
+        "losing_streak_continuer",
+    )
+
+    def __init__(self, collect_followtrade_stats=False):
+        """
+        Args:
+            collect_followtrade_stats (bool): Record (inter-trade secs, points) for the trades that stop
+                or continue a losing streak. Only needed for print_streak_followtrade_stats, so off by default.
+        """
         self.streak = 0
         self.best_streak = 0
         self.worst_streak = 0
@@ -11,6 +30,7 @@ class Streak:
         self.short_losses = 0
         self.streak_start_time = None
         self.streak_last_trade_time = None
+        self.collect_followtrade_stats = collect_followtrade_stats
         self.losing_streak_stopper = []
         self.losing_streak_continuer = []
 
@@ -34,7 +54,7 @@ class Streak:
                 self.streak += 1
             else:
                 self.streak = 1
-                if self.streak_last_trade_time is not None:
+                if self.collect_followtrade_stats and self.streak_last_trade_time is not None:
                     streak_stopper_time = (entry_time - self.streak_last_trade_time).total_seconds() 
                     self.losing_streak_stopper.append((streak_stopper_time, trade_value))
 
@@ -49,7 +69,7 @@ class Streak:
         else:
             if not self.is_last_trade_win:
                 self.streak -= 1
-                if self.streak_last_trade_time is not None:
+                if self.collect_followtrade_stats and self.streak_last_trade_time is not None:
                     streak_continuer_time = (entry_time - self.streak_last_trade_time).total_seconds() 
                     self.losing_streak_continuer.append((streak_continuer_time, trade_value))
                 self.streak_last_trade_time = entry_time
@@ -0,0 +1,40 @@
+"""
+Synthetic MotiveWave log writer for ingestion tests and benchmarks.
+"""
+
+from datetime import datetime
+
+
+def format_fill_line(
+    order_id: int,
+    account: str,
+    symbol: str,
+    side: str,
+    quantity: float,
+    fill_price: float,
+    fill_time: datetime,
+    order_kind: str = "MKT",
+    aux_price: float = 0.0,
+) -> str:
+    """Builds an `OrderDirectory::orderFilled()` line the way MotiveWave writes it."""
+    last_fill_time = fill_time.strftime("%m/%d/%Y %I:%M %p")
+    return (
+        f"{fill_time.strftime('%H:%M:%S')} INFO OrderDirectory::orderFilled() "
+        f"order: ID: SIM-{order_id} {account} {symbol}.CME {side} {order_kind} "
+        f"Qty:{quantity:.1f} Aux:{aux_price:.2f} Status: Filled {side} "
+        f"Filled Qty:{quantity:.1f} Last Fill Time: {last_fill_time} "
+        f"fill price: {fill_price:.2f}\n"
+    )
+
+
+def format_account_line(account: str, when: datetime) -> str:
+    return f"{when.strftime('%H:%M:%S')} INFO ACCOUNT: {account} fcmId: SIM ibId: SIM\n"
+
+
+def format_noise_line(when: datetime, text: str = "heartbeat") -> str:
+    return f"{when.strftime('%H:%M:%S')} INFO ConnectionManager::ping() {text}\n"
+
+
+def write_log(path, lines) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.writelines(lines)
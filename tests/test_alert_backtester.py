@@ -0,0 +1,143 @@
+"""
+Tests for replaying historical fills through alert profiles.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from alert_backtester import AlertBacktester, summarize
+from concern_level import ConcernLevel
+from fill_store import FillStore
+from trade_stats_processor import TradeStatsProcessor
+from fixtures.log_writer import format_fill_line, write_log
+
+DAY_ONE = datetime(2025, 6, 12, 6, 30)
+DAY_TWO = datetime(2025, 6, 13, 6, 30)
+
+LOSS_PROFILE = {
+    "conditions": [
+        {
+            "id": "two-losses",
+            "group": "streak",
+            "when": "streak_tracker.streak <= -2",
+            "message": "Two losses",
+            "level": "WARNING",
+        }
+    ]
+}
+DRAWDOWN_PROFILE = {
+    "conditions": [
+        {
+            "id": "down-200",
+            "group": "pnl",
+            "when": "total_profit_or_loss <= -200",
+            "message": "Down 200",
+            "level": "CRITICAL",
+        }
+    ]
+}
+
+
+def make_config():
+    config = MagicMock()
+    config.get_contract_value.return_value = 50
+    return config
+
+
+def add_round_trips(store, account, start, points, first_order_id=1):
+    """One long 1-lot trade per entry in `points`, 3 minutes apart."""
+    order_id = first_order_id
+    for index, point in enumerate(points):
+        entry = start + timedelta(minutes=3 * index)
+        store.add(account, order_id, "Filled BUY", "ESU5", 1.0, 6000.00, entry)
+        store.add(account, order_id + 1, "Filled SELL", "ESU5", 1.0, 6000.00 + point, entry + timedelta(minutes=1))
+        order_id += 2
+    return order_id
+
+
+class TestAlertBacktester:
+    """Test firing detection and follow-through P/L."""
+
+    def test_records_onset_and_following_pnl(self):
+        store = FillStore()
+        # -2 -2 (fires) -1 (still firing) +4 +1 points => -100 -100 -50 +200 +50
+        add_round_trips(store, "SIM1", DAY_ONE, [-2, -2, -1, 4, 1])
+
+        firings = AlertBacktester(make_config(), {"loss": LOSS_PROFILE}, next_trades=2).run(store)
+
+        assert len(firings) == 1
+        firing = firings[0]
+        assert firing.condition_id == "two-losses"
+        assert firing.level == ConcernLevel.WARNING
+        assert firing.trade_number == 2
+        assert firing.fired_at == DAY_ONE + timedelta(minutes=4)
+        assert firing.pnl_at_fire == -200
+        assert firing.pnl_after == 200  # -50 + 200 + 50
+        assert firing.pnl_next_trades == 150  # -50 + 200
+
+    def test_every_trade_mode_records_each_evaluation(self):
+        store = FillStore()
+        add_round_trips(store, "SIM1", DAY_ONE, [-2, -2, -1, 4, 1])
+
+        firings = AlertBacktester(make_config(), {"loss": LOSS_PROFILE}, onset_only=False).run(store)
+
+        assert [f.trade_number for f in firings] == [2, 3]
+
+    def test_sessions_reset_per_day_and_account(self):
+        store = FillStore()
+        order_id = add_round_trips(store, "SIM1", DAY_ONE, [-2, -2])
+        order_id = add_round_trips(store, "SIM1", DAY_TWO, [-2, -2], order_id)
+        add_round_trips(store, "SIM2", DAY_ONE, [-2, 1], order_id)
+
+        firings = AlertBacktester(make_config(), {"loss": LOSS_PROFILE}).run(store)
+
+        assert [(f.account, f.session) for f in firings] == [
+            ("SIM1", DAY_ONE.date()),
+            ("SIM1", DAY_TWO.date()),
+        ]
+        assert all(f.pnl_at_fire == -200 for f in firings)
+
+    def test_compares_profiles_in_one_pass(self):
+        store = FillStore()
+        add_round_trips(store, "SIM1", DAY_ONE, [-2, -2, -2, 4])
+
+        firings = AlertBacktester(
+            make_config(), {"loss": LOSS_PROFILE, "drawdown": DRAWDOWN_PROFILE}
+        ).run(store)
+        rows = {(row["profile"], row["condition_id"]): row for row in summarize(firings)}
+
+        assert rows["loss", "two-losses"]["fires"] == 1
+        assert rows["loss", "two-losses"]["avg_trade_number"] == 2
+        assert rows["drawdown", "down-200"]["avg_trade_number"] == 2
+        assert rows["drawdown", "down-200"]["avg_pnl_after"] == 100
+
+    def test_matches_live_alert_context(self):
+        """Context at each close equals what get_stats computes for that prefix of fills."""
+        store = FillStore()
+        add_round_trips(store, "SIM1", DAY_ONE, [-2, 3, -1, -1, 2])
+        config = make_config()
+        processor = TradeStatsProcessor(config)
+        fills = store.for_account("SIM1")
+
+        firings = AlertBacktester(
+            config, {"drawdown": {"conditions": [{"id": "any", "when": "True"}]}}, onset_only=False
+        ).run(store)
+
+        for firing in firings:
+            _, context, _ = processor.get_stats(fills[: firing.trade_number * 2])
+            assert context["total_profit_or_loss"] == firing.pnl_at_fire
+
+    def test_replays_parsed_log(self, tmp_path):
+        log_path = tmp_path / "output-2025-06-12.log"
+        lines = []
+        for index, point in enumerate([-2, -2, 4]):
+            entry = DAY_ONE + timedelta(minutes=3 * index)
+            lines.append(format_fill_line(2 * index + 1, "SIM1", "ESU5", "BUY", 1, 6000.00, entry))
+            lines.append(format_fill_line(2 * index + 2, "SIM1", "ESU5", "SELL", 1, 6000.00 + point, entry + timedelta(minutes=1)))
+        write_log(log_path, lines)
+
+        config = make_config()
+        fills = TradeStatsProcessor(config).get_fills([str(log_path)])
+        firings = AlertBacktester(config, {"loss": LOSS_PROFILE}).run(fills)
+
+        assert [(f.condition_id, f.pnl_after) for f in firings] == [("two-losses", 200)]
@@ -3,13 +3,15 @@ Tests for AlertConfigManager functionality.
 """
 
 import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import patch, mock_open
 import pytest
 
-from alert_config_manager import AlertConfigManager, SessionAlertOverrides
+from alert_config_manager import _SCHEMA_VALIDATORS, AlertConfigManager, SessionAlertOverrides, load_schema_validator
+from trade_stats_processor import TradeStatsProcessor
 
 
 class TestAlertConfigManager:
@@ -208,8 +210,8 @@ class TestAlertConfigManager:
         with pytest.raises(ValueError, match="failed schema validation"):
             manager.load_config("invalid")
 
-    @patch('alert_config_manager.jsonschema.validate')
-    def test_missing_schema_file(self, mock_validate):
+    @patch('alert_config_manager.load_schema_validator', side_effect=FileNotFoundError)
+    def test_missing_schema_file(self, mock_load_schema_validator):
         """Test behavior when schema file is missing."""
         # Remove schema file
         schema_path = self.config_dir / "schemas" / "alert_config.schema.json"
@@ -220,6 +222,7 @@ class TestAlertConfigManager:
         # Should still load config without validation
         config = manager.load_config("test")
         assert config["id"] == "test_config"
+        mock_load_schema_validator.assert_called_once_with(schema_path)
 
     def test_session_overrides_integration(self):
         """Test session overrides integration."""
@@ -240,6 +243,40 @@ class TestAlertConfigManager:
         assert condition["when"] == "test_field >= 20"
         assert condition["level"] == "CRITICAL"
 
+    def test_active_config_cached_until_profile_or_override_changes(self):
+        """get_active_config merges overrides once per (profile, overrides) version."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        manager.load_config("test")
+        active_config = manager.get_active_config()
+        assert manager.get_active_config() is active_config
+
+        manager.session_overrides.set_override("test_condition", {"when": "test_field >= 20"})
+        overridden = manager.get_active_config()
+        assert overridden is not active_config
+        assert overridden["conditions"][0]["when"] == "test_field >= 20"
+        assert manager.get_active_config() is overridden
+        assert manager.current_config["conditions"][0]["when"] == "test_field >= 10"
+
+        manager.session_overrides.remove_override("test_condition")
+        assert manager.get_active_config()["conditions"][0]["when"] == "test_field >= 10"
+
+    def test_processor_recompiles_only_when_override_changes(self):
+        """A session override applies on the next evaluation without per-call rebuilds."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        manager.load_config("test")
+        processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        processor.alert_config_manager = manager
+
+        manager.session_overrides.set_override("test_condition", {"when": "test_field >= 20"})
+        evaluator = processor._get_condition_evaluator()
+        assert processor._get_condition_evaluator() is evaluator
+        assert evaluator.evaluate({"test_field": 15}) == []
+
+        manager.session_overrides.set_override("test_condition", {"when": "test_field >= 12"})
+        slider_moved = processor._get_condition_evaluator()
+        assert slider_moved is not evaluator
+        assert [match["id"] for match in slider_moved.evaluate({"test_field": 15})] == ["test_condition"]
+
     def test_validate_profile_does_not_mutate_state(self):
         """validate_profile loads config without changing current_profile_name."""
         manager = AlertConfigManager(config_dir=str(self.config_dir))
@@ -250,6 +287,142 @@ class TestAlertConfigManager:
         assert payload["id"] == "test_config"
         assert manager.current_profile_name == "original"
 
+    def test_schema_validator_compiled_once(self):
+        """Managers over the same schema file share one compiled validator."""
+        first = AlertConfigManager(config_dir=str(self.config_dir))
+        second = AlertConfigManager(config_dir=str(self.config_dir))
+
+        assert first.validator is not None
+        assert first.validator is second.validator
+
+    def test_edited_schema_replaces_its_cached_validator(self):
+        schema_path = self.config_dir / "schemas" / "alert_config.schema.json"
+        first = load_schema_validator(schema_path)[1]
+        cached_schemas = len(_SCHEMA_VALIDATORS)
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        edited = load_schema_validator(schema_path)[1]
+        assert edited is not first
+        assert _SCHEMA_VALIDATORS[schema_path][2] is edited
+        assert len(_SCHEMA_VALIDATORS) == cached_schemas  # replaced, not added
+
+    def test_validate_profiles_reports_all_errors(self):
+        """Bulk validation collects every error per profile instead of stopping at the first."""
+        broken = json.loads(json.dumps(self.test_config))
+        del broken["schema_version"]
+        broken["metadata"]["source"] = "nowhere"
+        broken["conditions"][0]["when"] = "test_field >="
+        with open(self.config_dir / "presets" / "broken.json", "w") as f:
+            json.dump(broken, f)
+        with open(self.config_dir / "presets" / "garbled.json", "w") as f:
+            f.write("{not json")
+
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        results = manager.validate_profiles()
+
+        assert results["test"] == []
+        assert len(results["broken"]) == 3
+        assert any("schema_version" in error for error in results["broken"])
+        assert any(error.startswith("metadata/source") for error in results["broken"])
+        assert any(error.startswith("conditions/0 (test_condition)") for error in results["broken"])
+        assert len(results["garbled"]) == 1
+
+        with pytest.raises(ValueError, match="failed schema validation"):
+            manager.validate_profile("broken")
+
+    def test_every_load_validates_against_the_schema(self):
+        """No persistent "already validated" list: each new manager validates what it reads."""
+        for _ in range(2):
+            manager = AlertConfigManager(config_dir=str(self.config_dir))
+            with patch.object(AlertConfigManager, "_validate", return_value=True) as mock_validate:
+                manager.load_config("test")
+                mock_validate.assert_called_once()
+        assert not (self.config_dir / "validated_profiles.json").exists()
+
+    def _rewrite_profile(self, name, when):
+        path = self.config_dir / "presets" / f"{name}.json"
+        payload = json.loads(json.dumps(self.test_config))
+        payload["conditions"][0]["when"] = when
+        with open(path, "w") as f:
+            json.dump(payload, f)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return path
+
+    def test_hot_reload_picks_up_edited_profile(self):
+        """An edited profile is re-read, re-validated and swapped in."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        manager.load_config("test")
+        version = manager.config_version
+
+        assert manager.check_for_changes(force=True) is False
+
+        self._rewrite_profile("test", "test_field >= 99")
+        assert manager.check_for_changes(force=True) is True
+        assert manager.config_version == version + 1
+        assert manager.get_active_config()["conditions"][0]["when"] == "test_field >= 99"
+
+    def test_hot_reload_stats_at_most_once_per_interval(self):
+        """Changes are not noticed until the reload interval has elapsed."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir), reload_interval_secs=3600)
+        manager.load_config("test")
+
+        self._rewrite_profile("test", "test_field >= 99")
+        with patch("alert_config_manager.os.stat") as mock_stat:
+            assert manager.check_for_changes() is False
+            mock_stat.assert_not_called()
+        assert manager.get_active_config()["conditions"][0]["when"] == "test_field >= 10"
+
+    def test_hot_reload_keeps_previous_on_invalid_edit(self):
+        """A profile that no longer validates does not replace the loaded one."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        manager.load_config("test")
+        path = self.config_dir / "presets" / "test.json"
+        with open(path, "w") as f:
+            json.dump({"id": "broken"}, f)
+
+        assert manager.check_for_changes(force=True) is False
+        assert manager.get_active_config()["conditions"][0]["when"] == "test_field >= 10"
+
+    def test_hot_reload_follows_active_profile_file(self):
+        """Switching active_config.json swaps the profile unless one was requested explicitly."""
+        shutil.copy(self.config_dir / "presets" / "test.json", self.config_dir / "presets" / "other.json")
+        manager = AlertConfigManager(config_dir=str(self.config_dir), default_profile="test")
+        manager.active_profile_file = self.config_dir / "active_config.json"
+        manager.load_config()
+        assert manager.get_active_profile_name() == "test"
+
+        with open(manager.active_profile_file, "w") as f:
+            json.dump({"name": "other"}, f)
+        assert manager.check_for_changes(force=True) is True
+        assert manager.get_active_profile_name() == "other"
+
+        manager.load_config("test")
+        with open(manager.active_profile_file, "w") as f:
+            json.dump({"name": "other", "updated": True}, f)
+        assert manager.check_for_changes(force=True) is False
+        assert manager.get_active_profile_name() == "test"
+
+    def test_processor_reuses_compiled_evaluator_until_reload(self):
+        """The processor keeps one compiled evaluator per profile version."""
+        manager = AlertConfigManager(config_dir=str(self.config_dir))
+        manager.load_config("test")
+        processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        processor.alert_config_manager = manager
+
+        evaluator = processor._get_condition_evaluator()
+        assert processor._get_condition_evaluator() is evaluator
+        assert processor.reload_alert_profile() is False
+
+        self._rewrite_profile("test", "test_field >= 99")
+        manager._last_change_check = float("-inf")
+        assert processor.reload_alert_profile() is True
+        reloaded = processor._get_condition_evaluator()
+        assert reloaded is not evaluator
+        assert reloaded.evaluate({"test_field": 50}) == []
+        assert processor.alert_profile_status["profile"] == "test"
+
 
 class TestSessionAlertOverrides:
     """Test SessionAlertOverrides functionality."""
@@ -315,3 +488,14 @@ class TestSessionAlertOverrides:
         assert result[0]["when"] == "condition"  # Original
         assert result[0]["level"] == "CRITICAL"  # Overridden
         assert result[0]["message"] == "old"     # Original
+
+    def test_version_bumps_only_on_change(self):
+        """Each effective change bumps the version; no-op removals and clears do not."""
+        self.overrides.set_override("test_id", {"level": "CRITICAL"})
+        self.overrides.set_override("test_id", {"when": "x > 1"})
+        assert self.overrides.version == 2
+
+        self.overrides.remove_override("missing")
+        self.overrides.clear()
+        self.overrides.clear()
+        assert self.overrides.version == 3
@@ -0,0 +1,68 @@
+"""
+Tests for precompiled alert message templates.
+"""
+
+import pytest
+
+from alert_template import AlertTemplate, compile_template, format_template
+
+
+class Streak:
+    streak = -3
+
+
+CONTEXT = {
+    "completed_trades": 25,
+    "total_profit_or_loss": -1250.0,
+    "directional_bias_extramsg": "Join the SHORT.",
+    "win_rate": 41.666,
+    "streak_tracker": Streak(),
+}
+
+
+def format_map_reference(template, context):
+    """The format_map-over-scalars behavior templates must reproduce."""
+
+    class SafeDict(dict):
+        def __missing__(self, key):
+            return "{" + key + "}"
+
+    safe = {k: v for k, v in context.items() if isinstance(v, (int, float, str))}
+    try:
+        return template.format_map(SafeDict(safe))
+    except Exception:  # noqa: BLE001
+        return template
+
+
+class TestAlertTemplate:
+    """Test compiled rendering against str.format_map semantics."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Trades: {completed_trades}",
+            "{total_profit_or_loss:+,}",
+            "{win_rate:.0f}% wins, {directional_bias_extramsg}",
+            "{{literal}} {completed_trades!r:>6}",
+            "{missing_field}",
+            "{missing_field:+,}",
+            "{streak_tracker}",
+            "{streak_tracker.streak}",
+            "{completed_trades:{width}}",
+            "{",
+            "{directional_bias_extramsg:d}",
+        ],
+    )
+    def test_matches_format_map(self, template):
+        assert format_template(template, CONTEXT) == format_map_reference(template, CONTEXT)
+
+    def test_fields_known_at_compile_time(self):
+        template = AlertTemplate("{completed_trades} trades, {total_profit_or_loss:+,}")
+        assert template.fields == ("completed_trades", "total_profit_or_loss")
+
+    def test_compiled_once_per_text(self):
+        assert compile_template("{completed_trades}") is compile_template("{completed_trades}")
+
+    def test_empty_template_passthrough(self):
+        assert format_template("", CONTEXT) == ""
+        assert format_template(None, CONTEXT) is None
@@ -0,0 +1,117 @@
+"""
+Tests for the bounded (account, condition id) alert throttle.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from alert_throttle import AlertThrottle
+from concern_level import ConcernLevel
+from hammerspoon_alert_manager import HammerspoonAlertManager
+from trade_stats_processor import TradeStatsProcessor
+
+
+class InlineThread:
+    """Stands in for threading.Thread, running the target on start()."""
+
+    def __init__(self, target, args=()):
+        self.target = target
+        self.args = args
+
+    def start(self):
+        self.target(*self.args)
+
+
+class TestAlertThrottle:
+    """Test interval enforcement, TTL eviction and the size cap."""
+
+    def test_blocks_within_interval(self):
+        throttle = AlertThrottle()
+        assert throttle.allow("SIM1", "streak", 60, now=0)
+        assert not throttle.allow("SIM1", "streak", 60, now=59.9)
+        assert throttle.allow("SIM2", "streak", 60, now=30)  # per account
+        assert throttle.allow("SIM1", "streak", 60, now=60)
+
+    def test_check_and_record_separately(self):
+        throttle = AlertThrottle()
+        assert not throttle.is_throttled("SIM1", "streak", now=0)
+        assert not throttle.is_throttled("SIM1", "streak", now=1)  # checking records nothing
+        throttle.record("SIM1", "streak", 60, now=1)
+        assert throttle.is_throttled("SIM1", "streak", now=60.9)
+        assert not throttle.is_throttled("SIM1", "streak", now=61)
+
+    def test_zero_interval_never_throttles_or_stores(self):
+        throttle = AlertThrottle()
+        assert throttle.allow("SIM1", "pnl", 0, now=0)
+        assert throttle.allow("SIM1", "pnl", 0, now=0)
+        assert len(throttle) == 0
+
+    def test_expired_entries_are_pruned(self):
+        throttle = AlertThrottle()
+        throttle.allow("SIM1", "a", 10, now=0)
+        throttle.allow("SIM1", "b", 100, now=0)
+        assert throttle.prune(now=50) == 1
+        assert len(throttle) == 1
+
+    def test_size_cap_evicts_expired_then_least_recent(self):
+        throttle = AlertThrottle(max_entries=3)
+        throttle.allow("SIM1", "short", 1, now=0)
+        throttle.allow("SIM1", "a", 100, now=0)
+        throttle.allow("SIM1", "b", 100, now=1)
+        throttle.allow("SIM1", "c", 100, now=2)  # "short" has expired and is swept
+        assert len(throttle) == 3
+        assert not throttle.allow("SIM1", "a", 100, now=3)
+
+        throttle.allow("SIM1", "d", 100, now=4)  # nothing expired, oldest ("a") goes
+        assert len(throttle) == 3
+        assert throttle.allow("SIM1", "a", 100, now=5)
+
+    def test_memory_bounded_over_many_keys(self):
+        throttle = AlertThrottle(max_entries=50)
+        for index in range(10_000):
+            throttle.allow("SIM1", f"Streak {index}", 600, now=index)
+        assert len(throttle) == 50
+
+
+class TestAlertThrottleIntegration:
+    """Test the throttle in front of Hammerspoon dispatch and condition throttle_secs."""
+
+    def test_display_alert_throttles_by_condition_before_dispatch(self):
+        manager = HammerspoonAlertManager()
+        with patch("hammerspoon_alert_manager.threading.Thread") as mock_thread:
+            manager.display_alert("Losing streak: 3", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+            manager.display_alert("Losing streak: 4", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+            manager.display_alert("Losing streak: 4", "SIM2", 2, 600, ConcernLevel.WARNING, "", "streak")
+        assert mock_thread.call_count == 2
+
+    def test_interval_starts_only_once_shown(self):
+        manager = HammerspoonAlertManager()
+        with patch("hammerspoon_alert_manager.threading.Thread", InlineThread):
+            with patch.object(manager, "_execute_hammerspoon_lua", return_value=False):  # hs failed
+                assert manager.display_alert("Losing streak: 3", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+                assert manager.display_alert("Losing streak: 3", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+            assert len(manager.throttle) == 0
+            with patch.object(manager, "_execute_hammerspoon_lua", return_value=True):
+                assert manager.display_alert("Losing streak: 3", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+                assert not manager.display_alert("Losing streak: 3", "SIM1", 2, 600, ConcernLevel.WARNING, "", "streak")
+
+    def test_condition_throttle_secs_overrides_level_interval(self):
+        config = MagicMock()
+        config.get_alert_duration.return_value = 5
+        config.get_min_interval_secs.return_value = 60
+        processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        processor.config = config
+
+        alerts = processor._build_alert_messages(
+            "SIM1",
+            [
+                {"id": "slow", "message": "A", "level": ConcernLevel.WARNING, "throttle_secs": 900},
+                {"id": "default", "message": "B", "level": ConcernLevel.CAUTION, "throttle_secs": 0},
+                {"message": "C", "level": ConcernLevel.OK},
+            ],
+        )
+
+        by_message = {alert.message: alert for alert in alerts}
+        assert by_message["A"].min_interval_secs == 900
+        assert by_message["A"].condition_id == "slow"
+        assert by_message["B"].min_interval_secs == 60
+        assert by_message["C"].condition_id == ""
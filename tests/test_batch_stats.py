@@ -0,0 +1,164 @@
+"""
+Tests for the column-wise batch stats engine, cross-checked against add_fill.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from batch_stats import accumulate_batch  # noqa: E402
+from constants import CONST  # noqa: E402
+from fill_store import FillStore  # noqa: E402
+from trade_stats_accumulator import TradeStatsAccumulator  # noqa: E402
+from trade_stats_processor import TradeStatsProcessor  # noqa: E402
+
+START = datetime(2025, 6, 12, 6, 30)
+MULTIPLIERS = {"ESU5": 50, "MESU5": 5, "NQU5": 20}
+SKIP_FIELDS = ("config", "contracts", "streak_tracker", "rolling_metrics", "open_trades", "trade_groups")
+
+
+def make_config():
+    config = MagicMock()
+    config.get_contract_value.side_effect = MULTIPLIERS.__getitem__
+    config.print_streak_followtrade_stats = False
+    config.interval_stats_print = False
+    return config
+
+
+def random_session(seed, trades=400, accounts=("SIM1", "SIM2")):
+    """Interleaved accounts, ES closed with MES, scale-ins, overlapping NQ, stop exits, trades left open."""
+    rng = random.Random(seed)
+    store = FillStore()
+    order_id = 1
+    minute = 0
+    for _ in range(trades):
+        account = rng.choice(accounts)
+        symbol = rng.choice(["ESU5", "ESU5", "NQU5"])
+        side, other = rng.choice([("BUY", "SELL"), ("SELL", "BUY")])
+        contracts = rng.randint(1, 3)
+        for _ in range(contracts):
+            store.add(account, order_id, f"Filled {side}", symbol, 1.0, 6000 + rng.randint(-8, 8) * 0.25, START + timedelta(minutes=minute))
+            order_id += 1
+            minute += rng.randint(0, 2)
+        if symbol == "ESU5" and rng.random() < 0.3:
+            exit_symbol, exit_quantity = "MESU5", 10.0 * contracts
+        else:
+            exit_symbol, exit_quantity = symbol, float(contracts)
+        exit_price = 6000 + rng.randint(-8, 8) * 0.25
+        stop_price = exit_price + rng.randint(-2, 2) * 0.25 if rng.random() < 0.4 else None  # stopped out
+        store.add(account, order_id, f"Filled {other}", exit_symbol, exit_quantity, exit_price, START + timedelta(minutes=minute), stop_price)
+        order_id += 1
+        minute += rng.randint(0, 20)
+    store.add("SIM1", order_id, "Filled BUY", "ESU5", 2.0, 6001.00, START + timedelta(minutes=minute))
+    return store
+
+
+def streaming(config, fills):
+    stats = TradeStatsAccumulator(config)
+    for fill in sorted(fills, key=lambda record: record.order_id):
+        stats.add_fill(fill)
+    return stats
+
+
+def assert_close(actual, expected, name):
+    """Floats to rounding error (summation order differs), everything else exactly."""
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys(), name
+        for key, value in expected.items():
+            assert_close(actual[key], value, f"{name}.{key}")
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), name
+        for index, (item, value) in enumerate(zip(actual, expected)):
+            assert_close(item, value, f"{name}[{index}]")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected), name
+    elif hasattr(expected, "__slots__"):
+        for slot in expected.__slots__:
+            assert_close(getattr(actual, slot), getattr(expected, slot), f"{name}.{slot}")
+    else:
+        assert actual == expected, name
+
+
+def assert_same_state(batch, stream):
+    for name, value in stream.__dict__.items():
+        if name not in SKIP_FIELDS:
+            assert_close(batch.__dict__[name], value, name)
+    assert len(batch.trade_groups) == len(stream.trade_groups)
+    for batch_group, stream_group in zip(batch.trade_groups, stream.trade_groups):
+        assert batch_group.entry_is_long == stream_group.entry_is_long
+        assert (batch_group.entry_time, batch_group.exit_time) == (stream_group.entry_time, stream_group.exit_time)
+        assert batch_group.max_trade_size == pytest.approx(stream_group.max_trade_size)
+        assert batch_group.trade_amount == pytest.approx(stream_group.trade_amount)
+    assert_close(batch.alert_context(), stream.alert_context(), "alert_context")
+
+
+class TestBatchStats:
+    """Test that the batch engine reaches the state add_fill reaches."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_streaming(self, seed):
+        config = make_config()
+        store = random_session(seed)
+        assert_same_state(accumulate_batch(config, store), streaming(config, store))
+
+    def test_single_account_rows(self):
+        config = make_config()
+        store = random_session(4)
+        batch = accumulate_batch(config, store, store.rows_for_account("SIM2"))
+        assert_same_state(batch, streaming(config, store.for_account("SIM2")))
+
+    def test_open_trades_carry_on_streaming(self):
+        """Fills added after a batch close the trades it left open exactly as add_fill would."""
+        config = make_config()
+        store = random_session(5)
+        batch = accumulate_batch(config, store)
+        stream = streaming(config, store)
+        assert batch.open_trades.keys() == stream.open_trades.keys()
+
+        last_id = max(fill.order_id for fill in store)
+        more = FillStore()
+        for offset, (account, family) in enumerate(sorted(stream.open_trades)):
+            trade = stream.open_trades[(account, family)]
+            symbol = "ESU5" if family == "ES" else "NQU5"
+            side = "SELL" if trade.position > 0 else "BUY"
+            quantity = abs(trade.position) / trade.unit_multiplier
+            more.add(account, last_id + offset + 1, f"Filled {side}", symbol, quantity, 6003.00, START + timedelta(days=1))
+        for fill in more:
+            assert batch.add_fill(fill).trade_amount == pytest.approx(stream.add_fill(fill).trade_amount)
+        assert_same_state(batch, stream)
+        assert batch.open_trades == {}
+
+    def test_empty_rows(self):
+        stats = accumulate_batch(make_config(), FillStore())
+        assert stats.completed_trades == 0
+        assert stats.trade_groups == []
+
+
+class TestProcessorBatchFlag:
+    """Test the batch flag on TradeStatsProcessor."""
+
+    def test_compute_trade_stats_batch_publishes_same_rows(self):
+        store = random_session(6)
+        results = []
+        for batch in (False, True):
+            processor = TradeStatsProcessor(make_config())
+            processor.compute_trade_stats(store, batch=batch)
+            results.append(processor)
+        stream, batch = results
+
+        assert batch.account_accumulators.keys() == {"SIM1", "SIM2", CONST.ALL_ACCOUNTS}
+        for name, stats in stream.account_accumulators.items():
+            assert_same_state(batch.account_accumulators[name], stats)
+        assert batch.account_trade_groups.keys() == stream.account_trade_groups.keys()
+
+    def test_get_stats_accepts_trade_list(self):
+        processor = TradeStatsProcessor(make_config())
+        fills = random_session(7).for_account("SIM1")
+        _, batch_context, batch_groups = processor.get_stats(fills, batch=True)
+        _, stream_context, stream_groups = processor.get_stats(fills)
+        assert_close(batch_context, stream_context, "alert_context")
+        assert len(batch_groups) == len(stream_groups)
@@ -0,0 +1,114 @@
+"""
+Tests for the data-driven stats label colors.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from color_rules import DEFAULT_COLOR, ColorRules, resolve_color
+from concern_level import ConcernLevel
+from fill_store import FillStore
+from metrics_names import MetricNames
+from trade_stats_processor import TradeStatsProcessor
+
+START = datetime(2025, 6, 12, 6, 30)
+
+
+def row_colors(trading_stats):
+    return {label: values[1] for row in trading_stats for label, values in row.items() if len(values) > 1}
+
+
+class TestColorRules:
+    """Test rule order, profile overrides and compile errors."""
+
+    def test_built_in_rules_first_match_wins(self):
+        rules = ColorRules()
+        context = {"completed_trades": 22, "total_profit_or_loss": 150.0}
+        assert rules.color("completed_trades", context) == ConcernLevel.OK.get_color()
+        context["total_profit_or_loss"] = -150.0
+        assert rules.color("completed_trades", context) == ConcernLevel.WARNING.get_color()
+        context["completed_trades"] = 3
+        assert rules.color("completed_trades", context) == DEFAULT_COLOR
+
+    def test_profile_replaces_only_listed_metrics(self):
+        rules = ColorRules(
+            [{"metric": "win_rate", "rules": [{"when": "win_rate <= 25", "color": "#b00020"}]}]
+        )
+        context = {"win_rate": 20, "profit_factor": 3.0, "completed_trades": 1, "total_profit_or_loss": -800}
+        assert rules.color("win_rate", context) == "#b00020"
+        assert rules.color("total_profit_or_loss", context) == ConcernLevel.CAUTION.get_color()
+
+    def test_level_names_and_literal_colors(self):
+        assert resolve_color("warning") == ConcernLevel.WARNING.get_color()
+        assert resolve_color("#123456") == "#123456"
+
+    def test_bad_expressions_never_match(self):
+        rules = ColorRules(
+            [{"metric": "streak", "rules": [{"when": "streak <=", "color": "red"}, {"when": "missing > 1", "color": "red"}]}]
+        )
+        assert rules.color("streak", {"streak": -9}) == DEFAULT_COLOR
+
+
+class TestProcessorColors:
+    """Test the stats rows pick their colors from the compiled rules."""
+
+    def make_processor(self):
+        config = MagicMock()
+        config.get_contract_value.return_value = 50
+        config.print_streak_followtrade_stats = False
+        processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        processor.config = config
+        processor.alert_config_manager = None
+        return processor
+
+    def test_rows_colored_by_built_in_rules(self):
+        processor = self.make_processor()
+        store = FillStore()
+        for index in range(3):
+            entry = START + timedelta(minutes=10 * index)
+            store.add("SIM1", 2 * index + 1, "Filled BUY", "ESU5", 1.0, 6000.00, entry)
+            store.add("SIM1", 2 * index + 2, "Filled SELL", "ESU5", 1.0, 5990.00, entry + timedelta(minutes=1))
+
+        trading_stats, _, _ = processor.get_stats(store.for_account("SIM1"))
+        colors = row_colors(trading_stats)
+        assert colors["Profit/Loss"] == ConcernLevel.WARNING.get_color()  # -1500
+        assert colors["Consecutive W/L"] == ConcernLevel.CAUTION.get_color()
+        assert colors[MetricNames.INTERTRADE_AVG] == DEFAULT_COLOR
+
+    def test_rules_compiled_once_per_profile_version(self):
+        processor = self.make_processor()
+        processor.alert_config_manager = MagicMock(config_version=1, current_config={"color_rules": []})
+        rules = processor._get_color_rules()
+        assert processor._get_color_rules() is rules
+
+        processor.alert_config_manager.config_version = 2
+        processor.alert_config_manager.current_config = {
+            "color_rules": [{"metric": "streak", "rules": [{"when": "streak < 0", "color": "CRITICAL"}]}]
+        }
+        reloaded = processor._get_color_rules()
+        assert reloaded is not rules
+        assert reloaded.color("streak", {"streak": -1}) == ConcernLevel.CRITICAL.get_color()
+
+    def test_profile_rules_see_alert_context_fields(self, caplog):
+        processor = self.make_processor()
+        processor.alert_config_manager = MagicMock(
+            config_version=1,
+            current_config={
+                "color_rules": [
+                    {"metric": "completed_trades", "rules": [{"when": "trades_last_15m >= 2", "color": "CRITICAL"}]},
+                    {"metric": "profit_factor", "rules": [{"when": "profit_factor < 1 and streak_tracker.streak < 0", "color": "#b00020"}]},
+                ]
+            },
+        )
+        store = FillStore()
+        for index in range(2):
+            entry = START + timedelta(minutes=2 * index)
+            store.add("SIM1", 2 * index + 1, "Filled BUY", "ESU5", 1.0, 6000.00, entry)
+            store.add("SIM1", 2 * index + 2, "Filled SELL", "ESU5", 1.0, 5999.00, entry + timedelta(minutes=1))
+
+        with caplog.at_level("WARNING", logger="color_rules"):
+            trading_stats, _, _ = processor.get_stats(store.for_account("SIM1"))
+        colors = row_colors(trading_stats)
+        assert colors[MetricNames.TRADES] == ConcernLevel.CRITICAL.get_color()
+        assert colors["Profit Factor"] == "#b00020"
+        assert not caplog.records
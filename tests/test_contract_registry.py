@@ -0,0 +1,91 @@
+"""
+Tests for contract specs and grouping trades per (account, contract family).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from contract_registry import ContractRegistry, parse_symbol
+from trade import Trade
+from trade_stats_accumulator import TradeStatsAccumulator
+
+START = datetime(2025, 6, 12, 6, 30)
+MULTIPLIERS = {"ESU5": 50, "MESU5": 5, "NQU5": 20}
+
+
+def make_config():
+    config = MagicMock()
+    config.get_contract_value.side_effect = MULTIPLIERS.__getitem__
+    return config
+
+
+def fill(order_id, side, symbol, quantity, price, account="SIM1", minutes=0):
+    return Trade(account, order_id, f"Filled {side}", symbol, float(quantity), price, START + timedelta(minutes=minutes))
+
+
+class TestContractRegistry:
+    """Test symbol parsing and multiplier caching."""
+
+    def test_parse_symbol(self):
+        assert parse_symbol("ESU5") == ("ES", 9, 5)
+        assert parse_symbol("MESZ25") == ("MES", 12, 25)
+        assert parse_symbol("CASH") == ("CASH", 0, 0)
+
+    def test_micro_shares_family_with_mini(self):
+        registry = ContractRegistry(make_config())
+        assert registry.spec("MESU5").family == registry.spec("ESU5").family == "ES"
+        assert registry.spec("NQU5").family == "NQ"
+        assert registry.multiplier("MESU5") == 5
+
+    def test_multiplier_looked_up_once_per_symbol(self):
+        config = make_config()
+        registry = ContractRegistry(config)
+        for _ in range(100):
+            registry.spec("ESU5")
+            registry.spec("MESU5")
+        assert config.get_contract_value.call_count == 2
+
+
+class TestMultiSymbolGrouping:
+    """Test that mixed mini/micro trades and separate families close correctly."""
+
+    def test_mini_entry_closed_with_micros(self):
+        stats = TradeStatsAccumulator(make_config())
+        assert stats.add_fill(fill(1, "BUY", "ESU5", 1, 6000.00)) is None
+        assert stats.add_fill(fill(2, "SELL", "MESU5", 5, 6002.00, minutes=1)) is None
+        assert stats.position_size == 0.5  # half the ES exposure is still on
+        assert stats.alert_context()["open_position_size"] == 0.5
+
+        group = stats.add_fill(fill(3, "SELL", "MESU5", 5, 6004.00, minutes=2))
+
+        assert group is not None
+        assert group.trade_amount == 5 * 2.00 * 5 + 5 * 4.00 * 5 - 0  # 150 dollars
+        assert group.max_trade_size == 1  # in ES contracts
+        assert group.trade_point == 3.0
+        assert stats.open_trades == {}
+
+    def test_flat_mixed_trade_leaves_no_open_size(self):
+        stats = TradeStatsAccumulator(make_config())
+        stats.add_fill(fill(1, "BUY", "ESU5", 1, 6000.00))
+        group = stats.add_fill(fill(2, "SELL", "MESU5", 10, 6001.00, minutes=1))
+
+        assert group.trade_amount == 50
+        assert stats.position_size == 0
+        assert stats.alert_context()["open_position_size"] == 0  # not 10 - 1 raw contracts
+
+    def test_families_and_accounts_tracked_separately(self):
+        stats = TradeStatsAccumulator(make_config())
+        stats.add_fill(fill(1, "BUY", "ESU5", 1, 6000.00))
+        stats.add_fill(fill(2, "BUY", "NQU5", 1, 21000.00))
+        stats.add_fill(fill(3, "SELL", "ESU5", 1, 6001.00, account="SIM2"))
+        assert len(stats.open_trades) == 3
+
+        es_trade = stats.add_fill(fill(4, "SELL", "ESU5", 1, 5999.00, minutes=5))
+        nq_trade = stats.add_fill(fill(5, "SELL", "NQU5", 1, 21010.00, minutes=6))
+        short_trade = stats.add_fill(fill(6, "BUY", "ESU5", 1, 6000.00, account="SIM2", minutes=7))
+
+        assert [es_trade.trade_amount, nq_trade.trade_amount, short_trade.trade_amount] == [-50, 200, 50]
+        assert stats.completed_trades == 3
+        assert stats.total_profit_or_loss == 200
+        assert stats.position_size == 0
+        assert stats.entry_time == datetime.max
@@ -0,0 +1,62 @@
+"""
+Tests for the per-account equity curve and its downsampling.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from equity_curve import EquityCurve
+
+START = datetime(2025, 6, 12, 6, 30)
+
+
+class TestEquityCurve:
+    """Test cumulative/peak/drawdown series and min/max-preserving downsampling."""
+
+    def test_peak_and_drawdown_series(self):
+        curve = EquityCurve()
+        for minute, amount in enumerate([100, -250, 300, -50]):
+            curve.append(START + timedelta(minutes=minute), amount)
+
+        assert list(curve.cumulative) == [100, -150, 150, 100]
+        assert list(curve.peak) == [100, 100, 150, 150]
+        assert list(curve.drawdown) == [0, -250, 0, -50]
+        assert curve.max_drawdown == -250
+        assert curve.exit_time(3) == START + timedelta(minutes=3)
+
+    def test_downsample_keeps_extremes(self):
+        rng = random.Random(3)
+        curve = EquityCurve()
+        for minute in range(20_000):
+            curve.append(START + timedelta(minutes=minute), rng.choice([-125, -62.5, 62.5, 125]))
+
+        indices = curve.downsample(200)
+        values = [curve.cumulative[i] for i in indices]
+
+        assert len(indices) <= 200
+        assert list(indices) == sorted(indices)
+        assert indices[0] == 0 and indices[-1] == len(curve) - 1
+        assert max(values) == max(curve.cumulative)
+        assert min(values) == min(curve.cumulative)
+        assert curve.downsample(200) is indices  # cached until the next append
+
+    def test_short_curve_is_not_reduced(self):
+        curve = EquityCurve()
+        curve.append(START, 50)
+        curve.append(START + timedelta(minutes=1), -25)
+        assert curve.downsample(100) == (0, 1)
+        assert len(curve.sparkline(10)) == 2
+
+    def test_downsample_needs_room_for_one_bucket(self):
+        curve = EquityCurve()
+        for minute in range(10):
+            curve.append(START + timedelta(minutes=minute), 25 if minute % 3 else -50)
+        assert len(curve.downsample(4)) <= 4
+        with pytest.raises(ValueError):
+            curve.downsample(3)
+
+    def test_empty_curve(self):
+        assert EquityCurve().sparkline() == ""
+        assert EquityCurve().points(10) == []
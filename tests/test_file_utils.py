@@ -0,0 +1,66 @@
+"""
+Tests for the cached directory scan behind the log file selector.
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import file_utils
+from constants import CONST
+
+
+class TestMatchingFiles:
+    """Test matching, ordering, date filtering and cache invalidation."""
+
+    def setup_method(self):
+        file_utils.clear_listing_cache()
+        self.directory = Path(tempfile.mkdtemp())
+        now = time.time()
+        self.paths = {}
+        for name, age_days in (("output.log", 0), ("output1.log", 2), ("output2.log", 40), ("notes.txt", 1)):
+            path = self.directory / name
+            path.write_text("x\n")
+            os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+            self.paths[name] = str(path)
+        (self.directory / "output_dir").mkdir()
+        self.old_dir_time = os.stat(self.directory).st_mtime
+
+    def matching(self, **kwargs):
+        return file_utils.get_all_matching_files(str(self.directory), CONST.LOG_FILENAME_PATTERN, **kwargs)
+
+    def test_newest_first_and_files_only(self):
+        assert self.matching() == [self.paths["output.log"], self.paths["output1.log"], self.paths["output2.log"]]
+        assert file_utils.get_most_recent_file(str(self.directory), CONST.LOG_FILENAME_PATTERN) == self.paths["output.log"]
+
+    def test_date_range_filter(self):
+        since = datetime.now() - timedelta(days=30)
+        assert self.matching(since=since) == [self.paths["output.log"], self.paths["output1.log"]]
+        until = datetime.now() - timedelta(days=1)
+        assert self.matching(since=since, until=until) == [self.paths["output1.log"]]
+
+    def test_listing_is_cached_until_directory_changes(self):
+        self.matching()
+        with patch("file_utils.os.scandir", wraps=os.scandir) as scandir:
+            self.matching()
+            assert scandir.call_count == 0
+
+            new_path = self.directory / "output3.log"
+            new_path.write_text("x\n")
+            os.utime(self.directory, (self.old_dir_time + 5, self.old_dir_time + 5))
+            assert self.matching()[0] == str(new_path)
+            assert scandir.call_count == 1
+
+    def test_growing_log_is_reordered_without_rescan(self):
+        live_path = self.directory / "output5.log"
+        live_path.write_text("x\n")
+        earlier = time.time() - 3600
+        os.utime(live_path, (earlier, earlier))
+        assert self.matching()[0] == self.paths["output.log"]
+
+        later = time.time() + 60
+        os.utime(live_path, (later, later))  # appended to; the directory is unchanged
+        assert self.matching()[0] == str(live_path)
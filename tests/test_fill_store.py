@@ -0,0 +1,113 @@
+"""
+Tests for the columnar FillStore and log ingestion into it.
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from fill_store import FillStore, from_epoch_seconds, to_epoch_seconds
+from trade import Trade
+from trade_stats_processor import TradeStatsProcessor, fill_epoch_seconds
+from fixtures.log_writer import format_fill_line, format_noise_line, write_log
+
+
+class TestFillStore:
+    """Test FillStore storage and the namedtuple-compatible view."""
+
+    def test_round_trip_returns_trade_namedtuples(self):
+        """Fills read back as Trade tuples with the original values."""
+        store = FillStore()
+        fill_time = datetime(2025, 6, 12, 9, 31)
+        store.add("SIM1", 101, "Filled BUY", "ESU5", 2.0, 6001.25, fill_time)
+
+        trade = store[0]
+        assert isinstance(trade, Trade)
+        assert trade == Trade("SIM1", 101, "Filled BUY", "ESU5", 2.0, 6001.25, fill_time)
+        assert list(store) == [trade]
+
+    def test_duplicate_order_replaces_in_place(self):
+        """A repeated (account, order_id) overwrites the earlier fill."""
+        store = FillStore()
+        fill_time = datetime(2025, 6, 12, 9, 31)
+        store.add("SIM1", 101, "Filled BUY", "ESU5", 1.0, 6000.00, fill_time)
+        store.add("SIM1", 102, "Filled SELL", "ESU5", 1.0, 6001.00, fill_time)
+        store.add("SIM1", 101, "Filled BUY", "ESU5", 1.0, 6000.50, fill_time)
+        store.add("SIM2", 101, "Filled BUY", "MESU5", 1.0, 6000.00, fill_time)
+
+        assert len(store) == 3
+        assert store[0].fill_price == 6000.50
+        assert [t.order_id for t in store.for_account("SIM1")] == [101, 102]
+        assert store.accounts_with_fills() == ["SIM1", "SIM2"]
+
+    def test_strings_are_interned(self):
+        """Account and symbol strings are stored once regardless of fill count."""
+        store = FillStore()
+        fill_time = datetime(2025, 6, 12, 9, 31)
+        for order_id in range(100):
+            store.add("SIM1", order_id, "Filled BUY", "ESU5", 1.0, 6000.0, fill_time)
+
+        assert store.account_names == ["SIM1"]
+        assert store.symbols == ["ESU5"]
+        assert store.account_idx.itemsize == 2
+        assert store.side.itemsize == 1
+
+    def test_epoch_seconds_round_trip(self):
+        """Second timestamps survive the int64 encoding."""
+        value = datetime(2025, 12, 31, 23, 59, 58)
+        assert from_epoch_seconds(to_epoch_seconds(value)) == value
+
+    def test_missing_account_returns_empty(self):
+        assert FillStore().for_account("nobody") == []
+
+
+class TestGetFills:
+    """Test TradeStatsProcessor.get_fills against synthetic logs."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        self.processor.config = MagicMock()
+
+    def test_get_fills_returns_store(self):
+        """Fill lines are parsed into the store and noise is skipped."""
+        when = datetime(2025, 6, 12, 9, 31, 5)
+        path = self.temp_dir / "output.log"
+        write_log(
+            path,
+            [
+                format_noise_line(when),
+                format_fill_line(1, "SIM1", "ESU5", "BUY", 1, 6000.25, when),
+                format_fill_line(2, "SIM1", "ESU5", "SELL", 1, 6001.25, when),
+                format_fill_line(2, "SIM1", "ESU5", "SELL", 1, 6001.25, when),
+            ],
+        )
+
+        fills = self.processor.get_fills([str(path)])
+
+        assert isinstance(fills, FillStore)
+        assert len(fills) == 2
+        assert fills[0].order_type == "Filled BUY"
+        assert fills[1].fill_price == 6001.25
+        assert fills[1].fill_time == datetime(2025, 6, 12, 9, 31, 5)  # seconds from the line prefix
+
+    def test_fill_time_seconds_from_line_prefix(self):
+        """The line's HH:MM:SS gives the seconds; a line far from the fill minute does not."""
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 9:31 AM", 9 * 3600 + 31 * 60 + 59)) == datetime(
+            2025, 6, 12, 9, 31, 59
+        )
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 12:05 PM", 12 * 3600 + 6 * 60 + 1)) == datetime(
+            2025, 6, 12, 12, 6, 1
+        )
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 12:05 AM", 5 * 60 + 30)) == datetime(2025, 6, 12, 0, 5, 30)
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 11:59 PM", 0 * 3600 + 12)) == datetime(2025, 6, 13, 0, 0, 12)
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 09:31 AM", 10 * 3600)) == datetime(2025, 6, 12, 9, 31)
+        assert from_epoch_seconds(fill_epoch_seconds("06/12/2025 9:31 AM")) == datetime(2025, 6, 12, 9, 31)
+
+    def test_fill_time_matches_strptime(self):
+        """The integer parse agrees with strptime on the minute for every hour."""
+        for hour in range(24):
+            value = datetime(2025, 1, 2, hour, 7)
+            text = value.strftime("%m/%d/%Y %I:%M %p")
+            assert from_epoch_seconds(fill_epoch_seconds(text)) == datetime.strptime(text, "%m/%d/%Y %I:%M %p")
@@ -0,0 +1,155 @@
+"""
+Tests for fill-to-alert latency tracking.
+"""
+
+import json
+import stat
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from config import Config
+from constants import CONST
+from hammerspoon_alert_manager import HammerspoonAlertManager
+from latency_tracker import LatencyTracker, log_line_timestamp, percentile
+from trade_stats_processor import TradeStatsProcessor, parse_line_seconds
+from fixtures.log_writer import format_account_line, format_fill_line, write_log
+
+
+def round_trip_lines(first_order_id, count, start, points=-2.5):
+    lines = []
+    for index in range(count):
+        order_id = first_order_id + 2 * index
+        entry = start + timedelta(minutes=2 * index)
+        lines.append(format_fill_line(order_id, "SIM1", "ESU5", "BUY", 1, 6000.00, entry))
+        lines.append(format_fill_line(order_id + 1, "SIM1", "ESU5", "SELL", 1, 6000.00 + points, entry + timedelta(minutes=1)))
+    return lines
+
+
+class TestLatencyTracker:
+    """Test percentiles, stage bookkeeping and export."""
+
+    def test_nearest_rank_percentiles(self):
+        values = [float(value) for value in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+        assert percentile([0.3], 99) == 0.3
+
+    def test_line_time_across_midnight(self):
+        fill_time = datetime(2025, 6, 12, 0, 0)
+        before_midnight = log_line_timestamp(23 * 3600 + 59 * 60 + 59, fill_time)
+        assert before_midnight == datetime(2025, 6, 11, 23, 59, 59).timestamp()
+        assert log_line_timestamp(5, fill_time) == datetime(2025, 6, 12, 0, 0, 5).timestamp()
+
+    def test_line_seconds_prefix(self):
+        assert parse_line_seconds("06:30:15 INFO ...") == 6 * 3600 + 30 * 60 + 15
+        assert parse_line_seconds("INFO 06:30:15") is None
+        assert parse_line_seconds("") is None
+
+    def test_stages_follow_the_fill(self):
+        tracker = LatencyTracker(clock=lambda: 1000.0)
+        assert tracker.record_ingest(["SIM1", CONST.ALL_ACCOUNTS], 999.0, 999.5)
+        tracker.record_stats("SIM1", now=999.75)
+        tracker.record_evaluated("SIM1", alerted=True, now=1000.0)
+        tracker.record_evaluated(CONST.ALL_ACCOUNTS, alerted=False, now=1000.0)
+
+        assert tracker.take_awaiting_dispatch(CONST.ALL_ACCOUNTS) == []
+        log_times = tracker.take_awaiting_dispatch("SIM1")
+        assert log_times == [999.0]
+        assert tracker.take_awaiting_dispatch("SIM1") == []
+        tracker.on_done("dispatch", log_times)()
+
+        summary = tracker.summary()
+        assert summary["ingest"]["p50"] == 0.5
+        assert summary["stats"]["p50"] == 0.75
+        assert summary["evaluate"]["count"] == 2
+        assert summary["dispatch"]["p99"] == 1.0
+        assert summary["block"]["count"] == 0
+        assert tracker.on_done("block", []) is None
+
+    def test_stale_lines_are_not_tracked(self):
+        tracker = LatencyTracker()
+        assert not tracker.record_ingest(["SIM1"], 0.0, 3600.0)
+        assert not tracker.has_pending("SIM1")
+        assert tracker.summary()["ingest"]["count"] == 0
+
+    def test_histogram_and_export(self):
+        tracker = LatencyTracker()
+        for age in (0.1, 0.4, 3.0, 120.0):
+            tracker.record_ingest(["SIM1"], 0.0, age)
+        assert tracker.histogram("ingest") == [1, 1, 0, 0, 1, 0, 0, 0, 1]
+
+        path = tracker.export(Path(tempfile.mkdtemp()) / "latency.json")
+        exported = json.loads(path.read_text())
+        assert exported["summary"]["ingest"]["count"] == 4
+        assert exported["histograms"]["ingest"] == [1, 1, 0, 0, 1, 0, 0, 0, 1]
+        assert exported["samples"]["ingest"] == [0.1, 0.4, 3.0, 120.0]
+        assert "p95" in tracker.format_summary()
+
+
+class TestFillToAlertLatency:
+    """Test a live fill end to end: appended log line through a stand-in hs."""
+
+    def test_appended_fill_measured_through_dispatch(self, tmp_path):
+        hs_calls = tmp_path / "hs_calls.txt"
+        hs_path = tmp_path / "hs"
+        hs_path.write_text(f'#!/bin/sh\necho "$@" >> "{hs_calls}"\nexit 0\n')
+        hs_path.chmod(hs_path.stat().st_mode | stat.S_IXUSR)
+
+        now = datetime.now().replace(microsecond=0)
+        start = now - timedelta(minutes=30)
+        log_path = tmp_path / "output.log"
+        write_log(log_path, [format_account_line("SIM1", start)] + round_trip_lines(1, 10, start))
+
+        processor = TradeStatsProcessor(Config())
+        processor.refresh_fills([str(log_path)])
+        processor.update_trade_stats()
+        assert processor.latency.summary()["ingest"]["count"] == 0  # history, not live
+
+        with open(log_path, "a", encoding="utf-8") as handle:
+            handle.writelines(round_trip_lines(21, 1, now - timedelta(minutes=1)))
+        assert processor.refresh_fills([str(log_path)])
+        processor.update_trade_stats()
+
+        alerts = processor.account_trading_alerts["SIM1"]
+        assert alerts
+        log_times = processor.latency.take_awaiting_dispatch("SIM1")
+        assert len(log_times) == 2
+
+        shown = threading.Event()
+        on_done = processor.latency.on_done("dispatch", log_times)
+
+        def on_shown():
+            on_done()
+            shown.set()
+
+        alert_manager = HammerspoonAlertManager(hs_path=str(hs_path))
+        alert = alerts[0]
+        assert alert_manager.display_alert(alert.message, alert.account, on_shown=on_shown)
+        assert shown.wait(5)
+        assert alert.message in hs_calls.read_text()
+
+        summary = processor.latency.summary()
+        for stage in ("ingest", "stats", "evaluate", "dispatch"):
+            assert summary[stage]["count"] >= 2, stage
+            assert 0.0 <= summary[stage]["p99"] < 120.0, stage
+        assert summary["dispatch"]["p50"] >= summary["ingest"]["p50"]
+
+    def test_missing_hs_is_not_shown(self, tmp_path):
+        alert_manager = HammerspoonAlertManager(hs_path=str(tmp_path / "missing-hs"))
+        shown = threading.Event()
+        assert alert_manager.display_alert("Slow down.", "SIM1", on_shown=shown.set)
+        assert not shown.wait(0.5)
+
+    def test_throttled_alert_reports_not_displayed(self, tmp_path):
+        hs_path = tmp_path / "hs"
+        hs_path.write_text("#!/bin/sh\nexit 0\n")
+        hs_path.chmod(hs_path.stat().st_mode | stat.S_IXUSR)
+        alert_manager = HammerspoonAlertManager(hs_path=str(hs_path))
+        shown = threading.Event()
+        assert alert_manager.display_alert("Slow down.", "SIM1", min_interval_secs=600, on_shown=shown.set)
+        assert shown.wait(5)
+        assert not alert_manager.display_alert("Slow down.", "SIM1", min_interval_secs=600)
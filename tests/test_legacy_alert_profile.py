@@ -0,0 +1,89 @@
+"""
+Tests for the built-in (legacy) alert profile used when no JSON profile loads.
+"""
+
+import logging
+from unittest.mock import MagicMock
+
+from alert_config_manager import AlertConfigManager
+from concern_level import ConcernLevel
+from legacy_alert_profile import LEGACY_PROFILE, legacy_evaluator
+from trade_stats_processor import TradeStatsProcessor
+
+
+def legacy_processor():
+    processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+    processor.alert_config_manager = None
+    return processor
+
+
+class TestLegacyAlertProfile:
+    """Test the built-in profile matches the old hard-coded alerts."""
+
+    def test_profile_passes_schema_and_expression_checks(self):
+        manager = AlertConfigManager()
+        assert manager.schema_errors(LEGACY_PROFILE) == []
+        assert manager._condition_errors(LEGACY_PROFILE) == []
+
+    def test_evaluator_compiled_once(self):
+        assert legacy_evaluator() is legacy_evaluator()
+
+    def test_alerts_in_legacy_order_with_rendered_messages(self):
+        streak_tracker = MagicMock(streak=-8)
+        context = {
+            "completed_trades": 35,
+            "total_profit_or_loss": -1500,
+            "profit_factor": 0.8,
+            "win_rate": 20,
+            "loss_scaled_count": 6,
+            "loss_max_size": 8,
+            "current_drawdown": -2500,
+            "directional_bias_extramsg": "Test bias",
+            "streak_tracker": streak_tracker,
+            "streak_extramsg": "Join the LONG.",
+        }
+
+        alerts = legacy_processor()._legacy_alerts(context)
+
+        assert [(alert["message"], alert["level"], alert["extra_message"]) for alert in alerts] == [
+            ("Stop Now. Protect the version of YOU that will trade well tomorrow.", ConcernLevel.CRITICAL, ""),
+            ("Reset. Large drawdown.", ConcernLevel.WARNING, "-2,500"),
+            ("Pause. Reset first, then recover.", ConcernLevel.WARNING, "-1,500"),
+            ("Stop. Maximum trades for the day reached.", ConcernLevel.CRITICAL, "35"),
+            ("Reset. Win Rate very low.", ConcernLevel.WARNING, "Test bias"),
+            ("Reset. Profit Factor very low.", ConcernLevel.WARNING, "Test bias"),
+            ("Size down.", ConcernLevel.CAUTION, ""),
+            ("Reset. Scale up winners only.", ConcernLevel.WARNING, ""),
+        ]
+
+    def test_streak_extra_message_and_trade_goal_in_profit(self):
+        context = {
+            "completed_trades": 21,
+            "total_profit_or_loss": 1250.0,
+            "profit_factor": 2.0,
+            "win_rate": 60,
+            "streak_tracker": MagicMock(streak=-2),
+            "streak_extramsg": "Join the SHORT.",
+        }
+
+        alerts = legacy_processor()._legacy_alerts(context)
+
+        assert [(alert["id"], alert["message"], alert["extra_message"]) for alert in alerts] == [
+            ("legacy-losing-streak-slow-down", "Slow down. Consecutive losses. Join the SHORT.", ""),
+            ("legacy-pnl-protect-gains", "Wind down. Protect gains.", "+1,250"),
+            ("legacy-trade-count-goal-positive", "Wind down. You've reached your trade count goal.", "21"),
+        ]
+
+    def test_partial_context_uses_defaults_quietly(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            assert legacy_processor()._legacy_alerts({"streak_tracker": None}) == []
+        assert caplog.records == []
+
+    def test_fallback_when_profile_evaluation_fails(self):
+        processor = legacy_processor()
+        processor.alert_config_manager = MagicMock()
+        processor.alert_config_manager.get_active_config.side_effect = Exception("JSON failed")
+
+        alerts = processor._evaluate_alerts({"completed_trades": 12, "win_rate": 60, "profit_factor": 2.0})
+
+        assert [alert["id"] for alert in alerts] == ["legacy-trade-count-slow-down"]
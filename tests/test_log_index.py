@@ -0,0 +1,134 @@
+"""
+Tests for the sparse log time index and time-of-day range reads.
+"""
+
+import gzip
+import tempfile
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+from log_index import LogIndex, index_path, read_time_range, update_index
+from log_parser import FILL_MARKER_BYTES
+from log_tailer import LogTailer
+from fixtures.log_writer import format_fill_line, format_noise_line, write_log
+
+START = datetime(2025, 6, 12, 6, 0)
+
+
+def day_lines(start, count, step_secs=7):
+    lines = []
+    for index in range(count):
+        when = start + timedelta(seconds=step_secs * index)
+        if index % 50 == 0:
+            lines.append(format_fill_line(index, "SIM1", "ESU5", "BUY", 1, 6000.00, when))
+        else:
+            lines.append(format_noise_line(when, f"line-{index}"))
+        if index % 97 == 0:
+            lines.append("    at com.motivewave.Continuation(Unknown Source)\n")  # no timestamp
+    return lines
+
+
+def scan(lines, start, end=None):
+    """Reference: every line in [start, end), continuations taking the time before them."""
+    start_secs = start.hour * 3600 + start.minute * 60 + start.second
+    end_secs = end.hour * 3600 + end.minute * 60 + end.second if end else 86_400
+    selected, current = [], None
+    for line in lines:
+        if line[2:3] == ":":
+            current = int(line[0:2]) * 3600 + int(line[3:5]) * 60 + int(line[6:8])
+        if current is not None and start_secs <= current < end_secs:
+            selected.append(line)
+    return selected
+
+
+class TestLogIndex:
+    """Test range reads match a full scan and the cache stays valid."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.index_dir = self.temp_dir / "index"
+        self.path = self.temp_dir / "output.log"
+
+    def test_range_read_matches_full_scan(self):
+        lines = day_lines(START, 5_000)
+        write_log(self.path, lines)
+        for start, end in ((time(9, 30), time(10, 30)), (time(0, 0), time(6, 0, 7)), (time(15, 0), time(23, 0))):
+            read = list(read_time_range(self.path, start, end, self.index_dir, stride=100))
+            assert read == scan(lines, start, end), (start, end)
+        assert list(read_time_range(self.path, index_dir=self.index_dir, stride=100)) == lines
+
+    def test_seek_skips_the_lines_before_the_window(self):
+        write_log(self.path, day_lines(START, 5_000))
+        index = update_index(self.path, self.index_dir, stride=100)
+        offset, _ = index.seek(9 * 3600 + 30 * 60)
+        assert 0 < offset < index.size
+        assert len(index.offsets) >= 5_000 // 100
+
+    def test_log_past_midnight_reads_both_days(self):
+        lines = day_lines(datetime(2025, 6, 12, 23, 0), 1_200, step_secs=6)  # 23:00 -> 01:00
+        write_log(self.path, lines)
+        index = update_index(self.path, self.index_dir, stride=50)
+        assert index.days == 2
+        assert index.times == sorted(index.times)
+
+        read = list(read_time_range(self.path, time(0, 30), time(23, 30), self.index_dir, stride=50))
+        assert read == scan(lines, time(0, 30), time(23, 30))
+        late = list(read_time_range(self.path, time(23, 50), None, self.index_dir, stride=50))
+        assert late == scan(lines, time(23, 50))
+        assert late[0].startswith("23:50:") and late[-1].startswith("23:59:")
+
+    def test_cached_index_extended_then_rebuilt_when_rewritten(self):
+        write_log(self.path, day_lines(START, 500))
+        first = update_index(self.path, self.index_dir, stride=100)
+        assert index_path(self.path, self.index_dir).exists()
+
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(day_lines(START + timedelta(hours=2), 500))
+            handle.write("12:00:00 INFO partial")  # still being written
+        extended = update_index(self.path, self.index_dir, stride=100)
+        assert extended.offsets[: len(first.offsets)] == first.offsets
+        assert extended.lines > first.lines
+        assert extended.size < self.path.stat().st_size
+
+        write_log(self.path, day_lines(START + timedelta(hours=1), 300))
+        rebuilt = update_index(self.path, self.index_dir, stride=100)
+        assert rebuilt.times[0] == 7 * 3600
+
+    def test_tailer_builds_the_same_index(self):
+        lines = day_lines(START, 2_000)
+        write_log(self.path, lines[:1_000])
+        tailer = LogTailer()
+        list(tailer.new_lines(str(self.path)))
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(lines[1_000:])
+        marked = list(tailer.new_lines(str(self.path), (FILL_MARKER_BYTES,)))
+        assert marked == [line for line in lines[1_000:] if FILL_MARKER_BYTES.decode() in line]
+        tailer.save_indexes(self.index_dir)
+        assert not tailer.indexes[str(self.path)].dirty
+
+        cached = LogIndex.load(index_path(self.path, self.index_dir))
+        built = update_index(self.path, self.temp_dir / "fresh")
+        assert (cached.offsets, cached.times, cached.size) == (built.offsets, built.times, built.size)
+        assert cached.matches(self.path)
+
+    def test_blocks_sample_the_same_lines(self):
+        raw_lines = [line.encode() for line in day_lines(START, 3_000)]
+        per_line, blocks = LogIndex(stride=100), LogIndex(stride=100)
+        offset = 0
+        for raw_line in raw_lines:
+            per_line.observe(offset, raw_line)
+            offset += len(raw_line)
+        offset = 0
+        for first in range(0, len(raw_lines), 777):  # block edges fall between samples
+            block = b"".join(raw_lines[first : first + 777])
+            blocks.observe_block(offset, block)
+            offset += len(block)
+        assert (blocks.offsets, blocks.times, blocks.lines) == (per_line.offsets, per_line.times, per_line.lines)
+
+    def test_compressed_archive_is_scanned(self):
+        lines = day_lines(START, 1_000)
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.writelines(lines)
+        read = list(read_time_range(self.path, time(7, 0), time(7, 30), self.index_dir))
+        assert read == scan(lines, time(7, 0), time(7, 30))
+        assert not self.index_dir.exists()
@@ -0,0 +1,159 @@
+"""
+Tests for the single-pass fill and account line parsers: agreement with the
+old regexes, fuzzing, and bounded time on pathological lines.
+"""
+
+import random
+import re
+import time
+from datetime import datetime, timedelta
+
+from log_parser import parse_account_line, parse_fill_line
+from fixtures.log_writer import format_account_line, format_fill_line, format_noise_line
+
+# the patterns the parsers replace, kept as the reference for well-formed lines
+OLD_FILL_PATTERN = re.compile(
+    r"OrderDirectory::orderFilled\(\) order: ID: (\S+) (\S+) (\S+)\.CME.*(Filled BUY|Filled SELL).*Qty:(\d+\.\d+).*Last Fill Time:\s*(\d{2}/\d{2}/\d{4} \d{1,2}:\d{2} [AP]M).*fill price: (\d+\.\d+)"
+)
+OLD_ACCOUNT_PATTERN = re.compile(r"ACCOUNT:\s*(\S+)\s+fcmId:")
+
+START = datetime(2025, 6, 12, 6, 30)
+MAX_LINE_SECS = 0.05
+
+
+def random_fill_line(rng):
+    when = START + timedelta(seconds=rng.randrange(12 * 3600))
+    kind = rng.choice(["MKT", "LMT", "STP"])
+    return format_fill_line(
+        rng.randrange(1, 10**6),
+        rng.choice(["SIM1", "Sim101", "APEX-1234-05", "acct_9"]),
+        rng.choice(["ESU5", "MESU5", "NQZ5", "MNQZ5"]),
+        rng.choice(["BUY", "SELL"]),
+        float(rng.randrange(1, 20)),
+        6000 + rng.randrange(400) * 0.25,
+        when,
+        kind,
+        6000 + rng.randrange(400) * 0.25 if kind == "STP" else 0.0,
+    )
+
+
+def old_fields(line):
+    match = OLD_FILL_PATTERN.search(line)
+    if not match:
+        return None
+    return (match.group(1), match.group(2), match.group(3), match.group(4), float(match.group(5)), match.group(6), float(match.group(7)))
+
+
+def new_fields(line):
+    fill = parse_fill_line(line)
+    if fill is None:
+        return None
+    return (
+        fill.order_id,
+        fill.account_name,
+        fill.contract_symbol,
+        fill.order_type,
+        fill.quantity,
+        fill.last_fill_time,
+        fill.fill_price,
+    )
+
+
+def timed(parse, line):
+    started = time.perf_counter()
+    parse(line)
+    return time.perf_counter() - started
+
+
+class TestFillLineParser:
+    """Test the tokenizer agrees with the old regex on fills and near-fills."""
+
+    def test_fields_of_a_stop_fill(self):
+        line = format_fill_line(12, "SIM1", "ESU5", "BUY", 2, 6001.50, START, "STP", 6001.25)
+        fill = parse_fill_line(line)
+        assert fill.order_id == "SIM-12"
+        assert (fill.account_name, fill.contract_symbol) == ("SIM1", "ESU5")
+        assert (fill.order_side, fill.order_kind, fill.aux_price) == ("BUY", "STP", 6001.25)
+        assert (fill.order_type, fill.quantity, fill.fill_price) == ("Filled BUY", 2.0, 6001.50)
+        assert fill.last_fill_time == "06/12/2025 06:30 AM"
+
+    def test_matches_old_pattern_on_generated_fills(self):
+        rng = random.Random(48)
+        for _ in range(2_000):
+            line = random_fill_line(rng)
+            assert new_fields(line) == old_fields(line) is not None, line
+
+    def test_every_truncation_matches_old_pattern(self):
+        line = format_fill_line(7, "SIM1", "ESU5", "SELL", 1, 5999.75, START, "STP", 6000.00)
+        for end in range(len(line)):
+            assert new_fields(line[:end]) == old_fields(line[:end]), line[:end]
+
+    def test_mutated_lines_never_raise_and_agree(self):
+        rng = random.Random(4848)
+        alphabet = "0123456789.:/ ABCDEFGLMPQSTUYadeilnoprty-_\t"
+        for _ in range(5_000):
+            chars = list(random_fill_line(rng))
+            for _ in range(rng.randrange(1, 4)):
+                position = rng.randrange(len(chars))
+                action = rng.randrange(3)
+                if action == 0:
+                    del chars[position]
+                elif action == 1:
+                    chars.insert(position, rng.choice(alphabet))
+                else:
+                    chars[position] = rng.choice(alphabet)
+            line = "".join(chars)
+            assert new_fields(line) == old_fields(line), line
+
+    def test_noise_is_not_a_fill(self):
+        assert parse_fill_line(format_noise_line(START)) is None
+        assert parse_fill_line(format_account_line("SIM1", START)) is None
+        assert parse_fill_line("") is None
+
+
+class TestAccountLineParser:
+    """Test account lines against the old regex."""
+
+    def test_matches_old_pattern(self):
+        lines = [
+            format_account_line("SIM1", START),
+            "06:30:00 INFO ACCOUNT:SIM2 fcmId: SIM\n",
+            "06:30:00 INFO ACCOUNT:  SIM3\t fcmId:x\n",
+            "06:30:00 INFO ACCOUNT: SIM4\n",
+            "06:30:00 INFO ACCOUNT: SIM5 ibId: SIM\n",
+            "06:30:00 INFO ACCOUNT: fcmId: SIM\n",
+            "ACCOUNT:",
+            "",
+        ]
+        for line in lines:
+            match = OLD_ACCOUNT_PATTERN.search(line)
+            assert parse_account_line(line) == (match.group(1) if match else None), line
+
+
+class TestBoundedTime:
+    """Test pathological lines parse in time linear in their length."""
+
+    def pathological_lines(self, repeat):
+        head = "OrderDirectory::orderFilled() order: ID: SIM-1 SIM1 ESU5.CME "
+        return [
+            # every marker repeated, no final "fill price: " (seconds for the old regex at 10 KB)
+            head + "Filled BUY Qty:1.0 Last Fill Time: 01/02/2025 9:31 AM " * repeat,
+            head + "Filled SELL Qty:" * (repeat * 4),
+            head + "x" * (repeat * 50),
+            "\tat com.motivewave.platform.Order.fill(Order.java:120) " * repeat,
+            "ACCOUNT: " + "A" * (repeat * 50),
+            "ACCOUNT:" * (repeat * 8),
+        ]
+
+    def test_each_line_parses_quickly(self):
+        for line in self.pathological_lines(2_000):  # ~100 KB lines
+            for parse in (parse_fill_line, parse_account_line):
+                assert min(timed(parse, line) for _ in range(3)) < MAX_LINE_SECS, (parse.__name__, line[:60])
+
+    def test_time_grows_linearly(self):
+        for small, large in zip(self.pathological_lines(200), self.pathological_lines(2_000)):
+            for parse in (parse_fill_line, parse_account_line):
+                small_secs = min(timed(parse, small) for _ in range(5))
+                large_secs = min(timed(parse, large) for _ in range(5))
+                # 10x the input; quadratic would be ~100x
+                assert large_secs < max(small_secs, 1e-5) * 40, (parse.__name__, small[:60])
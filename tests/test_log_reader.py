@@ -0,0 +1,144 @@
+"""
+Tests for reading gzip/zstd archived and corrupted logs through the ingestion layer.
+"""
+
+import gzip
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from log_parser import ACCOUNT_MARKER_BYTES, FILL_MARKER_BYTES
+from log_reader import ZSTD_MAGIC, compression_of, open_log, scan_lines
+from log_tailer import LogTailer
+from trade_stats_processor import TradeStatsProcessor
+from fixtures.log_writer import format_account_line, format_fill_line, format_noise_line, write_log
+
+WHEN = datetime(2025, 6, 12, 9, 31, 5)
+LINES = [
+    format_account_line("SIM1", WHEN),
+    format_noise_line(WHEN),
+    format_fill_line(1, "SIM1", "ESU5", "BUY", 1, 6000.25, WHEN),
+    format_fill_line(2, "SIM1", "ESU5", "SELL", 1, 6001.25, WHEN),
+]
+
+
+def write_gzip(path, lines):
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        handle.writelines(lines)
+
+
+class TestCompressedLogs:
+    """Test magic byte detection and parsing of archived logs."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        self.processor.config = MagicMock()
+
+    def test_detects_compression_by_content_not_name(self):
+        plain = self.temp_dir / "output.log.gz"
+        write_log(plain, LINES)
+        archived = self.temp_dir / "output-archived"
+        write_gzip(archived, LINES)
+
+        assert compression_of(plain) is None
+        assert compression_of(archived) == "gzip"
+        with open_log(archived) as handle:
+            assert list(handle) == LINES
+
+    def test_processor_reads_gzip_archives(self):
+        plain = self.temp_dir / "output.log"
+        write_log(plain, LINES[:3])
+        archived = self.temp_dir / "output-old.log.gz"
+        write_gzip(archived, [format_fill_line(7, "SIM2", "ESU5", "BUY", 1, 6000.0, WHEN)] + LINES[:1])
+
+        fills = self.processor.get_fills([str(plain), str(archived)])
+        self.processor.load_account_names([str(archived)])
+
+        assert len(fills) == 2
+        assert fills[1].account_name == "SIM2"
+        assert "SIM1" in self.processor.account_names_loaded
+
+    def test_tailer_reads_archive_once(self):
+        archived = self.temp_dir / "output.log.gz"
+        write_gzip(archived, LINES)
+        tailer = LogTailer()
+
+        assert list(tailer.new_lines(str(archived))) == LINES
+        assert list(tailer.new_lines(str(archived))) == []
+        assert tailer.is_resumable([str(archived)])
+
+        write_gzip(archived, LINES + LINES)
+        assert not tailer.is_resumable([str(archived)])
+
+    def test_zstd_archive(self):
+        zstandard = pytest.importorskip("zstandard")
+        archived = self.temp_dir / "output.log.zst"
+        archived.write_bytes(zstandard.ZstdCompressor().compress("".join(LINES).encode("utf-8")))
+
+        assert compression_of(archived) == "zstd"
+        assert len(self.processor.get_fills([str(archived)])) == 2
+
+    def test_zstd_without_package_is_a_clear_error(self):
+        archived = self.temp_dir / "output.log.zst"
+        archived.write_bytes(ZSTD_MAGIC + b"\x00" * 16)
+
+        with patch.dict("sys.modules", {"zstandard": None}):
+            with pytest.raises(RuntimeError, match="zstandard"):
+                open_log(archived)
+
+
+class TestCorruptedLogs:
+    """Test invalid bytes never abort a read and the byte scanner finds every marked line."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.processor = TradeStatsProcessor.__new__(TradeStatsProcessor)
+        self.processor.config = MagicMock()
+
+    def corrupted_log(self):
+        return b"".join(
+            [
+                b"09:31:05 INFO ConnectionManager::ping() caf\xe9 \xff\xfe\x80\n",  # latin-1 and stray bytes
+                LINES[0].encode("utf-8"),
+                b"\x00\x00\xc3\n",  # truncated UTF-8 sequence, NULs from a crash mid-write
+                LINES[2].encode("utf-8"),
+                LINES[3].replace("SIM1", "SIM\u00e9").encode("latin-1"),  # account name in another encoding
+                b"\xef\xbb\xbf" + LINES[1].encode("utf-8"),
+            ]
+        )
+
+    def test_processor_reads_past_invalid_bytes(self):
+        for name, write in (("output.log", Path.write_bytes), ("output-old.log", lambda p, b: p.write_bytes(gzip.compress(b)))):
+            path = self.temp_dir / name
+            write(path, self.corrupted_log())
+
+            fills = self.processor.get_fills([str(path)])
+            self.processor.load_account_names([str(path)])
+
+            assert [fill.account_name for fill in fills] == ["SIM1", "SIM\ufffd"]
+            assert fills[1].fill_price == 6001.25
+            assert "SIM1" in self.processor.account_names_loaded
+            with open_log(path) as handle:
+                assert len(list(handle)) == 6
+
+    def test_scan_matches_text_filter_across_chunk_boundaries(self):
+        lines = []
+        for index in range(300):
+            lines.append(format_noise_line(WHEN, "x" * (index % 37)))
+            if index % 7 == 0:
+                lines.append(format_fill_line(index, "SIM1", "ESU5", "BUY", 1, 6000.0, WHEN))
+            if index % 11 == 0:
+                lines.append(format_account_line(f"SIM{index}", WHEN).replace("\n", "\r\n"))
+        lines.append(format_fill_line(999, "SIM1", "ESU5", "SELL", 1, 6001.0, WHEN).rstrip("\n"))  # no final newline
+        path = self.temp_dir / "output.log"
+        path.write_bytes("".join(lines).encode("utf-8"))
+
+        markers = (FILL_MARKER_BYTES, ACCOUNT_MARKER_BYTES)
+        expected = [line for line in lines if "orderFilled()" in line or "ACCOUNT:" in line]
+        for chunk_bytes in (1, 13, 64, 4096, 1 << 20):
+            assert list(scan_lines(path, markers, chunk_bytes)) == expected, chunk_bytes
+        assert list(scan_lines(path, (b"no such marker",))) == []
@@ -0,0 +1,90 @@
+"""
+Tests for the adaptive log refresh / open-duration scheduler.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from fill_store import FillStore
+from refresh_scheduler import RefreshScheduler
+from trade_stats_processor import TradeStatsProcessor
+
+
+def make_scheduler():
+    return RefreshScheduler(
+        fast_ms=500, idle_ms=10_000, max_idle_ms=60_000, active_secs=120, duration_ms=60_000, clock=lambda: 0.0
+    )
+
+
+class TestRefreshScheduler:
+    """Test fast polling while active, idle backoff and the merged duration tick."""
+
+    def test_idle_backs_off_exponentially_to_cap(self):
+        scheduler = make_scheduler()
+        now = 0.0
+        delays = []
+        for _ in range(6):
+            scheduler.record_refresh(False, False, now=now)
+            delay = scheduler.next_delay_ms(now=now)
+            delays.append(delay)
+            now += delay / 1000
+            assert scheduler.refresh_due(now=now)
+        assert delays == [10_000, 20_000, 40_000, 60_000, 60_000, 60_000]
+
+    def test_fills_switch_to_fast_until_quiet(self):
+        scheduler = make_scheduler()
+        scheduler.record_refresh(False, False, now=0)
+        scheduler.record_refresh(False, False, now=10)
+        scheduler.record_refresh(True, False, now=30)
+        assert scheduler.next_delay_ms(now=30) == 500
+        assert scheduler.is_active(now=149)
+
+        scheduler.record_refresh(False, False, now=150)
+        assert not scheduler.is_active(now=150)
+        assert scheduler.next_delay_ms(now=150) == 10_000  # backoff restarted by the fill
+
+    def test_open_position_stays_fast(self):
+        scheduler = make_scheduler()
+        scheduler.record_refresh(True, True, now=0)
+        scheduler.record_refresh(False, True, now=1_000)
+        assert scheduler.duration_due(now=1_000)
+        assert scheduler.next_delay_ms(now=1_000) == 500
+
+    def test_duration_ticks_only_with_open_position(self):
+        scheduler = make_scheduler()
+        scheduler.record_refresh(False, False, now=0)
+        assert not scheduler.duration_due(now=0)
+
+        scheduler.record_refresh(True, True, now=5)
+        assert scheduler.duration_due(now=5)  # immediately on open
+        assert not scheduler.duration_due(now=30)
+        assert scheduler.duration_due(now=65)
+
+    def test_wakes_for_duration_tick_before_idle_refresh(self):
+        scheduler = make_scheduler()
+        scheduler.record_refresh(True, True, now=0)
+        scheduler.duration_due(now=0)
+        scheduler.fast_ms = 120_000  # refresh later than the next duration tick
+        scheduler.record_refresh(False, True, now=0)
+        assert scheduler.next_delay_ms(now=0) == 60_000
+
+
+class TestHasOpenPosition:
+    """Test the processor's open position flag the scheduler is fed."""
+
+    def test_open_until_flat(self):
+        config = MagicMock()
+        config.get_contract_value.return_value = 50
+        config.print_streak_followtrade_stats = False
+        config.interval_stats_print = False
+        processor = TradeStatsProcessor(config)
+        start = datetime(2025, 6, 12, 6, 30)
+
+        store = FillStore()
+        store.add("SIM1", 1, "Filled BUY", "ESU5", 1.0, 6000.00, start)
+        processor.compute_trade_stats(store)
+        assert processor.has_open_position()
+
+        store.add("SIM1", 2, "Filled SELL", "ESU5", 1.0, 6001.00, start + timedelta(minutes=2))
+        processor.compute_trade_stats(store)
+        assert not processor.has_open_position()
@@ -0,0 +1,140 @@
+"""
+Tests for the rolling-window trade metrics engine.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from fill_store import FillStore
+from rolling_metrics import RollingTradeMetrics, RollingWindow
+from trade_group import TradeGroup
+from trade_stats_processor import TradeStatsProcessor
+
+START = datetime(2025, 6, 12, 6, 30)
+
+
+def make_group(exit_minute, amount, size=1):
+    exit_time = START + timedelta(minutes=exit_minute)
+    return TradeGroup(True, exit_time - timedelta(minutes=1), exit_time, size, amount / 50, amount)
+
+
+class TestRollingWindow:
+    """Test RollingWindow sums, eviction and monotonic extremes."""
+
+    def test_trades_age_out_of_window(self):
+        window = RollingWindow(15)
+        window.add(make_group(0, 100))
+        window.add(make_group(10, -50))
+        assert window.trade_count == 2
+        assert window.profit_or_loss == 50
+
+        window.add(make_group(15, 25))  # the trade at minute 0 is now exactly 15 minutes old
+        assert window.trade_count == 2
+        assert window.profit_or_loss == -25
+        assert window.win_rate == 50
+
+    def test_max_size_and_worst_trade_follow_window(self):
+        window = RollingWindow(15)
+        window.add(make_group(0, -300, size=5))
+        window.add(make_group(5, -100, size=2))
+        assert window.max_trade_size == 5
+        assert window.worst_trade == -300
+
+        window.evict(START + timedelta(minutes=16))
+        assert window.max_trade_size == 2
+        assert window.worst_trade == -100
+
+    def test_matches_brute_force(self):
+        """Running sums and deques agree with a full rescan of the window."""
+        rng = random.Random(7)
+        window = RollingWindow(60)
+        groups = []
+        minute = 0
+        for _ in range(500):
+            minute += rng.randint(0, 9)
+            group = make_group(minute, rng.choice([-125, -62.5, 0, 62.5, 250]), rng.randint(1, 6))
+            groups.append(group)
+            window.add(group)
+
+            cutoff = group.exit_time - timedelta(minutes=60)
+            live = [g for g in groups if g.exit_time > cutoff]
+            assert window.trade_count == len(live)
+            assert window.win_count == sum(1 for g in live if g.trade_amount > 0)
+            assert window.profit_or_loss == sum(g.trade_amount for g in live)
+            assert window.max_trade_size == max(g.max_trade_size for g in live)
+            assert window.worst_trade == min(min(g.trade_amount for g in live), 0)
+
+
+class TestRollingTradeMetrics:
+    """Test alert context fields exposed by RollingTradeMetrics."""
+
+    def test_context_fields(self):
+        metrics = RollingTradeMetrics()
+        metrics.add(make_group(0, -200))
+        metrics.add(make_group(30, 100))
+
+        context = metrics.context()
+        assert context["trades_last_15m"] == 1
+        assert context["trades_last_60m"] == 2
+        assert context["pnl_last_60m"] == -100
+        assert context["pnl_velocity_15m"] == 400
+        assert context["win_rate_last_60m"] == 50
+
+    def test_get_stats_exposes_rolling_fields(self):
+        config = MagicMock()
+        config.get_contract_value.return_value = 50
+        processor = TradeStatsProcessor(config)
+
+        store = FillStore()
+        store.add("SIM1", 1, "Filled BUY", "ESU5", 1.0, 6000.00, START)
+        store.add("SIM1", 2, "Filled SELL", "ESU5", 1.0, 6002.00, START + timedelta(minutes=3))
+
+        _, alert_context, _ = processor.get_stats(store.for_account("SIM1"))
+
+        assert alert_context["trades_last_60m"] == 1
+        assert alert_context["pnl_last_60m"] == 100
+        assert alert_context["win_rate_last_15m"] == 100
+
+    def test_live_publish_ages_windows_against_the_clock(self):
+        config = MagicMock()
+        config.get_contract_value.return_value = 50
+        processor = TradeStatsProcessor(config)
+        store = FillStore()
+        store.add("SIM1", 1, "Filled BUY", "ESU5", 1.0, 6000.00, START)
+        store.add("SIM1", 2, "Filled SELL", "ESU5", 1.0, 6002.00, START + timedelta(minutes=3))
+        stats = processor.accumulate(store.for_account("SIM1"))
+        processor.account_accumulators["SIM1"] = stats
+
+        def last_hour_row():
+            rows = processor.account_trading_stats["SIM1"]
+            return next(row["Last 60m T/W/PL"][0] for row in rows if "Last 60m T/W/PL" in row)
+
+        processor._publish_account_stats("SIM1", stats, now=START + timedelta(minutes=4))
+        assert last_hour_row() == "1 / 100% / +100"
+
+        assert processor.age_rolling_windows(now=START + timedelta(minutes=20))  # out of the 15m window
+        assert stats.alert_context()["trades_last_15m"] == 0
+        assert not processor.age_rolling_windows(now=START + timedelta(minutes=30))
+        assert processor.age_rolling_windows(now=START + timedelta(hours=2))
+        assert last_hour_row() == "0 / 0% / +0"
+
+    def test_aging_leaves_streak_lists_alone(self):
+        config = MagicMock()
+        config.get_contract_value.return_value = 50
+        config.print_streak_followtrade_stats = True
+        config.interval_stats_print = False
+        processor = TradeStatsProcessor(config)
+        processor.print_streak_followtrade_statistics = lambda list_name, data: None
+        store = FillStore()
+        session_start = datetime.now() - timedelta(minutes=30)  # compute_trade_stats ages against the clock
+        for index, exit_price in enumerate((5999.00, 5998.00, 6001.00)):  # two losses, then a win
+            entry = session_start + timedelta(minutes=5 * index)
+            store.add("SIM1", 2 * index + 1, "Filled BUY", "ESU5", 1.0, 6000.00, entry)
+            store.add("SIM1", 2 * index + 2, "Filled SELL", "ESU5", 1.0, exit_price, entry + timedelta(minutes=1))
+        processor.compute_trade_stats(store)
+        gathered = (list(processor.streak_stopper_list), list(processor.streak_continuer_list))
+        assert gathered[0] and gathered[1]
+
+        assert processor.age_rolling_windows(now=session_start + timedelta(hours=2))
+        assert (processor.streak_stopper_list, processor.streak_continuer_list) == gathered
@@ -0,0 +1,113 @@
+"""
+Tests for live stop-order slippage: the tracker, the ingestion path and the
+agreement with the offline slippage script.
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from config import Config
+from fill_store import FillStore
+from slippage_analysis import analyze_slippage_by_interval
+from slippage_stats import StopSlippage
+from trade_stats_processor import TradeStatsProcessor, add_fill_line
+from fixtures.log_writer import format_account_line, format_fill_line, write_log
+
+START = datetime(2025, 6, 12, 9, 30)
+
+
+def stopped_trades(first_order_id, count, account="SIM1"):
+    """Market entries closed by stops that fill 0-2 ticks beyond the stop price."""
+    lines = []
+    for index in range(count):
+        order_id = first_order_id + 2 * index
+        entry = START + timedelta(minutes=4 * (order_id // 2))
+        long = index % 2 == 0
+        side, exit_side = ("BUY", "SELL") if long else ("SELL", "BUY")
+        stop_price = 6000.00 - 2.00 if long else 6000.00 + 2.00
+        slip = (index % 3) * 0.25
+        fill_price = stop_price - slip if long else stop_price + slip
+        lines.append(format_fill_line(order_id, account, "ESU5", side, 1, 6000.00, entry))
+        lines.append(
+            format_fill_line(order_id + 1, account, "ESU5", exit_side, 1, fill_price, entry + timedelta(minutes=1), "STP", stop_price)
+        )
+    return lines
+
+
+def append(path, lines):
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.writelines(lines)
+
+
+class TestStopSlippage:
+    """Test session totals, intervals and context fields."""
+
+    def test_totals_and_intervals(self):
+        slippage = StopSlippage()
+        assert slippage.context()["session_slippage_points"] == 0
+        assert slippage.interval_points == 0
+
+        assert slippage.add(True, 6000.00, 6000.50, 2, 50, START) == 0.5  # buy stop filled higher
+        assert slippage.add(False, 6000.00, 6000.25, 1, 50, START + timedelta(minutes=3)) == -0.25  # sell stop filled better
+        assert slippage.add(False, 6000.00, 5999.00, 1, 5, START + timedelta(minutes=7)) == 1.0
+
+        context = slippage.context()
+        assert context["session_stop_fills"] == 3
+        assert context["session_slippage_points"] == pytest.approx(1.25)
+        assert context["session_slippage_dollars"] == pytest.approx(0.5 * 2 * 50 - 0.25 * 50 + 1.0 * 5)
+        assert context["avg_slippage_points"] == pytest.approx(1.25 / 3)
+        assert context["max_slippage_points"] == 1.0
+        assert context["interval_slippage_points"] == 1.0
+        assert slippage.by_interval() == [(START, 0.25, 2), (START + timedelta(minutes=5), 1.0, 1)]
+
+    def test_stop_price_is_kept_for_stop_fills_only(self):
+        store = FillStore()
+        add_fill_line(store, format_fill_line(1, "SIM1", "ESU5", "SELL", 1, 5998.00, START, "STP", 5998.25))
+        add_fill_line(store, format_fill_line(2, "SIM1", "ESU5", "BUY", 1, 6000.00, START, "LMT", 6000.00))
+        assert [fill.stop_price for fill in store] == [5998.25, None]
+
+
+class TestLiveSlippage:
+    """Test slippage reaches stats rows and alert context as logs are tailed."""
+
+    def setup_method(self):
+        self.path = Path(tempfile.mkdtemp()) / "output.log"
+        write_log(self.path, [format_account_line("SIM1", START)] + stopped_trades(1, 6))
+
+    def test_tailed_slippage_matches_offline_script(self):
+        processor = TradeStatsProcessor(Config())
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        first_stats = processor.account_accumulators["SIM1"]
+
+        append(self.path, stopped_trades(13, 5))
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        stats = processor.account_accumulators["SIM1"]
+        assert stats is first_stats  # advanced, not rebuilt
+
+        offline = analyze_slippage_by_interval(self.path.read_text(encoding="utf-8"), str(self.path))
+        context = stats.alert_context()
+        assert context["session_stop_fills"] == sum(data["trade_count"] for data in offline.values()) == 11
+        assert context["session_slippage_points"] == pytest.approx(sum(data["total_slippage"] for data in offline.values()))
+        assert [(start.strftime("%H:%M"), points) for start, points, _ in stats.slippage.by_interval()] == [
+            (interval, pytest.approx(data["total_slippage"])) for interval, data in offline.items()
+        ]
+
+        rows = {name: values[0] for row in processor.account_trading_stats["SIM1"] for name, values in row.items()}
+        assert rows["Stop Slippage"] == f"{stats.slippage.points:+.2f} pts / {int(stats.slippage.dollars):+,}"
+        assert rows["Stops/Avg/Max Slip"].startswith("11 / ")
+
+    def test_full_parse_and_batch_agree(self):
+        processor = TradeStatsProcessor(Config())
+        fills = processor.get_fills([str(self.path)])
+        streamed = processor.accumulate(fills).slippage
+        assert streamed.stop_fills == 6
+
+        pytest.importorskip("numpy")
+        batched = processor.accumulate_batch(fills).slippage
+        assert (batched.stop_fills, batched.by_interval()) == (streamed.stop_fills, streamed.by_interval())
+        assert batched.dollars == pytest.approx(streamed.dollars)
@@ -0,0 +1,60 @@
+"""
+Startup regression tests based on `python -X importtime`.
+
+Heavy modules (jsonschema, the analysis modules) must stay out of the import
+graph of the CLI and of the processor the app builds before its first paint.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from constants import CONST
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFERRED_MODULES = ("jsonschema", "trade_analyzer", "interval_stats")
+
+
+def import_times(module_name):
+    """Module -> cumulative import time in microseconds, from a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        # "import time:   self [us] | cumulative |  (indented) module"
+        _, cumulative_us, name = [part.strip() for part in line.split(":", 1)[1].split("|")]
+        if cumulative_us.isdigit():
+            times[name] = int(cumulative_us)
+    return times
+
+
+@pytest.mark.parametrize("module_name", ["manage_alert_configs", "trade_stats_processor"])
+def test_heavy_modules_are_deferred(module_name):
+    times = import_times(module_name)
+
+    assert module_name in times
+    for deferred in DEFERRED_MODULES:
+        assert deferred not in times, f"{module_name} imports {deferred} at load time"
+
+
+def test_processor_import_within_budget():
+    times = import_times("trade_stats_processor")
+
+    assert times["trade_stats_processor"] / 1000 < CONST.STARTUP_IMPORT_BUDGET_MS
+
+
+def test_validation_still_loads_jsonschema_on_demand():
+    from alert_config_manager import AlertConfigManager
+
+    manager = AlertConfigManager()
+    assert manager.validator is not None
+    assert manager.validate_profile("default")["conditions"]
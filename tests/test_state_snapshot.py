@@ -0,0 +1,214 @@
+"""
+Tests for incremental log tailing and the warm start snapshot.
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from alert_throttle import AlertThrottle
+from config import Config
+from constants import CONST
+from log_tailer import LogTailer
+from state_snapshot import restore_snapshot, save_snapshot
+from trade_stats_processor import TradeStatsProcessor
+from fixtures.log_writer import format_account_line, format_fill_line, format_noise_line, write_log
+
+START = datetime(2025, 6, 12, 6, 30)
+
+
+def round_trip_lines(first_order_id, count, points=(1.25, -2.5, 0.75)):
+    lines = []
+    for index in range(count):
+        order_id = first_order_id + 2 * index
+        entry = START + timedelta(minutes=3 * (order_id // 2))
+        exit_price = 6000.00 + points[index % len(points)]
+        lines.append(format_fill_line(order_id, "SIM1", "ESU5", "BUY", 1, 6000.00, entry))
+        lines.append(format_fill_line(order_id + 1, "SIM1", "ESU5", "SELL", 1, exit_price, entry + timedelta(minutes=1)))
+    return lines
+
+
+def append(path, lines):
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.writelines(lines)
+
+
+def comparable_stats(processor):
+    """Stats rows without the wall-clock "Last Updated" row."""
+    return {
+        account: [row for row in rows if "Last Updated" not in row]
+        for account, rows in processor.account_trading_stats.items()
+    }
+
+
+def full_parse(path):
+    processor = TradeStatsProcessor(Config())
+    processor.load_account_names([str(path)])
+    processor.compute_trade_stats(processor.get_fills([str(path)]))
+    return processor
+
+
+class TestLogTailer:
+    """Test offsets, partial lines and fingerprint checks."""
+
+    def setup_method(self):
+        self.path = Path(tempfile.mkdtemp()) / "output.log"
+
+    def test_only_appended_complete_lines_are_returned(self):
+        write_log(self.path, [format_noise_line(START, "one"), format_noise_line(START, "two")])
+        tailer = LogTailer()
+        assert len(list(tailer.new_lines(str(self.path)))) == 2
+
+        append(self.path, [format_noise_line(START, "three"), "06:30:00 INFO partial"])
+        assert [line.split()[-1] for line in tailer.new_lines(str(self.path))] == ["three"]
+
+        append(self.path, [" line\n"])
+        assert list(tailer.new_lines(str(self.path))) == ["06:30:00 INFO partial line\n"]
+        assert list(tailer.new_lines(str(self.path))) == []
+
+    def test_rewritten_or_deselected_file_is_not_resumable(self):
+        write_log(self.path, [format_noise_line(START, "one")])
+        tailer = LogTailer()
+        list(tailer.new_lines(str(self.path)))
+        assert tailer.is_resumable([str(self.path)])
+        assert not tailer.is_resumable([])
+
+        write_log(self.path, [format_noise_line(START, "ONE")])  # same size, other bytes
+        assert not tailer.is_resumable([str(self.path)])
+        write_log(self.path, [])  # truncated
+        assert not tailer.is_resumable([str(self.path)])
+
+
+class TestIncrementalRefresh:
+    """Test that tailing plus accumulator updates match a full re-parse."""
+
+    def setup_method(self):
+        self.path = Path(tempfile.mkdtemp()) / "output.log"
+        write_log(self.path, [format_account_line("SIM1", START)] + round_trip_lines(1, 3))
+
+    def test_appended_fills_update_stats_incrementally(self):
+        processor = TradeStatsProcessor(Config())
+        assert processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        first_stats = processor.account_accumulators["SIM1"]
+
+        append(self.path, [format_account_line("SIM2", START)] + round_trip_lines(7, 2))
+        assert processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        assert not processor.refresh_fills([str(self.path)])
+
+        assert processor.account_accumulators["SIM1"] is first_stats  # advanced, not rebuilt
+        assert "SIM2" in processor.account_names_loaded
+        assert comparable_stats(processor) == comparable_stats(full_parse(self.path))
+        assert len(processor.account_trading_stats["SIM1"]) == processor.stats_row_count()  # the app's button rows go past it
+
+    def test_equity_curve_is_extended_not_rebuilt(self):
+        processor = TradeStatsProcessor(Config())
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        curve = processor.account_equity_curves["SIM1"]
+        assert len(curve) == 3
+
+        append(self.path, round_trip_lines(7, 2))
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+
+        assert processor.account_equity_curves["SIM1"] is curve
+        rebuilt = full_parse(self.path).account_equity_curves["SIM1"]
+        assert (list(curve.exit_secs), list(curve.cumulative)) == (list(rebuilt.exit_secs), list(rebuilt.cumulative))
+
+    def test_out_of_order_fills_fall_back_to_recompute(self):
+        processor = TradeStatsProcessor(Config())
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        first_stats = processor.account_accumulators["SIM1"]
+
+        append(self.path, round_trip_lines(-1, 1))  # order ids before what was accumulated
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+
+        assert processor.account_accumulators["SIM1"] is not first_stats
+        assert comparable_stats(processor) == comparable_stats(full_parse(self.path))
+
+    def test_streak_lists_gathered_once_per_recompute(self):
+        write_log(self.path, round_trip_lines(1, 4, points=(-1.25, -2.5, 0.75)))  # a losing streak, then a win
+        processor = TradeStatsProcessor(Config())
+        processor.config.print_streak_followtrade_stats = True
+        processor.print_streak_followtrade_statistics = lambda list_name, data: None
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+        streak_tracker = processor.account_accumulators["SIM1"].streak_tracker
+        gathered = (list(streak_tracker.losing_streak_stopper), list(streak_tracker.losing_streak_continuer))
+        assert gathered[0] and gathered[1]
+
+        processor.update_trade_stats()  # recomputes: the printouts are on
+        processor.get_stats(processor.fill_store.for_account("SIM1"))
+        assert (processor.streak_stopper_list, processor.streak_continuer_list) == gathered
+
+    def test_reset_state_drops_deselected_files(self):
+        """What "Refresh All" does: reset, then parse only the logs selected now."""
+        processor = TradeStatsProcessor(Config())
+        processor.refresh_fills([str(self.path)])
+        processor.update_trade_stats()
+
+        other = self.path.with_name("other.log")
+        write_log(other, [line.replace("SIM1", "SIM2") for line in [format_account_line("SIM1", START)] + round_trip_lines(1, 1)])
+        processor.reset_state()
+        processor.refresh_fills([str(other)])
+        processor.compute_trade_stats(processor.fill_store)
+
+        assert len(processor.fill_store) == 2
+        assert "SIM1" not in processor.account_names_loaded
+        assert "SIM1" not in processor.account_trading_stats
+        assert comparable_stats(processor) == comparable_stats(full_parse(other))
+
+
+class TestSnapshot:
+    """Test save/restore of processor and throttle state."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / "output.log"
+        self.snapshot_path = self.temp_dir / "state" / "snapshot.pickle"
+        write_log(self.path, [format_account_line("SIM1", START)] + round_trip_lines(1, 3))
+        self.processor = TradeStatsProcessor(Config())
+        self.processor.refresh_fills([str(self.path)])
+        self.processor.update_trade_stats()
+
+    def test_restore_resumes_from_saved_offsets(self):
+        save_snapshot(self.snapshot_path, self.processor)
+        append(self.path, round_trip_lines(7, 2))
+
+        restored = TradeStatsProcessor(Config())
+        assert restore_snapshot(self.snapshot_path, restored, [str(self.path)])
+        assert comparable_stats(restored) == comparable_stats(self.processor)
+        assert restored.account_accumulators["SIM1"].config is restored.config
+
+        assert restored.refresh_fills([str(self.path)])
+        assert len(restored.fill_store) == 10
+        restored.update_trade_stats()
+        assert comparable_stats(restored) == comparable_stats(full_parse(self.path))
+        assert restored.account_trading_alerts[CONST.ALL_ACCOUNTS] is not None
+
+    def test_snapshot_for_other_files_is_ignored(self):
+        save_snapshot(self.snapshot_path, self.processor)
+        write_log(self.path, [format_account_line("SIM9", START)] + round_trip_lines(1, 3))
+
+        restored = TradeStatsProcessor(Config())
+        assert not restore_snapshot(self.snapshot_path, restored, [str(self.path)])
+        assert not restore_snapshot(self.snapshot_path, restored, [])
+        assert not restore_snapshot(self.temp_dir / "missing.pickle", restored, [str(self.path)])
+        assert len(restored.fill_store) == 0
+
+    def test_throttle_state_survives_restart(self):
+        throttle = AlertThrottle()
+        throttle.allow("SIM1", "streak", 600)
+        throttle.allow("SIM1", "expired", 0.001, now=throttle._clock() - 1)
+        save_snapshot(self.snapshot_path, self.processor, throttle)
+
+        restored_throttle = AlertThrottle()
+        assert restore_snapshot(
+            self.snapshot_path, TradeStatsProcessor(Config()), [str(self.path)], restored_throttle
+        )
+        assert len(restored_throttle) == 1
+        assert not restored_throttle.allow("SIM1", "streak", 600)
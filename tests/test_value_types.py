@@ -0,0 +1,54 @@
+"""
+Tests for the slotted value types (TradeGroup, AlertMessage) and Streak.
+"""
+
+import dataclasses
+from datetime import datetime, timedelta
+
+import pytest
+
+from alert_message import AlertMessage
+from concern_level import ConcernLevel
+from streak import Streak
+from trade_group import TradeGroup
+
+
+class TestValueTypes:
+    """TradeGroup and AlertMessage are frozen and carry no __dict__."""
+
+    def test_trade_group_is_slotted_and_frozen(self):
+        group = TradeGroup(True, datetime(2025, 6, 12, 9, 30), datetime(2025, 6, 12, 9, 33), 2, 1.25, 125.0)
+        assert not hasattr(group, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            group.trade_point = 0
+
+    def test_alert_message_is_slotted_and_frozen(self):
+        alert = AlertMessage("Size down.", "SIM", 60, 600, ConcernLevel.CAUTION, "")
+        assert not hasattr(alert, "__dict__")
+        assert alert.level == ConcernLevel.CAUTION
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            alert.message = "changed"
+
+
+class TestStreakFollowTradeStats:
+    """Streak only records follow-trade statistics when asked to."""
+
+    def _run(self, streak):
+        start = datetime(2025, 6, 12, 9, 30)
+        results = [False, False, False, True]
+        for i, is_win in enumerate(results):
+            entry = start + timedelta(minutes=5 * i)
+            streak.process(is_win, True, entry, entry + timedelta(minutes=2), 1, 1.0 if is_win else -1.0)
+        return streak
+
+    def test_followtrade_stats_skipped_by_default(self):
+        streak = self._run(Streak())
+        assert streak.losing_streak_stopper == []
+        assert streak.losing_streak_continuer == []
+        assert streak.worst_streak == -3
+
+    def test_followtrade_stats_collected_when_requested(self):
+        streak = self._run(Streak(collect_followtrade_stats=True))
+        assert len(streak.losing_streak_continuer) == 2
+        assert len(streak.losing_streak_stopper) == 1
+        assert streak.worst_streak == -3
@@ -1,3 +1,8 @@
 from collections import namedtuple
 
-Trade = namedtuple("Trade", ["account_name", "order_id", "order_type", "contract_symbol", "quantity", "fill_price", "fill_time"])
+# stop_price: the Aux price of a filled stop (STP) order, None for other orders
+Trade = namedtuple(
+    "Trade",
+    ["account_name", "order_id", "order_type", "contract_symbol", "quantity", "fill_price", "fill_time", "stop_price"],
+    defaults=(None,),
+)
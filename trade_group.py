@@ -1,10 +1,9 @@
 import datetime
-from collections import defaultdict
-import math
 from dataclasses import dataclass
 
 # --- Define the strongly-typed TradeGroup structure ---
-@dataclass
+# slots + frozen: no per-instance __dict__, and groups are immutable once a trade closes
+@dataclass(frozen=True, slots=True)
 class TradeGroup:
     """
     Represents a single logical trade (which might involve multiple orders)
@@ -15,4 +14,4 @@ class TradeGroup:
     exit_time: datetime.datetime   # Typically the time of the final exit order
     max_trade_size: float # Max contracts/lots held at any point during the trade
     trade_point: float    # Net profit/loss in points for the entire trade group
-    trade_amount: float
\ No newline at end of file
+    trade_amount: float
@@ -1,7 +1,9 @@
+from equity_curve import EquityCurve
 from trade_group import TradeGroup
 
 from PyQt6.QtWidgets import (
     QDialog,
+    QLabel,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
@@ -11,15 +13,20 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor, QBrush
 
 class TradeGroupDisplay(QDialog):
-    def __init__(self, trade_groups, parent=None):
+    def __init__(self, trade_groups, parent=None, equity_curve=None):
         super().__init__(parent)
+        self.equity_curve = equity_curve
         self.initUI(trade_groups)
 
     def initUI(self, trade_groups):
         self.setWindowTitle("Trade Group Details")
 
+        curve = self.equity_curve
+        if curve is None or len(curve) != len(trade_groups):
+            curve = EquityCurve.from_trade_groups(trade_groups)
+
         table = QTableWidget()
-        readable_headers = ["Entry Time", "Exit Time", "Max Size", "Long/Short",  "Points", "Amount", "Cumulative", "Streak"]
+        readable_headers = ["Entry Time", "Exit Time", "Max Size", "Long/Short",  "Points", "Amount", "Cumulative", "Peak", "Drawdown", "Streak"]
         num_rows = len(trade_groups)
         num_cols = len(readable_headers)
         table.setRowCount(num_rows)
@@ -100,54 +107,29 @@ class TradeGroupDisplay(QDialog):
             table.setItem(row_idx, 5, item5)
             apply_gradient_to_column(table, 5)
 
-            # Add Cumulative column (we will update this later)
-            item6 = QTableWidgetItem("")  # Placeholder
-            item6.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            item6.setForeground(QBrush(QColor(0, 0, 0)))
-            item6.setFlags(item6.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            table.setItem(row_idx, 6, item6)
+            # Cumulative, Peak and Drawdown come from the equity curve: row i is the curve's point i,
+            # so the values are set once and travel with their row when sorting
+            for col_idx, series in ((6, curve.cumulative), (7, curve.peak), (8, curve.drawdown)):
+                val = series[row_idx]
+                item = NumericTableWidgetItem(format_float_cumulative_amount(val), val)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                item.setData(Qt.ItemDataRole.UserRole, val)
+                table.setItem(row_idx, col_idx, item)
 
             # Add Cumulative Streak column (we will update this later)
-            item7 = QTableWidgetItem("")  # Placeholder
-            item7.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            item7.setForeground(QBrush(QColor(0, 0, 0)))
-            item7.setFlags(item7.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            table.setItem(row_idx, 7, item7)
+            item9 = QTableWidgetItem("")  # Placeholder
+            item9.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            item9.setForeground(QBrush(QColor(0, 0, 0)))
+            item9.setFlags(item9.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            table.setItem(row_idx, 9, item9)
 
             for col_idx in range(num_cols):
                 item = table.item(row_idx, col_idx); item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable) if item else None
-        
-        table.setSortingEnabled(True)
 
-        def update_cumulative_column(table: QTableWidget):
-            cumulative = 0.0
-            cumulative_values = []
+        for col_idx in (6, 7, 8):
+            apply_gradient_to_column(table, col_idx)
 
-            # First pass to collect cumulative values
-            for row in range(table.rowCount()):
-                item = table.item(row, 5)
-                if not item:
-                    cumulative_values.append(0.0)
-                    continue
-                try:
-                    value = float(item.data(Qt.ItemDataRole.UserRole))
-                except (ValueError, TypeError):
-                    value = 0.0
-                cumulative += value
-                cumulative_values.append(cumulative)
-
-            if not cumulative_values:
-                return
-
-            # Second pass: set text and background color
-            for row, cum_val in enumerate(cumulative_values):
-                item = table.item(row, 6)
-                if not item:
-                    continue
-                item.setText(format_float_cumulative_amount(cum_val))
-                item.setData(Qt.ItemDataRole.UserRole, cum_val)  # Store numeric value for later access
-
-            apply_gradient_to_column(table, 6)
+        table.setSortingEnabled(True)
 
         def update_streak_cumulative_column(table: QTableWidget, points_col: int, streak_col: int):
             prev_sign = 0
@@ -182,11 +164,7 @@ class TradeGroupDisplay(QDialog):
                 item.setForeground(QBrush(QColor(150, 255, 150) if val > 0 else QColor(255, 150, 150) if val < 0 else QColor(255, 255, 255)))
                 table.setItem(row, streak_col, item)
 
-        def update_cumulative_columns(table: QTableWidget, point_col_index:int, streak_col_index: int):
-            update_cumulative_column(table)
-            update_streak_cumulative_column(table, point_col_index, streak_col_index)
-
-        table.horizontalHeader().sortIndicatorChanged.connect(lambda _, __: update_cumulative_columns(table, 5, 7))
+        table.horizontalHeader().sortIndicatorChanged.connect(lambda _, __: update_streak_cumulative_column(table, 5, 9))
         header = table.horizontalHeader()
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
@@ -195,10 +173,20 @@ class TradeGroupDisplay(QDialog):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)
         table.setFont(QFont("Courier New", 20))
-        update_cumulative_columns(table, 5, 7)
+        update_streak_cumulative_column(table, 5, 9)
 
         layout = QVBoxLayout(self)
+        if len(curve) > 0:
+            # downsampled min/max-preserving sparkline, precomputed peak/drawdown
+            sparkline_label = QLabel(
+                f"{curve.sparkline(60)}  P/L {int(curve.cumulative[-1]):+,}"
+                f"  Peak {int(curve.peak[-1]):+,}  Max DD {int(curve.max_drawdown):+,}"
+            )
+            sparkline_label.setFont(QFont("Courier New", 20))
+            layout.addWidget(sparkline_label)
         layout.addWidget(table)
 
         table.resizeColumnsToContents()
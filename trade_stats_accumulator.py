@@ -0,0 +1,425 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from contract_registry import ContractRegistry
+from rolling_metrics import RollingTradeMetrics
+from slippage_stats import StopSlippage
+from streak import Streak
+from trade_group import TradeGroup
+
+
+class OpenTrade:
+    """Fills of one trade that is not yet flat, for an (account, contract family)."""
+
+    __slots__ = (
+        "entry_is_long",
+        "entry_time",
+        "max_time",
+        "unit_multiplier",
+        "fill_count",
+        "entry_fill_count",
+        "buy_qty",
+        "sell_qty",
+        "buy_value",
+        "sell_value",
+        "other_pnl",
+        "position",
+        "max_position",
+        "min_position",
+    )
+
+    def __init__(self, entry_is_long: bool, entry_time: datetime, unit_multiplier: float):
+        self.entry_is_long = entry_is_long
+        self.entry_time = entry_time
+        self.max_time = entry_time
+        self.unit_multiplier = unit_multiplier  # of the entry symbol
+        self.fill_count = 0
+        self.entry_fill_count = 0
+        self.buy_qty = 0
+        self.sell_qty = 0
+        # price x contracts for fills in the entry symbol's multiplier ...
+        self.buy_value = 0
+        self.sell_value = 0
+        # ... and dollars for any other (e.g. micro fills on a mini entry)
+        self.other_pnl = 0.0
+        # dollar-normalized (contracts x multiplier) so minis and micros net out
+        self.position = 0.0
+        self.max_position = 0.0
+        self.min_position = 0.0
+
+
+class TradeStatsAccumulator:
+    """
+    Incremental state behind `TradeStatsProcessor.get_stats` for one account.
+
+    Fills are fed one at a time (sorted by order id) and every aggregate is kept
+    as a running sum/count/extreme, so `alert_context()` is O(1) at any point.
+    This lets the live refresh, the snapshot restore and the alert backtester
+    advance stats per fill instead of recomputing the session from scratch.
+    """
+
+    def __init__(self, config, collect_followtrade_stats: bool = False):
+        self.config = config
+        self.streak_tracker = Streak(collect_followtrade_stats)
+        self.rolling_metrics = RollingTradeMetrics()
+        self.slippage = StopSlippage()
+        self.trade_groups: List[TradeGroup] = []
+        self.last_order_id = None
+        self.contracts = ContractRegistry(config)
+
+        # trades not yet flat, one per (account, contract family)
+        self.open_trades: Dict[Tuple[str, str], OpenTrade] = {}
+
+        # session totals
+        self.completed_trades = 0
+        self.total_long_trades = 0
+        self.total_short_trades = 0
+        self.total_buys = 0
+        self.total_sells = 0
+        self.total_buy_contracts = 0
+        self.total_sell_contracts = 0
+        self.total_profit_or_loss = 0.0
+        self.total_winning_trades = 0
+        self.total_wins_long = 0
+        self.gains = {True: 0.0, False: 0.0}
+        self.losses = {True: 0.0, False: 0.0}
+        self.gain_count = 0
+        self.loss_count = 0
+        self.win_max_value = 0
+        self.loss_max_value = 0
+        self.max_realized_drawdown = 0
+        self.max_realized_profit = 0
+        self.max_realized_drawdown_time = datetime.max
+        self.max_realized_profit_time = datetime.max
+        self.loss_max_size = 0
+        self.win_max_size = 0
+        self.loss_points_sum = 0
+        self.win_points_sum = 0
+        self.loss_max_points = 0
+        self.win_max_points = 0
+        self.loss_scaled_count = 0  # losses that involved multiple entries
+        self.win_scaled_count = 0  # wins that involved multiple entries
+        self.loss_duration_secs = 0
+        self.loss_duration_max = timedelta(0)
+        self.win_duration_secs = 0
+        self.win_duration_max = timedelta(0)
+        self.between_trades_secs = 0
+        self.between_trades_count = 0
+        self.between_trades_max = timedelta(0)
+        self.first_entry_time = datetime.max
+        self.last_exit_time = datetime.max
+
+    def __getstate__(self):
+        # the config is the running app's, not part of the snapshot; see attach_config
+        state = self.__dict__.copy()
+        state["config"] = None
+        return state
+
+    def attach_config(self, config) -> None:
+        self.config = config
+        self.contracts.config = config
+
+    @property
+    def position_size(self) -> float:
+        """
+        Net contracts still open, in each trade's entry contract (0 when flat).
+
+        Taken from the dollar-normalized position, so 1 ES long against 5 MES
+        short counts as 0.5 ES, not 1 - 5 = -4 contracts.
+        """
+        return sum(trade.position / trade.unit_multiplier for trade in self.open_trades.values())
+
+    @property
+    def entry_time(self) -> datetime:
+        """Entry time of the oldest open trade, datetime.max when flat."""
+        return min(
+            (trade.entry_time for trade in self.open_trades.values()),
+            default=datetime.max,
+        )
+
+    def add_fill(self, fill) -> Optional[TradeGroup]:
+        """
+        Advances the stats by one fill.
+
+        Fills are grouped per (account, contract family), so a trade scaled
+        across a mini and its micro closes when the dollar exposure is flat.
+
+        Returns:
+            The TradeGroup closed by this fill, or None if the position is still open.
+        """
+        self.last_order_id = fill.order_id
+        is_buy = "BUY" in fill.order_type
+        contract = self.contracts.spec(fill.contract_symbol)
+        multiplier = contract.multiplier
+        key = (getattr(fill, "account_name", None), contract.family)
+
+        stop_price = getattr(fill, "stop_price", None)
+        if stop_price is not None:
+            self.slippage.add(is_buy, stop_price, fill.fill_price, fill.quantity, multiplier, fill.fill_time)
+
+        trade = self.open_trades.get(key)
+        if trade is None:
+            trade = OpenTrade(is_buy, fill.fill_time, multiplier)
+            self.first_entry_time = min(self.first_entry_time, trade.entry_time)
+            # time between trades only counts while the account is entirely flat
+            if self.completed_trades > 0 and not self.open_trades:
+                duration_since_last_trade = trade.entry_time - self.last_exit_time
+                self.between_trades_secs += duration_since_last_trade.total_seconds()
+                self.between_trades_count += 1
+                self.between_trades_max = max(
+                    self.between_trades_max, duration_since_last_trade
+                )
+            self.open_trades[key] = trade
+
+        trade.fill_count += 1
+        trade.max_time = max(trade.max_time, fill.fill_time)
+        if is_buy == trade.entry_is_long:
+            trade.entry_fill_count += 1
+
+        same_unit = multiplier == trade.unit_multiplier
+        if is_buy:
+            self.total_buys += 1
+            self.total_buy_contracts += int(fill.quantity)
+            trade.buy_qty += fill.quantity
+            if same_unit:
+                trade.buy_value += fill.quantity * fill.fill_price
+            else:
+                trade.other_pnl -= fill.quantity * fill.fill_price * multiplier
+            trade.position += fill.quantity * multiplier
+        else:
+            self.total_sells += 1
+            self.total_sell_contracts += int(fill.quantity)
+            trade.sell_qty += fill.quantity
+            if same_unit:
+                trade.sell_value += fill.quantity * fill.fill_price
+            else:
+                trade.other_pnl += fill.quantity * fill.fill_price * multiplier
+            trade.position -= fill.quantity * multiplier
+        trade.max_position = max(trade.max_position, trade.position)
+        trade.min_position = min(trade.min_position, trade.position)
+
+        if trade.position != 0:
+            return None
+        del self.open_trades[key]
+        return self._close_trade(trade)
+
+    def _close_trade(self, trade: "OpenTrade") -> TradeGroup:
+        self.completed_trades += 1
+        entry_is_long = trade.entry_is_long
+        completed_profit_loss = (
+            trade.sell_value - trade.buy_value
+        ) * trade.unit_multiplier + trade.other_pnl
+        self.total_profit_or_loss += completed_profit_loss
+        is_win = completed_profit_loss > 0
+        self.total_winning_trades += is_win
+        self.total_wins_long += 1 if (is_win and entry_is_long) else 0
+
+        self.last_exit_time = trade.max_time
+        duration = self.last_exit_time - trade.entry_time
+        if self.total_profit_or_loss < self.max_realized_drawdown:
+            self.max_realized_drawdown = self.total_profit_or_loss
+            self.max_realized_drawdown_time = self.last_exit_time
+        if self.total_profit_or_loss > self.max_realized_profit:
+            self.max_realized_profit = self.total_profit_or_loss
+            self.max_realized_profit_time = self.last_exit_time
+
+        # sizes are in contracts of the entry symbol
+        trade_size = (
+            max(abs(trade.max_position), abs(trade.min_position))
+            / trade.unit_multiplier
+        )
+        trade_points = completed_profit_loss / (trade_size * trade.unit_multiplier)
+        is_scaled = trade.entry_fill_count > 1
+
+        if not is_win:
+            self.loss_max_size = max(self.loss_max_size, trade_size)
+            self.losses[entry_is_long] += completed_profit_loss
+            self.loss_max_value = (
+                completed_profit_loss
+                if self.loss_count == 0
+                else min(self.loss_max_value, completed_profit_loss)
+            )
+            self.loss_max_points = (
+                trade_points
+                if self.loss_count == 0
+                else min(self.loss_max_points, trade_points)
+            )
+            self.loss_count += 1
+            self.loss_points_sum += trade_points
+            self.loss_duration_secs += duration.total_seconds()
+            self.loss_duration_max = max(self.loss_duration_max, duration)
+            self.loss_scaled_count += 1 if is_scaled else 0
+        else:
+            self.win_max_size = max(self.win_max_size, trade_size)
+            self.gains[entry_is_long] += completed_profit_loss
+            self.win_max_value = (
+                completed_profit_loss
+                if self.gain_count == 0
+                else max(self.win_max_value, completed_profit_loss)
+            )
+            self.win_max_points = (
+                trade_points
+                if self.gain_count == 0
+                else max(self.win_max_points, trade_points)
+            )
+            self.gain_count += 1
+            self.win_points_sum += trade_points
+            self.win_duration_secs += duration.total_seconds()
+            self.win_duration_max = max(self.win_duration_max, duration)
+            self.win_scaled_count += 1 if is_scaled else 0
+
+        self.total_long_trades += 1 if entry_is_long else 0
+        self.total_short_trades += 1 if not entry_is_long else 0
+
+        self.streak_tracker.process(
+            is_win,
+            entry_is_long,
+            trade.entry_time,
+            self.last_exit_time,
+            trade_size,
+            trade_points,
+        )
+        trade_group = TradeGroup(
+            entry_is_long,
+            trade.entry_time,
+            self.last_exit_time,
+            trade_size,
+            trade_points,
+            completed_profit_loss,
+        )
+        self.trade_groups.append(trade_group)
+        self.rolling_metrics.add(trade_group)
+        return trade_group
+
+    # --- derived values ---
+
+    @property
+    def win_rate(self) -> float:
+        if self.completed_trades == 0:
+            return 50
+        return self.total_winning_trades / self.completed_trades * 100
+
+    @property
+    def total_gains(self) -> float:
+        return self.gains[True] + self.gains[False]
+
+    @property
+    def total_losses(self) -> float:
+        return self.losses[True] + self.losses[False]
+
+    @property
+    def profit_factor(self) -> float:
+        total_losses = self.total_losses
+        return 1 if total_losses == 0 else self.total_gains / abs(total_losses)
+
+    @property
+    def current_drawdown(self) -> int:
+        return -1 * int(self.max_realized_profit - self.total_profit_or_loss)
+
+    @property
+    def total_points(self) -> float:
+        return self.win_points_sum + self.loss_points_sum
+
+    def side_profit_factor(self, is_long: bool) -> float:
+        losses = self.losses[is_long]
+        return 1 if losses == 0 else self.gains[is_long] / abs(losses)
+
+    def side_win_rate(self, is_long: bool) -> float:
+        if is_long:
+            trades, wins = self.total_long_trades, self.total_wins_long
+        else:
+            trades = self.total_short_trades
+            wins = self.total_winning_trades - self.total_wins_long
+        return 0 if trades == 0 else wins / trades * 100
+
+    @staticmethod
+    def _average_duration(total_secs: float, count: int) -> timedelta:
+        return timedelta(seconds=total_secs / count) if count else timedelta(0)
+
+    @property
+    def win_avg_duration(self) -> timedelta:
+        return self._average_duration(self.win_duration_secs, self.gain_count)
+
+    @property
+    def loss_avg_duration(self) -> timedelta:
+        return self._average_duration(self.loss_duration_secs, self.loss_count)
+
+    @property
+    def between_trades_avg(self) -> timedelta:
+        return self._average_duration(
+            self.between_trades_secs, self.between_trades_count
+        )
+
+    @property
+    def avg_gain(self) -> float:
+        return self.total_gains / self.gain_count if self.gain_count else 0
+
+    @property
+    def avg_loss(self) -> float:
+        return self.total_losses / self.loss_count if self.loss_count else 0
+
+    @property
+    def win_avg_points(self) -> float:
+        return self.win_points_sum / self.gain_count if self.gain_count else 0
+
+    @property
+    def loss_avg_points(self) -> float:
+        return self.loss_points_sum / self.loss_count if self.loss_count else 0
+
+    def bias_percentages(self):
+        if self.completed_trades == 0:
+            return 0, 0
+        return (
+            (self.total_long_trades / self.completed_trades) * 100,
+            (self.total_short_trades / self.completed_trades) * 100,
+        )
+
+    def directional_bias(self) -> str:
+        long_bias_percentage, short_bias_percentage = self.bias_percentages()
+        if long_bias_percentage == 100:
+            return "100% long."
+        elif short_bias_percentage == 100:
+            return "100% short."
+        elif long_bias_percentage > short_bias_percentage:
+            return f"{long_bias_percentage:.0f}% long"
+        else:
+            return f"{short_bias_percentage:.0f}% short"
+
+    def directional_bias_extramsg(self) -> str:
+        long_bias_percentage, _ = self.bias_percentages()
+        if long_bias_percentage >= 90:
+            return "Join the SHORT."
+        if long_bias_percentage <= 10:
+            return "Join the LONG."
+        return self.directional_bias()
+
+    def alert_context(self) -> Dict[str, Any]:
+        win_avg_secs_seconds = self.win_avg_duration.total_seconds()
+        loss_avg_secs_seconds = self.loss_avg_duration.total_seconds()
+        duration_ratio = (
+            win_avg_secs_seconds / loss_avg_secs_seconds
+            if loss_avg_secs_seconds > 0
+            else float("inf")
+        )
+
+        alert_context = {
+            "completed_trades": self.completed_trades,
+            "total_profit_or_loss": self.total_profit_or_loss,
+            "profit_factor": self.profit_factor,
+            "win_rate": self.win_rate,
+            "directional_bias": self.directional_bias(),
+            "directional_bias_extramsg": self.directional_bias_extramsg(),
+            "streak_tracker": self.streak_tracker,
+            "streak_tracker.streak": self.streak_tracker.streak,
+            "streak_extramsg": self.streak_tracker.get_extra_msg(),
+            "loss_max_size": self.loss_max_size,
+            "loss_scaled_count": self.loss_scaled_count,
+            "current_drawdown": self.current_drawdown,
+            "open_position_size": abs(self.position_size),
+            "win_avg_secs_seconds": win_avg_secs_seconds,
+            "loss_avg_secs_seconds": loss_avg_secs_seconds,
+            "win_avg_secs_vs_loss_avg_secs": duration_ratio,
+        }
+        alert_context.update(self.rolling_metrics.context())
+        alert_context.update(self.slippage.context())
+        return alert_context
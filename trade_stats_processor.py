@@ -1,26 +1,91 @@
 import datetime
 import logging
 import re
+import time
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from typing import Optional
 
 import my_utils
 
 from alert_config_manager import AlertConfigManager, ConditionEvaluator
 from alert_message import AlertMessage
+from alert_template import format_template
+from color_rules import ColorRules
 from concern_level import ConcernLevel
 from config import Config
 from constants import CONST
+from equity_curve import EquityCurve
+from fill_store import EPOCH_ORDINAL, FillStore, from_epoch_seconds
+from latency_tracker import LatencyTracker, log_line_timestamp
+from legacy_alert_profile import legacy_evaluator, with_legacy_defaults
+from log_index import parse_line_seconds
+from log_parser import ACCOUNT_MARKER_BYTES, FILL_MARKER_BYTES, parse_account_line, parse_fill_line
+from log_reader import scan_lines
+from log_tailer import LogTailer
 from metrics_names import MetricNames
-from trade import Trade
-from trade_analyzer import TradeAnalyzer
-from trade_group import TradeGroup
-from streak import Streak
+from trade_stats_accumulator import TradeStatsAccumulator
 
 LOGGER = logging.getLogger(__name__)
 
+STOP_ORDER_KIND = "STP"
+
+
+def fill_epoch_seconds(last_fill_time: str, line_seconds: Optional[int] = None) -> int:
+    """
+    Epoch seconds (naive, like `FillStore`) of a fill from its "Last Fill Time"
+    ("MM/DD/YYYY h:MM AM", minute resolution) and, when given, its log line's
+    time of day, which carries the seconds.
+
+    The line time is used only when it falls in the fill's minute or the next
+    one (the line is written as the fill arrives); a line logged later, e.g. a
+    fill re-reported after a reconnect, keeps the fill's own minute. Fixed-width
+    integer slicing, no strptime.
+    """
+    hour_end = last_fill_time.index(":", 11)
+    hour = int(last_fill_time[11:hour_end]) % 12
+    if last_fill_time[-2] == "P":
+        hour += 12
+    fill_seconds = hour * 3600 + int(last_fill_time[hour_end + 1 : hour_end + 3]) * 60
+    day = date(int(last_fill_time[6:10]), int(last_fill_time[0:2]), int(last_fill_time[3:5]))
+    epoch_seconds = (day.toordinal() - EPOCH_ORDINAL) * 86_400 + fill_seconds
+    if line_seconds is not None:
+        offset = (line_seconds - fill_seconds) % 86_400  # a fill at 23:59 may be logged at 00:00:xx
+        if offset < 120:
+            epoch_seconds += offset
+    return epoch_seconds
+
+
+def add_fill_line(fill_store: FillStore, line: str):
+    """
+    Adds the fill on `line` (if any) to `fill_store`; returns its row or None.
+
+    A stop order keeps its Aux (stop) price, from which the stats derive slippage.
+    """
+    fill = parse_fill_line(line)
+    if fill is None:
+        return None
+    # SIM-dd (we need this for ordering: fills within the same second are common)
+    order_digits = re.sub(r"[^0-9]", "", fill.order_id)
+    if not order_digits:
+        return None
+    return fill_store.add_at_second(
+        fill.account_name,
+        int(order_digits),
+        fill.order_type,
+        fill.contract_symbol,
+        fill.quantity,
+        fill.fill_price,
+        fill_epoch_seconds(fill.last_fill_time, parse_line_seconds(line)),
+        fill.aux_price if fill.order_kind == STOP_ORDER_KIND else None,
+    )
+
 
 class TradeStatsProcessor:
+    # (manager active_config_version, evaluator) swapped as one tuple when the profile or an override changes
+    _compiled_alerts = (None, None)
+    # (manager config_version, ColorRules), likewise
+    _compiled_colors = (None, None)
 
     def __init__(self, config: Config):
         self.config = config
@@ -30,6 +95,16 @@ class TradeStatsProcessor:
         self.streak_stopper_list = []
         self.streak_continuer_list = []
         self.account_trade_groups = {}
+        self.account_equity_curves = {}
+        # incremental state: log offsets, every fill parsed so far and the
+        # accumulators (and how many store rows they have seen) behind the stats
+        self.log_tailer = LogTailer()
+        self.fill_store = FillStore()
+        self.log_account_names = set()
+        self.account_accumulators = {}
+        self.accumulated_rows = 0
+        # log line -> alert latency of fills read while tailing
+        self.latency = LatencyTracker()
         self.alert_profile_status = {
             "mode": "fallback",
             "profile": "legacy",
@@ -43,16 +118,7 @@ class TradeStatsProcessor:
         try:
             manager = AlertConfigManager()
             config = manager.load_config()
-            active_profile = manager.get_active_profile_name()
-            profile_path = manager.get_profile_path(active_profile)
-            metadata = config.get("metadata", {})
-            self.alert_profile_status = {
-                "mode": "json",
-                "profile": active_profile,
-                "source": metadata.get("source", "unknown"),
-                "path": str(profile_path) if profile_path else None,
-                "error": None,
-            }
+            self._update_alert_profile_status(manager, config)
             return manager
         except Exception as exc:
             LOGGER.warning("Alert config manager unavailable: %s", exc)
@@ -65,64 +131,184 @@ class TradeStatsProcessor:
             }
             return None
 
+    def _update_alert_profile_status(self, manager: AlertConfigManager, config: dict):
+        active_profile = manager.get_active_profile_name()
+        profile_path = manager.get_profile_path(active_profile)
+        metadata = config.get("metadata", {})
+        self.alert_profile_status = {
+            "mode": "json",
+            "profile": active_profile,
+            "source": metadata.get("source", "unknown"),
+            "path": str(profile_path) if profile_path else None,
+            "error": None,
+        }
+
     def load_account_names(self, file_paths):
         account_names = set()
-        pattern = r"ACCOUNT:\s*(\S+)\s+fcmId:"
         for file_path in file_paths:
-            with open(file_path, "r") as file:
-                for line in file:
-                    match = re.search(pattern, line)
-                    if match:
-                        account_name = match.group(1)
-                        account_names.add(account_name)
+            for line in scan_lines(file_path, (ACCOUNT_MARKER_BYTES,)):
+                account_name = parse_account_line(line)
+                if account_name:
+                    account_names.add(account_name)
+        self._set_account_names(account_names)
+
+    def _set_account_names(self, account_names):
+        account_names = set(account_names)
         account_names.add("simulated")
         account_names.add(CONST.SELECT_ACCOUNT)
         account_names.add(CONST.ALL_ACCOUNTS)
         self.account_names_loaded = sorted(list(account_names))
 
-    def get_fills(self, file_paths):
-        unique_trades_dict = {}
+    def get_fills(self, file_paths) -> FillStore:
+        fill_store = FillStore()
         for file_path in file_paths:
-            pattern = rf"OrderDirectory::orderFilled\(\) order: ID: (\S+) (\S+) (\S+)\.CME.*(Filled BUY|Filled SELL).*Qty:(\d+\.\d+).*Last Fill Time:\s*(\d{{2}}/\d{{2}}/\d{{4}} \d{{1,2}}:\d{{2}} [AP]M).*fill price: (\d+\.\d+)"
-            with open(file_path, "r") as file:
-                for line in file:
-                    match = re.search(pattern, line)
-                    if match:
-                        order_id = int(
-                            re.sub(r"[^0-9]", "", match.group(1))
-                        )  # SIM-dd (we need this for ordering since fill_time has no second value and so inaccurate)
-                        account_name = match.group(2)
-                        contract_symbol = match.group(3)
-                        order_type = match.group(4)
-                        quantity = float(match.group(5))
-                        fill_time_str = match.group(6)
-                        fill_price = float(match.group(7))
-                        fill_time = datetime.strptime(
-                            fill_time_str, "%m/%d/%Y %I:%M %p"
-                        )
-                        unique_trades_dict[account_name, order_id] = Trade(
-                            account_name,
-                            order_id,
-                            order_type,
-                            contract_symbol,
-                            quantity,
-                            fill_price,
-                            fill_time,
-                        )
-
-        fill_data = list(unique_trades_dict.values())
-        if len(fill_data) == 0:
-            print("No Fills Found")
+            # only the orderFilled() lines are decoded and parsed
+            for line in scan_lines(file_path, (FILL_MARKER_BYTES,)):
+                add_fill_line(fill_store, line)
 
-        return fill_data
+        if len(fill_store) == 0:
+            print("No Fills Found")
 
-    def compute_trade_stats(self, fill_data):
-        account_names_with_fills = set()
+        return fill_store
+
+    def reset_state(self):
+        """
+        Forgets everything read so far (log offsets, fills, accumulators, account
+        names and the stats published from them), so the next `refresh_fills`
+        parses the selected logs from scratch.
+        """
+        self.log_tailer.reset()
+        self.fill_store = FillStore()
+        self.account_accumulators = {}
+        self.accumulated_rows = 0
+        self.log_account_names = set()
+        self._set_account_names(self.log_account_names)
+        self.account_trading_stats.clear()
+        self.account_trading_alerts.clear()
+        self.account_trade_groups.clear()
+        self.account_equity_curves.clear()
+
+    def refresh_fills(self, file_paths) -> bool:
+        """
+        Parses only the log lines appended since the last call into `self.fill_store`.
+
+        Starts over (fresh store, accounts and stats) when the selection no
+        longer covers every tailed file or a file was replaced or truncated.
+
+        Returns:
+            True if fills or account names changed.
+        """
+        changed = False
+        if not self.log_tailer.is_resumable(file_paths):
+            self.reset_state()
+            changed = True
+
+        new_account_names = set()
+        for file_path in file_paths:
+            # only fills appended to a file already being tailed are live
+            live = file_path in self.log_tailer.cursors
+            for line in self.log_tailer.new_lines(file_path, (FILL_MARKER_BYTES, ACCOUNT_MARKER_BYTES)):
+                row = add_fill_line(self.fill_store, line)
+                if row is not None:
+                    changed = True
+                    if row < self.accumulated_rows:
+                        self.accumulated_rows = -1  # an accumulated fill was rewritten
+                    if live:
+                        self._track_fill_latency(row, line)
+                    continue
+                account_name = parse_account_line(line)
+                if account_name and account_name not in self.log_account_names:
+                    new_account_names.add(account_name)
+
+        if new_account_names:
+            self.log_account_names |= new_account_names
+            self._set_account_names(self.log_account_names)
+            changed = True
+        return changed
+
+    def _track_fill_latency(self, row: int, line: str):
+        line_seconds = parse_line_seconds(line)
+        if line_seconds is None:
+            return
+        store = self.fill_store
+        log_ts = log_line_timestamp(line_seconds, from_epoch_seconds(store.fill_second[row]))
+        account_name = store.account_names[store.account_idx[row]]
+        self.latency.record_ingest((account_name, CONST.ALL_ACCOUNTS), log_ts, time.time())
+
+    def update_trade_stats(self):
+        """
+        Brings the stats up to date with `self.fill_store`.
+
+        Fills added since the last update are fed into the existing per-account
+        accumulators when they all come after what each accumulator has seen
+        (by order id); otherwise, and when the analysis printouts are enabled,
+        everything is recomputed.
+        """
+        store = self.fill_store
+        if (
+            self.accumulated_rows <= 0
+            or self.config.print_streak_followtrade_stats
+            or self.config.interval_stats_print
+        ):
+            self.compute_trade_stats(store)
+            return
+
+        new_fills = sorted(
+            (store.trade(row) for row in range(self.accumulated_rows, len(store))),
+            key=lambda record: record.order_id,
+        )
+        new_fills_by_account = defaultdict(list)
+        for fill in new_fills:
+            new_fills_by_account[fill.account_name].append(fill)
+        new_fills_by_account[CONST.ALL_ACCOUNTS] = new_fills
+
+        for account_name, fills in new_fills_by_account.items():
+            stats = self.account_accumulators.get(account_name)
+            if not fills:
+                continue
+            if stats is None or (
+                stats.last_order_id is not None
+                and fills[0].order_id <= stats.last_order_id
+            ):
+                self.compute_trade_stats(store)
+                return
+
+        for account_name, fills in new_fills_by_account.items():
+            if fills:
+                stats = self.account_accumulators[account_name]
+                for fill in fills:
+                    stats.add_fill(fill)
+                self._publish_account_stats(account_name, stats)
+        self.accumulated_rows = len(store)
+        self._add_no_fill_accounts()
+
+    def age_rolling_windows(self, now=None) -> bool:
+        """
+        Ages every account's trailing windows against the clock and republishes
+        the accounts whose windows lost trades (for refreshes without new fills).
+
+        Returns:
+            True if any account's stats or alerts were republished.
+        """
+        now = datetime.now() if now is None else now
+        aged = False
+        for account_name, stats in self.account_accumulators.items():
+            windows = stats.rolling_metrics.windows
+            before = [window.trade_count for window in windows]
+            stats.rolling_metrics.evict(now)
+            if [window.trade_count for window in windows] != before:
+                self._publish_account_stats(account_name, stats, now)
+                aged = True
+        return aged
+
+    def compute_trade_stats(self, fill_data: FillStore, batch: bool = False):
         trade_groups_consolidated = []
+        self.account_accumulators = {}
+        self.account_equity_curves = {}  # new accumulators, so the curves are rebuilt from their trades
+        self.accumulated_rows = len(fill_data) if fill_data else 0
         if fill_data:
             # get list of AccountNames in fill
-            for item in fill_data:
-                account_names_with_fills.add(item.account_name)
+            account_names_with_fills = set(fill_data.accounts_with_fills())
 
             # test specific accounts only
             # account_names_with_fills.clear()
@@ -132,24 +318,16 @@ class TradeStatsProcessor:
             self.streak_continuer_list.clear()
 
             for account_name in account_names_with_fills:
-                filtered_list = my_utils.filter_namedtuples(
-                    fill_data, "account_name", account_name
-                )
-
-                trading_stats, alert_context, trade_groups = self.get_stats(
-                    filtered_list
-                )
-
-                self.account_trading_stats[account_name] = trading_stats
-
-                alert_matches = self._evaluate_alerts(alert_context)
-                self.account_trading_alerts[account_name] = self._build_alert_messages(
-                    account_name, alert_matches
-                )
-
-                self.account_trade_groups[account_name] = trade_groups
+                if batch:
+                    stats = self.accumulate_batch(fill_data, fill_data.rows_for_account(account_name))
+                else:
+                    stats = self.accumulate(fill_data.for_account(account_name))
+                self.account_accumulators[account_name] = stats
+                self._publish_account_stats(account_name, stats)
+                self.streak_stopper_list.extend(stats.streak_tracker.losing_streak_stopper)
+                self.streak_continuer_list.extend(stats.streak_tracker.losing_streak_continuer)
 
-                trade_groups_consolidated.extend(trade_groups)
+                trade_groups_consolidated.extend(stats.trade_groups)
 
             if self.config.print_streak_followtrade_stats:
                 self.print_streak_followtrade_statistics(
@@ -160,17 +338,22 @@ class TradeStatsProcessor:
                 )
 
             if self.config.interval_stats_print:
+                from trade_analyzer import TradeAnalyzer
+
                 analyzer = TradeAnalyzer(trade_groups_consolidated)
                 interval_stats = analyzer.analyze_by_time_interval(
                     self.config.interval_stats_min
                 )
                 analyzer.print_table(interval_stats)
 
-            self.compute_all_account_stats(fill_data)
+            self.compute_all_account_stats(fill_data, batch)
         else:
             self.account_trading_stats.clear()
             self.account_trading_alerts.clear()
 
+        self._add_no_fill_accounts()
+
+    def _add_no_fill_accounts(self):
         account_names_no_fills = [
             item
             for item in self.account_names_loaded
@@ -186,423 +369,151 @@ class TradeStatsProcessor:
                 },
             ]
 
-    def get_stats(self, filtered_list):
+    def get_stats(self, filtered_list, batch: bool = False):
+        if batch:
+            stats = self.accumulate_batch(filtered_list)
+        else:
+            stats = self.accumulate(filtered_list)
+        return self.build_trading_stats(stats), stats.alert_context(), stats.trade_groups
+
+    def accumulate(self, filtered_list) -> TradeStatsAccumulator:
         sorted_fill = sorted(
             filtered_list, key=lambda record: record.order_id, reverse=False
         )  # keeping only digits for SIM-ID orders
 
-        trade_groups = []
-        grouped_trades = defaultdict(list)
-        completed_trades = 0
-        total_long_trades = 0
-        total_buys = 0
-        total_buy_contracts = 0
-        total_short_trades = 0
-        total_sells = 0
-        total_sell_contracts = 0
-        total_profit_or_loss = 0.0
-        total_winning_trades = 0
-        total_wins_long = 0
-        gains = defaultdict(list)
-        losses = defaultdict(list)
-        max_realized_drawdown = 0
-        max_realized_profit = 0
-        loss_max_size = 0
-        win_max_size = 0
-        loss_points = []
-        win_points = []
-        loss_scaled_count = 0  # losses that involved multiple entries
-        win_scaled_count = 0  # wins that involved multiple entries
-
-        streak_tracker = Streak()
-        max_time = datetime.min
-        last_exit_time = datetime.max
-        loss_duration = list()
-        win_duration = list()
-        entry_is_long = True
-        time_between_trades = list()
-        entry_time = datetime.max
-        first_entry_time = datetime.max
-
-        max_realized_drawdown_time = datetime.max
-        max_realized_profit_time = datetime.max
-
-        for fill in sorted_fill:
-            if len(grouped_trades) == 0:
-                entry_is_long = "BUY" in fill.order_type
-                entry_time = fill.fill_time
-                first_entry_time = min(first_entry_time, entry_time)
-                if completed_trades > 0:  # start only when there is at least one
-                    duration_since_last_trade = entry_time - last_exit_time
-                    time_between_trades.append(duration_since_last_trade)
-
-            grouped_trades[fill.order_type].append(fill)
-
-            if "BUY" in fill.order_type:
-                total_buys += 1
-                total_buy_contracts += int(fill.quantity)
-            else:
-                total_sells += 1
-                total_sell_contracts += int(fill.quantity)
-
-            buy_total_value = 0
-            buy_qty = 0
-            sell_total_value = 0
-            sell_qty = 0
-
-            for trade in grouped_trades["Filled BUY"]:
-                buy_qty += trade.quantity
-                buy_total_value += trade.quantity * trade.fill_price
-                max_time = max(max_time, trade.fill_time)
-
-            for trade in grouped_trades["Filled SELL"]:
-                sell_qty += trade.quantity
-                sell_total_value += trade.quantity * trade.fill_price
-                max_time = max(max_time, trade.fill_time)
-
-            position_size = buy_qty - sell_qty
-            if len(grouped_trades) >= 2 and position_size == 0:  # trade completed
-                completed_trades += 1
-                contract_value = self.config.get_contract_value(fill.contract_symbol)
-                completed_profit_loss = (
-                    sell_total_value - buy_total_value
-                ) * contract_value
-                total_profit_or_loss += completed_profit_loss
-                is_win = completed_profit_loss > 0
-                total_winning_trades += is_win
-                total_wins_long += 1 if (is_win and entry_is_long) else 0
-
-                last_exit_time = max_time
-                duration = last_exit_time - entry_time
-                if total_profit_or_loss < max_realized_drawdown:
-                    max_realized_drawdown = total_profit_or_loss
-                    max_realized_drawdown_time = last_exit_time
-                if total_profit_or_loss > max_realized_profit:
-                    max_realized_profit = total_profit_or_loss
-                    max_realized_profit_time = last_exit_time
-
-                trade_size = self.calculate_max_quantity(grouped_trades)
-                trade_points = completed_profit_loss / (trade_size * contract_value)
-                entries_in_trade_count = len(
-                    grouped_trades["Filled BUY" if entry_is_long else "Filled SELL"]
-                )
-
-                if not is_win:
-                    loss_max_size = max(loss_max_size, trade_size)
-                    losses[entry_is_long].append(completed_profit_loss)
-                    loss_points.append(trade_points)
-                    loss_duration.append(duration)
-                    loss_scaled_count += 1 if entries_in_trade_count > 1 else 0
-                else:
-                    win_max_size = max(win_max_size, trade_size)
-                    gains[entry_is_long].append(completed_profit_loss)
-                    win_points.append(trade_points)
-                    win_duration.append(duration)
-                    win_scaled_count += 1 if entries_in_trade_count > 1 else 0
-
-                total_long_trades += 1 if entry_is_long else 0
-                total_short_trades += 1 if not entry_is_long else 0
-
-                streak_tracker.process(
-                    is_win,
-                    entry_is_long,
-                    entry_time,
-                    last_exit_time,
-                    trade_size,
-                    trade_points,
-                )
-                trade_groups.append(
-                    TradeGroup(
-                        entry_is_long,
-                        entry_time,
-                        last_exit_time,
-                        trade_size,
-                        trade_points,
-                        completed_profit_loss,
-                    )
-                )
-
-                grouped_trades.clear()
-                max_time = datetime.min
-                entry_time = datetime.max
-
-        get_sum = lambda data: sum(data) if data else 0
-        get_average = lambda data: sum(data) / len(data) if data else 0
-        get_max = lambda data: max(data) if data else 0
-        get_min = lambda data: min(data) if data else 0
-
-        self.streak_stopper_list.extend(streak_tracker.losing_streak_stopper)
-        self.streak_continuer_list.extend(streak_tracker.losing_streak_continuer)
-
-        all_gains = gains[True] + gains[False]
-        all_losses = losses[True] + losses[False]
-
-        total_gains = get_sum(all_gains)
-        total_losses = get_sum(all_losses)
-
-        win_rate = (
-            50
-            if completed_trades == 0
-            else total_winning_trades / completed_trades * 100
-        )
-        long_win_rate = (
-            0 if total_long_trades == 0 else total_wins_long / total_long_trades * 100
-        )
-        short_win_rate = (
-            0
-            if total_short_trades == 0
-            else (total_winning_trades - total_wins_long) / total_short_trades * 100
-        )
-        profit_factor = 1 if total_losses == 0 else total_gains / abs(total_losses)
-
-        long_gains = get_sum(gains[True])
-        long_losses = get_sum(losses[True])
-        short_gains = get_sum(gains[False])
-        short_losses = get_sum(losses[False])
-        long_profit_factor = 1 if long_losses == 0 else long_gains / abs(long_losses)
-        short_profit_factor = (
-            1 if short_losses == 0 else short_gains / abs(short_losses)
+        stats = TradeStatsAccumulator(
+            self.config, self.config.print_streak_followtrade_stats
         )
-
-        loss_avg_secs = my_utils.average_timedelta(loss_duration)
-        loss_max_secs = my_utils.max_timedelta(loss_duration)
-        win_avg_secs = my_utils.average_timedelta(win_duration)
-        win_max_secs = my_utils.max_timedelta(win_duration)
-        time_between_trades_avg_secs = my_utils.average_timedelta(time_between_trades)
-        time_between_trades_max_secs = my_utils.max_timedelta(time_between_trades)
-        current_drawdown = -1 * int(max_realized_profit - total_profit_or_loss)
-
-        avg_gain = get_average(all_gains)
-        avg_loss = get_average(all_losses)
-        total_losing_trades = completed_trades - total_winning_trades
-        win_max_value = get_max(all_gains)
-        loss_max_value = get_min(all_losses)
-
-        loss_max_points = get_min(loss_points)
-        win_max_points = get_max(win_points)
-        loss_avg_points = get_average(loss_points)
-        win_avg_points = get_average(win_points)
-        total_points = get_sum(win_points) + get_sum(loss_points)
-
-        directional_bias = ""
-        long_bias_percentage = (
-            0 if completed_trades == 0 else (total_long_trades / completed_trades) * 100
-        )
-        short_bias_percentage = (
-            0
-            if completed_trades == 0
-            else (total_short_trades / completed_trades) * 100
-        )
-
-        if long_bias_percentage == 100:
-            directional_bias = f"100% long."
-        elif short_bias_percentage == 100:
-            directional_bias = f"100% short."
-        else:
-            if long_bias_percentage > short_bias_percentage:
-                directional_bias = f"{long_bias_percentage:.0f}% long"
-            else:
-                directional_bias = f"{short_bias_percentage:.0f}% short"
-
-        directional_bias_extramsg = (
-            "Join the SHORT."
-            if long_bias_percentage >= 90
-            else "Join the LONG." if long_bias_percentage <= 10 else directional_bias
+        for fill in sorted_fill:
+            stats.add_fill(fill)
+        return stats
+
+    def accumulate_batch(self, fills, rows=None) -> TradeStatsAccumulator:
+        """
+        Same result as `accumulate`, computed column-wise by `batch_stats` (needs numpy).
+
+        `fills` is a FillStore (optionally restricted to `rows`) or any iterable of
+        Trade records, which is copied into one first.
+        """
+        from batch_stats import accumulate_batch
+
+        if not isinstance(fills, FillStore):
+            store = FillStore()
+            for fill in fills:
+                store.add(*fill)
+            fills, rows = store, None
+        return accumulate_batch(
+            self.config, fills, rows, self.config.print_streak_followtrade_stats
         )
 
-        trade_conditions = [
-            {
-                "expr": lambda x: x >= 30,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop. Maximum trades for the day reached.",
-            },
-            {
-                "expr": lambda x: x >= 20 and total_profit_or_loss > 0,
-                "level": ConcernLevel.OK,
-                "msg": "Wind down. You've reached your trade count goal.",
-            },
-            {
-                "expr": lambda x: x >= 20,
-                "level": ConcernLevel.WARNING,
-                "msg": "Wind down. You've reached your trade count goal.",
-            },
-            {
-                "expr": lambda x: x >= 10,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Take quality trades only.",
-            },
-        ]
-
-        pnl_conditions = [
-            {
-                "expr": lambda x: x < -2100,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop. Protect your capital.",
-            },
-            {
-                "expr": lambda x: x < -1400,
-                "level": ConcernLevel.WARNING,
-                "msg": "Pause. Reset first, then recover.",
-            },
-            {
-                "expr": lambda x: x < -700,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Manage loss by managing risk.",
-            },
-            {
-                "expr": lambda x: x >= 1000,
-                "level": ConcernLevel.OK,
-                "msg": "Wind down. Protect gains.",
-            },
-        ]
-
-        winrate_conditions = [
-            {
-                "expr": lambda x: x <= 25
-                and profit_factor < 1.0
-                and completed_trades >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Win Rate very low.",
-            },
-            {
-                "expr": lambda x: x <= 40
-                and profit_factor < 1.5
-                and completed_trades >= 5,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Win Rate low.",
-            },
-        ]
-
-        profitfactor_conditions = [
-            {
-                "expr": lambda x: x < 1.0 and completed_trades >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Profit Factor very low.",
-            },
-            {
-                "expr": lambda x: x < 1.5 and completed_trades >= 5,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Profit Factor low.",
-            },
-            {"expr": lambda x: x >= 1.5, "level": ConcernLevel.OK, "msg": ""},
-        ]
-
-        losingstreak_conditions = [
-            {
-                "expr": lambda x: x <= -7,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop Now. Protect the version of YOU that will trade well tomorrow.",
-            },
-            {
-                "expr": lambda x: x <= -4,
-                "level": ConcernLevel.WARNING,
-                "msg": "Stop. Follow Reset plan.",
-            },
-            {
-                "expr": lambda x: x <= -2,
-                "level": ConcernLevel.CAUTION,
-                "msg": f"Slow down. Consecutive losses. {streak_tracker.get_extra_msg()}",
-            },
-        ]
-
-        loss_max_size_conditions = [
-            {
-                "expr": lambda x: x >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Size down.",
-            },
-            {
-                "expr": lambda x: x >= 6,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Size down.",
-            },
-            {
-                "expr": lambda x: x >= 4
-                and profit_factor < 1.0
-                and completed_trades >= 3,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Size down.",
-            },
-        ]
-
-        loss_scaled_count_conditions = [
-            {
-                "expr": lambda x: x >= 5,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Scale up winners only.",
-            },
-            {
-                "expr": lambda x: x >= 3,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Scale up winners only.",
-            },
-        ]
-
-        drawdown_conditions = [
-            {
-                "expr": lambda x: x < -3000,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop Now. Maximum drawdown.",
-            },
-            {
-                "expr": lambda x: x < -2000,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Large drawdown.",
-            },
-            {
-                "expr": lambda x: x < -1000,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Notable drawdown.",
-            },
-        ]
-
-        winrate_color, _, _, _ = self.evaluate_conditions(win_rate, winrate_conditions)
-        overtrade_color, _, _, _ = self.evaluate_conditions(
-            completed_trades, trade_conditions
+    def _publish_account_stats(self, account_name: str, stats: TradeStatsAccumulator, now=None):
+        """
+        Stores the display rows, alerts, trade groups and equity curve for `stats`.
+
+        The trailing windows ("Last 60m", `trades_last_15m`, ...) are aged
+        against the clock first, so they empty while the trader is idle;
+        replays (`get_stats`, the backtester) keep them anchored at the last exit.
+        """
+        stats.rolling_metrics.evict(datetime.now() if now is None else now)
+        self.account_trading_stats[account_name] = self.build_trading_stats(stats)
+        self.account_trade_groups[account_name] = stats.trade_groups
+        # the curve grows with the accumulator: only trades closed since the last publish are appended
+        curve = self.account_equity_curves.get(account_name)
+        if curve is None:
+            curve = self.account_equity_curves[account_name] = EquityCurve()
+        for trade_group in stats.trade_groups[len(curve) :]:
+            curve.append(trade_group.exit_time, trade_group.trade_amount)
+        self.latency.record_stats(account_name)
+        alerts = self._build_alert_messages(
+            account_name, self._evaluate_alerts(stats.alert_context())
         )
-        pnl_color, _, _, _ = self.evaluate_conditions(
-            total_profit_or_loss, pnl_conditions
-        )
-        profitfactor_color, _, _, _ = self.evaluate_conditions(
-            profit_factor, profitfactor_conditions
-        )
-        losing_streak_color, _, _, _ = self.evaluate_conditions(
-            streak_tracker.streak, losingstreak_conditions
-        )
-        loss_max_size_color, _, _, _ = self.evaluate_conditions(
-            loss_max_size, loss_max_size_conditions
-        )
-        loss_scaled_count_color, _, _, _ = self.evaluate_conditions(
-            loss_scaled_count, loss_scaled_count_conditions
-        )
-        drawdown_color, _, _, _ = self.evaluate_conditions(
-            current_drawdown, drawdown_conditions
+        self.account_trading_alerts[account_name] = alerts
+        self.latency.record_evaluated(account_name, bool(alerts))
+
+    def stats_row_count(self) -> int:
+        """Rows `build_trading_stats` returns (spacers included) with the extra metrics shown."""
+        return len(self.build_trading_stats(TradeStatsAccumulator(self.config)))
+
+    def build_trading_stats(self, stats: TradeStatsAccumulator):
+        """Formats the display rows (and their colors) for an account's accumulated stats."""
+        streak_tracker = stats.streak_tracker
+
+        completed_trades = stats.completed_trades
+        total_profit_or_loss = stats.total_profit_or_loss
+        position_size = stats.position_size
+        entry_time = stats.entry_time
+        win_rate = stats.win_rate
+        long_win_rate = stats.side_win_rate(True)
+        short_win_rate = stats.side_win_rate(False)
+        profit_factor = stats.profit_factor
+        long_profit_factor = stats.side_profit_factor(True)
+        short_profit_factor = stats.side_profit_factor(False)
+        total_gains = stats.total_gains
+        total_losses = stats.total_losses
+
+        loss_avg_secs = stats.loss_avg_duration
+        loss_max_secs = stats.loss_duration_max
+        win_avg_secs = stats.win_avg_duration
+        win_max_secs = stats.win_duration_max
+        time_between_trades_avg_secs = stats.between_trades_avg
+        time_between_trades_max_secs = stats.between_trades_max
+        current_drawdown = stats.current_drawdown
+        max_realized_profit = stats.max_realized_profit
+        max_realized_drawdown = stats.max_realized_drawdown
+        max_realized_profit_time = stats.max_realized_profit_time
+        max_realized_drawdown_time = stats.max_realized_drawdown_time
+
+        avg_gain = stats.avg_gain
+        avg_loss = stats.avg_loss
+        win_max_value = stats.win_max_value
+        loss_max_value = stats.loss_max_value
+        loss_max_points = stats.loss_max_points
+        win_max_points = stats.win_max_points
+        loss_avg_points = stats.loss_avg_points
+        win_avg_points = stats.win_avg_points
+        total_points = stats.total_points
+        loss_max_size = stats.loss_max_size
+        win_max_size = stats.win_max_size
+        loss_scaled_count = stats.loss_scaled_count
+        win_scaled_count = stats.win_scaled_count
+        total_buys = stats.total_buys
+        total_sells = stats.total_sells
+        total_buy_contracts = stats.total_buy_contracts
+        total_sell_contracts = stats.total_sell_contracts
+        first_entry_time = stats.first_entry_time
+        last_exit_time = stats.last_exit_time
+        directional_bias = stats.directional_bias()
+        slippage = stats.slippage
+
+        # color rules see every alert context field plus a few display-only stats
+        color_context = stats.alert_context()
+        color_context.update(
+            {
+                "streak": streak_tracker.streak,
+                "win_scaled_count": win_scaled_count,
+                "total_points": total_points,
+                "between_trades_avg_secs": time_between_trades_avg_secs.total_seconds(),
+                "win_avg_secs": win_avg_secs.total_seconds(),
+                "loss_avg_secs": loss_avg_secs.total_seconds(),
+                "win_max_secs": win_max_secs.total_seconds(),
+                "loss_max_secs": loss_max_secs.total_seconds(),
+            }
         )
-
-        open_size_color = (
-            ConcernLevel.CAUTION if abs(position_size) >= 3 else ConcernLevel.DEFAULT
-        ).get_color()
-        avg_duration_color = (
-            ConcernLevel.WARNING
-            if win_avg_secs < loss_avg_secs
-            else ConcernLevel.DEFAULT
-        ).get_color()
-        max_duration_color = (
-            ConcernLevel.WARNING
-            if win_max_secs < loss_max_secs
-            else ConcernLevel.DEFAULT
-        ).get_color()
-        intertrade_time_avg_color = (
-            ConcernLevel.WARNING
-            if time_between_trades_avg_secs < timedelta(seconds=60)
-            else ConcernLevel.DEFAULT
-        ).get_color()
-        win_scaled_count_color = (
-            ConcernLevel.OK if win_scaled_count >= 2 else ConcernLevel.DEFAULT
-        ).get_color()
-        total_points_color = (
-            ConcernLevel.OK if total_points > 0 else ConcernLevel.WARNING
-        ).get_color()
+        colors = self._get_color_rules().colors(color_context)
+        overtrade_color = colors["completed_trades"]
+        pnl_color = colors["total_profit_or_loss"]
+        winrate_color = colors["win_rate"]
+        profitfactor_color = colors["profit_factor"]
+        losing_streak_color = colors["streak"]
+        loss_max_size_color = colors["loss_max_size"]
+        loss_scaled_count_color = colors["loss_scaled_count"]
+        drawdown_color = colors["current_drawdown"]
+        open_size_color = colors["open_position_size"]
+        total_points_color = colors["total_points"]
+        win_scaled_count_color = colors["win_scaled_count"]
+        intertrade_time_avg_color = colors["between_trades_avg_secs"]
+        avg_duration_color = colors["win_avg_secs"]
+        max_duration_color = colors["win_max_secs"]
 
         open_entry_time_i = (
             entry_time.strftime(CONST.DAY_TIME_FORMAT) if position_size != 0 else ""
@@ -629,6 +540,8 @@ class TradeStatsProcessor:
             else "N/A"
         )
 
+        last_hour = stats.rolling_metrics.get_window(60)
+
         trading_stats = [
             {MetricNames.TRADES: [f"{completed_trades}", overtrade_color]},
             {"Bias": [f"{directional_bias}"]},
@@ -674,6 +587,11 @@ class TradeStatsProcessor:
                     f"{int(max_realized_profit):+,} / {int(max_realized_drawdown):+,}"
                 ]
             },
+            {
+                MetricNames.LAST_60_MINS: [
+                    f"{last_hour.trade_count} / {last_hour.win_rate:.0f}% / {int(last_hour.profit_or_loss):+,}"
+                ]
+            },
             {MetricNames.PEAK_TIME_PNL: [f"{peak_profit_time} | {peak_drawdown_time}"]},
             {MetricNames.AVG_GAIN_LOSS: [f"{int(avg_gain):+,} / {int(avg_loss):+,}"]},
             {MetricNames.MAX_TRADE_PL: [f"{int(win_max_value):+,} / {int(loss_max_value):+,}"]},
@@ -687,6 +605,16 @@ class TradeStatsProcessor:
                     f"{int(win_max_points):+,} / {int(loss_max_points):+,}"
                 ]
             },
+            {
+                MetricNames.STOP_SLIPPAGE: [
+                    f"{slippage.points:+.2f} pts / {int(slippage.dollars):+,}"
+                ]
+            },
+            {
+                MetricNames.STOP_SLIPPAGE_DETAIL: [
+                    f"{slippage.stop_fills} / {slippage.avg_points:+.2f} / {slippage.max_points:+.2f}"
+                ]
+            },
             {"": [""]},
             {
                 MetricNames.SCALED_LOSSES: [
@@ -701,7 +629,7 @@ class TradeStatsProcessor:
                 ]
             },
             {"": [""]},
-            {"Open Size": [f"{int(position_size)}", open_size_color]},
+            {"Open Size": [f"{position_size:g}", open_size_color]},
             {MetricNames.OPEN_DURATION: [f"{open_entry_duration_str}"]},
             {MetricNames.OPEN_ENTRY: [f"{open_entry_time_i}"]},
             {
@@ -759,94 +687,79 @@ class TradeStatsProcessor:
             },
         ]
 
-        win_avg_secs_seconds = win_avg_secs.total_seconds()
-        loss_avg_secs_seconds = loss_avg_secs.total_seconds()
-        duration_ratio = (
-            win_avg_secs_seconds / loss_avg_secs_seconds
-            if loss_avg_secs_seconds > 0
-            else float("inf")
-        )
-
-        alert_context = {
-            "completed_trades": completed_trades,
-            "total_profit_or_loss": total_profit_or_loss,
-            "profit_factor": profit_factor,
-            "win_rate": win_rate,
-            "directional_bias": directional_bias,
-            "directional_bias_extramsg": directional_bias_extramsg,
-            "streak_tracker": streak_tracker,
-            "streak_tracker.streak": streak_tracker.streak,
-            "loss_max_size": loss_max_size,
-            "loss_scaled_count": loss_scaled_count,
-            "current_drawdown": current_drawdown,
-            "open_position_size": abs(total_buy_contracts - total_sell_contracts),
-            "win_avg_secs_seconds": win_avg_secs_seconds,
-            "loss_avg_secs_seconds": loss_avg_secs_seconds,
-            "win_avg_secs_vs_loss_avg_secs": duration_ratio,
-        }
-
-        return trading_stats, alert_context, trade_groups
+        return trading_stats
 
-    def compute_all_account_stats(self, fill_data):
+    def compute_all_account_stats(self, fill_data, batch: bool = False):
         # for analysis only so we don't need alerts
         # although some metrics are additive/derivable from collection of individual account stats
         # there are some that are not (e.g. streak) - although they can be handled, choosing to simply for now
         # and just recompute for unfiltered fill data
         if fill_data:
-            trading_stats, alert_context, trade_groups = self.get_stats(fill_data)
-            self.account_trading_stats[CONST.ALL_ACCOUNTS] = trading_stats
-            self.account_trade_groups[CONST.ALL_ACCOUNTS] = trade_groups
-            self.account_trading_alerts[CONST.ALL_ACCOUNTS] = (
-                self._build_alert_messages(
-                    CONST.ALL_ACCOUNTS, self._evaluate_alerts(alert_context)
-                )
-            )
+            stats = self.accumulate_batch(fill_data) if batch else self.accumulate(fill_data)
+            self.account_accumulators[CONST.ALL_ACCOUNTS] = stats
+            self._publish_account_stats(CONST.ALL_ACCOUNTS, stats)
 
     def _evaluate_alerts(self, context: dict):
         if self.alert_config_manager:
             try:
-                config = self.alert_config_manager.get_active_config()
-                evaluator = ConditionEvaluator(config)
-                template_context = self._build_template_context(context)
-                formatted_results = []
-                for match in evaluator.evaluate(context):
-                    formatted_results.append(
-                        {
-                            **match,
-                            "message": self._format_template(
-                                match.get("message", ""), template_context
-                            ),
-                            "extra_message": self._format_template(
-                                match.get("extra_message", ""), template_context
-                            ),
-                        }
-                    )
-                return formatted_results
+                return self._format_matches(self._get_condition_evaluator(), context)
             except Exception as exc:
                 LOGGER.warning("Custom alert evaluation failed: %s", exc)
         return self._legacy_alerts(context)
 
-    def _build_template_context(self, context: dict) -> dict:
-        safe_context = {}
-        for key, value in context.items():
-            if isinstance(value, (int, float, str)):
-                safe_context[key] = value
-        return safe_context
-
-    def _format_template(self, template: str, context: dict) -> str:
-        if not template:
-            return template
-
-        class SafeDict(dict):
-            def __missing__(self, key):
-                return "{" + key + "}"
+    def _format_matches(self, evaluator: ConditionEvaluator, context: dict) -> list:
+        """Evaluates `context`, rendering message templates only for the conditions that matched."""
+        return [
+            {
+                **match,
+                "message": format_template(match.get("message", ""), context),
+                "extra_message": format_template(match.get("extra_message", ""), context),
+            }
+            for match in evaluator.evaluate(context)
+        ]
 
-        safe_map = SafeDict(context)
-        try:
-            return template.format_map(safe_map)
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.warning("Failed to format template '%s': %s", template, exc)
-            return template
+    def reload_alert_profile(self) -> bool:
+        """
+        Hot-reloads the alert profile if its file (or active_config.json) changed.
+
+        Cheap enough to call on every refresh: the manager stats files at most
+        once per its reload interval.
+
+        Returns:
+            True if a new profile version was swapped in and alerts should be re-evaluated.
+        """
+        manager = self.alert_config_manager
+        if not manager or not manager.check_for_changes():
+            return False
+        self._update_alert_profile_status(manager, manager.current_config)
+        return True
+
+    def _get_condition_evaluator(self) -> ConditionEvaluator:
+        """
+        Returns the compiled evaluator for the active profile, rebuilding it only
+        after the manager swapped in a new profile version or a session override changed.
+        """
+        manager = self.alert_config_manager
+        version, evaluator = self._compiled_alerts
+        if evaluator is None or version != manager.active_config_version:
+            evaluator = ConditionEvaluator(manager.get_active_config())
+            self._compiled_alerts = (manager.active_config_version, evaluator)
+        return evaluator
+
+    def _get_color_rules(self) -> ColorRules:
+        """
+        Returns the label color rules of the active profile (built-in rules for
+        metrics it does not list, or without a JSON profile), compiled once per
+        profile version.
+        """
+        manager = self.alert_config_manager
+        version = manager.config_version if manager else None
+        compiled_version, color_rules = self._compiled_colors
+        if color_rules is None or compiled_version != version:
+            profile = (manager.current_config if manager else None) or {}
+            color_rules = ColorRules(profile.get("color_rules", []))
+            self._compiled_colors = (version, color_rules)
+        return color_rules
 
     def _build_alert_messages(self, account_name: str, matches) -> list:
         alerts = []
@@ -856,14 +769,17 @@ class TradeStatsProcessor:
             extra = match.get("extra_message", "")
             if not message:
                 continue
+            # a condition's own throttle_secs wins over the per-level default interval
+            throttle_secs = match.get("throttle_secs") or 0
             alerts.append(
                 AlertMessage(
                     message,
                     account_name,
                     self.config.get_alert_duration(level),
-                    self.config.get_min_interval_secs(level),
+                    throttle_secs if throttle_secs > 0 else self.config.get_min_interval_secs(level),
                     level,
                     extra,
+                    match.get("id") or "",
                 )
             )
         return sorted(alerts, key=lambda alert: alert.level, reverse=True)
@@ -872,232 +788,16 @@ class TradeStatsProcessor:
         return self.alert_profile_status
 
     def _legacy_alerts(self, context: dict):
-        completed_trades = context.get("completed_trades", 0)
-        total_profit_or_loss = context.get("total_profit_or_loss", 0)
-        profit_factor = context.get("profit_factor", 1)
-        win_rate = context.get("win_rate", 0)
-        loss_scaled_count = context.get("loss_scaled_count", 0)
-        loss_max_size = context.get("loss_max_size", 0)
-        current_drawdown = context.get("current_drawdown", 0)
-        directional_bias_extramsg = context.get("directional_bias_extramsg", "")
-        streak_tracker = context.get("streak_tracker")
-
-        alert_extramsg_default = ""
-
-        trade_conditions = [
-            {
-                "expr": lambda x: x >= 30,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop. Maximum trades for the day reached.",
-                "extra_msg": f"{completed_trades}",
-            },
-            {
-                "expr": lambda x: x >= 20 and total_profit_or_loss > 0,
-                "level": ConcernLevel.OK,
-                "msg": "Wind down. You've reached your trade count goal.",
-                "extra_msg": f"{completed_trades}",
-            },
-            {
-                "expr": lambda x: x >= 20,
-                "level": ConcernLevel.WARNING,
-                "msg": "Wind down. You've reached your trade count goal.",
-                "extra_msg": f"{completed_trades}",
-            },
-            {
-                "expr": lambda x: x >= 10,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Take quality trades only.",
-                "extra_msg": f"{completed_trades}",
-            },
-        ]
-
-        pnl_conditions = [
-            {
-                "expr": lambda x: x < -2100,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop. Protect your capital.",
-                "extra_msg": f"{int(total_profit_or_loss):+,}",
-            },
-            {
-                "expr": lambda x: x < -1400,
-                "level": ConcernLevel.WARNING,
-                "msg": "Pause. Reset first, then recover.",
-                "extra_msg": f"{int(total_profit_or_loss):+,}",
-            },
-            {
-                "expr": lambda x: x < -700,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Manage loss by managing risk.",
-                "extra_msg": f"{int(total_profit_or_loss):+,}",
-            },
-            {
-                "expr": lambda x: x >= 1000,
-                "level": ConcernLevel.OK,
-                "msg": "Wind down. Protect gains.",
-                "extra_msg": f"{int(total_profit_or_loss):+,}",
-            },
-        ]
-
-        winrate_conditions = [
-            {
-                "expr": lambda x: x <= 25
-                and profit_factor < 1.0
-                and completed_trades >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Win Rate very low.",
-                "extra_msg": f"{directional_bias_extramsg}",
-            },
-            {
-                "expr": lambda x: x <= 40
-                and profit_factor < 1.5
-                and completed_trades >= 5,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Win Rate low.",
-                "extra_msg": f"{directional_bias_extramsg}",
-            },
-        ]
-
-        profitfactor_conditions = [
-            {
-                "expr": lambda x: x < 1.0 and completed_trades >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Profit Factor very low.",
-                "extra_msg": f"{directional_bias_extramsg}",
-            },
-            {
-                "expr": lambda x: x < 1.5 and completed_trades >= 5,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Profit Factor low.",
-                "extra_msg": f"{directional_bias_extramsg}",
-            },
-            {"expr": lambda x: x >= 1.5, "level": ConcernLevel.OK, "msg": ""},
-        ]
-
-        losingstreak_conditions = [
-            {
-                "expr": lambda x: x <= -7,
-                "level": ConcernLevel.CRITICAL,
-                "msg": f"Stop Now. Protect the version of YOU that will trade well tomorrow.",
-            },
-            {
-                "expr": lambda x: x <= -4,
-                "level": ConcernLevel.WARNING,
-                "msg": f"Stop. Follow Reset plan.",
-            },
-            {
-                "expr": lambda x: x <= -2,
-                "level": ConcernLevel.CAUTION,
-                "msg": f"Slow down. Consecutive losses. {streak_tracker.get_extra_msg() if streak_tracker else ''}",
-            },
-        ]
-
-        loss_max_size_conditions = [
-            {
-                "expr": lambda x: x >= 10,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Size down.",
-            },
-            {
-                "expr": lambda x: x >= 6,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Size down.",
-            },
-            {
-                "expr": lambda x: x >= 4
-                and profit_factor < 1.0
-                and completed_trades >= 3,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Size down.",
-            },
-        ]
-
-        loss_scaled_count_conditions = [
-            {
-                "expr": lambda x: x >= 5,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Scale up winners only.",
-            },
-            {
-                "expr": lambda x: x >= 3,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Scale up winners only.",
-            },
-        ]
-
-        drawdown_conditions = [
-            {
-                "expr": lambda x: x < -3000,
-                "level": ConcernLevel.CRITICAL,
-                "msg": "Stop Now. Maximum drawdown.",
-                "extra_msg": f"{current_drawdown:+,}",
-            },
-            {
-                "expr": lambda x: x < -2000,
-                "level": ConcernLevel.WARNING,
-                "msg": "Reset. Large drawdown.",
-                "extra_msg": f"{current_drawdown:+,}",
-            },
-            {
-                "expr": lambda x: x < -1000,
-                "level": ConcernLevel.CAUTION,
-                "msg": "Slow down. Notable drawdown.",
-                "extra_msg": f"{current_drawdown:+,}",
-            },
-        ]
-
-        _, winrate_msg, winrate_level, winrate_extramsg = self.evaluate_conditions(
-            win_rate, winrate_conditions
-        )
-        _, overtrade_msg, overtrade_level, overtrade_extramsg = (
-            self.evaluate_conditions(completed_trades, trade_conditions)
-        )
-        _, pnl_msg, pnl_level, pnl_extramsg = self.evaluate_conditions(
-            total_profit_or_loss, pnl_conditions
-        )
-        _, profitfactor_msg, profitfactor_level, profitfactor_extramsg = (
-            self.evaluate_conditions(profit_factor, profitfactor_conditions)
-        )
-        _, losing_streak_msg, losingstreak_level, _ = self.evaluate_conditions(
-            streak_tracker.streak if streak_tracker else 0, losingstreak_conditions
-        )
-        _, loss_max_size_msg, loss_max_size_level, loss_max_size_extramsg = (
-            self.evaluate_conditions(loss_max_size, loss_max_size_conditions)
-        )
-        _, loss_scaled_count_msg, loss_scaled_count_level, _ = self.evaluate_conditions(
-            loss_scaled_count, loss_scaled_count_conditions
+        """Alerts from the built-in profile (legacy_alert_profile), for when no JSON profile is usable."""
+        return self._format_matches(legacy_evaluator(), with_legacy_defaults(context))
+
+    def has_open_position(self) -> bool:
+        """True if any account has a trade still open (ALL Accounts aggregates the same fills)."""
+        return any(
+            stats.open_trades
+            for account_name, stats in self.account_accumulators.items()
+            if account_name != CONST.ALL_ACCOUNTS
         )
-        _, drawdown_msg, drawdown_critical, drawdown_extramsg = (
-            self.evaluate_conditions(current_drawdown, drawdown_conditions)
-        )
-
-        alerts = [
-            (losing_streak_msg, losingstreak_level, alert_extramsg_default),
-            (drawdown_msg, drawdown_critical, drawdown_extramsg),
-            (pnl_msg, pnl_level, pnl_extramsg),
-            (overtrade_msg, overtrade_level, overtrade_extramsg),
-            (winrate_msg, winrate_level, winrate_extramsg),
-            (profitfactor_msg, profitfactor_level, profitfactor_extramsg),
-            (loss_max_size_msg, loss_max_size_level, loss_max_size_extramsg),
-            (loss_scaled_count_msg, loss_scaled_count_level, alert_extramsg_default),
-        ]
-
-        return [
-            {"message": msg, "level": level, "extra_message": extra}
-            for msg, level, extra in alerts
-            if msg
-        ]
-
-    def evaluate_conditions(self, value, conditions):
-        for cond in conditions:
-            if isinstance(cond, dict):
-                if cond["expr"](value):
-                    return (
-                        cond["level"].get_color(),
-                        cond["msg"],
-                        cond["level"],
-                        cond.get("extra_msg", ""),
-                    )
-        return ConcernLevel.DEFAULT.get_color(), "", ConcernLevel.DEFAULT, ""
 
     def get_total_trades_across_all(self):
         total_trade_count = 0
@@ -1107,30 +807,6 @@ class TradeStatsProcessor:
                     total_trade_count += int(item[MetricNames.TRADES][0])
         return total_trade_count
 
-    def calculate_max_quantity(self, trades_dict: defaultdict) -> float:
-        all_trades = []
-        for trade_list in trades_dict.values():
-            all_trades.extend(trade_list)
-
-        all_trades.sort(key=lambda trade: trade.order_id)
-
-        current_quantity = 0.0
-        max_quantity = 0.0
-        min_quantity = 0.0
-
-        for trade in all_trades:
-            if trade.order_type == "Filled BUY":
-                current_quantity += trade.quantity
-            elif trade.order_type == "Filled SELL":
-                current_quantity -= trade.quantity
-            else:
-                continue
-
-            max_quantity = max(max_quantity, current_quantity)
-            min_quantity = min(min_quantity, current_quantity)
-
-        return max(abs(max_quantity), abs(min_quantity))
-
     def print_streak_followtrade_statistics(self, list_name: str, data: list):
         print(f"--- {list_name} ---")
         sum_by_first_element = defaultdict(int)